@@ -0,0 +1,14 @@
+from typing import Final
+
+
+class AmbiguousSeparator:
+    """
+    How to parse numbers with a single separator before the last 3 digits, e.g. 100.000 or 100,000
+    """
+
+    THOUSANDS: Final = 'thousands'
+    """Both 100.000 and 100,000 are 100000"""
+    DECIMAL_DOT: Final = 'decimal_dot'
+    """100.000 is 100.0, 100,000 is 100000"""
+    DECIMAL_COMMA: Final = 'decimal_comma'
+    """100.000 is 100000, 100,000 is 100.0"""
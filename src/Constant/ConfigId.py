@@ -94,6 +94,18 @@ class ConfigId:
     # Config keys - configurable in user config file
     Debug: Final = ConfigParameter.newConfig(['debug'])
 
+    Clipboard_DebounceTime: Final = ConfigParameter.newConfig(['clipboard', 'debounce_time'])
+
+    Modal_OutOfProcess: Final = ConfigParameter.newConfig(['modal', 'out_of_process'])
+
+    Converter_AmbiguousSeparator: Final = ConfigParameter.newConfig(
+        ['converters', 'ambiguous_separator'],
+    )
+
+    Converter_Extraction_Enabled: Final = ConfigParameter.newConfig(
+        ['converters', 'extraction', 'enabled'],
+    )
+
     Converter_Currency_RatesUrl: Final = ConfigParameter.newConfig(
         ['converters', 'currency', 'rates_url'],
     )
@@ -0,0 +1,15 @@
+from typing import Final
+
+
+class InputShape:
+    """Shape of tokenized clipboard text, used to route it only to converters that accept it"""
+
+    PURE_DIGITS: Final = 'pure_digits'
+    """E.g. 1555522011"""
+    NUMBER_UNIT_SUFFIX: Final = 'number_unit_suffix'
+    """E.g. 5 ft"""
+    UNIT_PREFIX_NUMBER: Final = 'unit_prefix_number'
+    """E.g. $5"""
+    OTHER: Final = 'other'
+
+    ALL: Final = [PURE_DIGITS, NUMBER_UNIT_SUFFIX, UNIT_PREFIX_NUMBER, OTHER]
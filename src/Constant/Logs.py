@@ -8,10 +8,13 @@ class Logs:
     catConfig: Final[str] = '[Config] '
     catConvert: Final[str] = '[Convert] '
     catConverter: Final[str] = '[Convert.'
+    catEvents: Final[str] = '[Events] '
+    catHeadless: Final[str] = '[Headless] '
     catMenuApp: Final[str] = '[Menu app] '
     catModal: Final[str] = '[Modal] '
     catModalSub: Final[str] = '[Modal.'
     catRateUpdater: Final[str] = '[Rate updater] '
+    catScheduler: Final[str] = '[Scheduler] '
     catUpdateCheck: Final[str] = '[Update check] '
     catStart: Final[str] = '[Start] '
     catSettings: Final[str] = catModalSub + 'Settings] '
@@ -0,0 +1,25 @@
+from typing import Final
+
+
+class ModalHostMessage:
+    """
+    Message types between the app and the modal host process. Each message is a tuple of its type
+    and arguments
+    """
+
+    OPEN: Final[str] = 'open'
+    """App -> host: modal id, arguments. Buttons in arguments have callback ids instead of callbacks"""
+    CLOSED: Final[str] = 'closed'
+    """Host -> app: window was closed. Host process exits after it"""
+    CALLBACK: Final[str] = 'callback'
+    """Host -> app: callback id of the pressed button"""
+    CONFIG_GET: Final[str] = 'config_get'
+    """Host -> app: ConfigParameter. App replies with RESULT"""
+    CONFIG_SET: Final[str] = 'config_set'
+    """Host -> app: ConfigParameter, value"""
+    APP_VERSION: Final[str] = 'app_version'
+    """Host -> app. App replies with RESULT"""
+    CURRENCIES: Final[str] = 'currencies'
+    """Host -> app. App replies with RESULT, currency units definition"""
+    RESULT: Final[str] = 'result'
+    """App -> host: value of the last request"""
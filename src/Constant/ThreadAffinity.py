@@ -0,0 +1,12 @@
+from typing import Final
+
+
+class ThreadAffinity:
+    """In which thread an event subscriber is called"""
+
+    DISPATCHER: Final[str] = 'dispatcher'
+    """Synchronously, in the thread which dispatched the event"""
+    WORKER: Final[str] = 'worker'
+    """In the event worker thread, so the dispatching thread is not blocked"""
+    UI: Final[str] = 'ui'
+    """In the UI thread, through EventService.setUiExecutor. Same as DISPATCHER until it's set"""
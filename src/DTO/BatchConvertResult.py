@@ -0,0 +1,27 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy
+    from numpy.typing import NDArray
+
+
+class BatchConvertResult:
+    numbersTo: NDArray[numpy.float64]
+    """Converted numbers, not rounded. NaN where value was not converted"""
+    unitsTo: NDArray[numpy.object_]
+    """Pretty format of the target unit for each value. Empty string where value was not converted"""
+    converted: NDArray[numpy.bool_]
+    """False where value is out of the converter's range, same as tryConvert would return False"""
+    converterName: str
+
+    def __init__(
+        self,
+        numbersTo: NDArray[numpy.float64],
+        unitsTo: NDArray[numpy.object_],
+        converted: NDArray[numpy.bool_],
+        converterName: str,
+    ):
+        self.numbersTo = numbersTo
+        self.unitsTo = unitsTo
+        self.converted = converted
+        self.converterName = converterName
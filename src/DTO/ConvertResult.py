@@ -3,9 +3,19 @@ class ConvertResult:
     originalText: str
     convertedText: str
     converterName: str
+    otherResults: list[ConvertResult]
+    """Results of other quantities found in the same text, if it had more than one"""
 
-    def __init__(self, iconText: str, originalText: str, convertedText: str, converterName: str):
+    def __init__(
+        self,
+        iconText: str,
+        originalText: str,
+        convertedText: str,
+        converterName: str,
+        otherResults: list[ConvertResult] | None = None,
+    ):
         self.iconText = iconText
         self.originalText = originalText
         self.convertedText = convertedText
         self.converterName = converterName
+        self.otherResults = otherResults if otherResults is not None else []
@@ -1,3 +1,7 @@
+import time
+from collections.abc import Callable
+
+
 class Event(list):
     """Event subscription.
 
@@ -27,9 +31,36 @@ class Event(list):
     g(2)
     """
 
+    eventId: str = ''
+    recordDuration: Callable[[str, Callable | None, int], None] | None = None
+    """
+    Called with event id, subscriber (None for the whole call) and duration in nanoseconds.
+    None to not measure calls
+    """
+
     def __call__(self, *args, **kwargs):
+        if self.recordDuration is None:
+            for f in self:
+                f(*args, **kwargs)
+
+            return
+
+        self._callMeasured(self.recordDuration, args, kwargs)
+
+    def _callMeasured(
+        self, recordDuration: Callable[[str, Callable | None, int], None], args, kwargs
+    ) -> None:
+        start = time.perf_counter_ns()
+
         for f in self:
-            f(*args, **kwargs)
+            subscriberStart = time.perf_counter_ns()
+
+            try:
+                f(*args, **kwargs)
+            finally:
+                recordDuration(self.eventId, f, time.perf_counter_ns() - subscriberStart)
+
+        recordDuration(self.eventId, None, time.perf_counter_ns() - start)
 
     def __repr__(self):
         return f'Event({list.__repr__(self)})'
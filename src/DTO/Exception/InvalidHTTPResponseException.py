@@ -1,7 +1,10 @@
-from requests import Response
+from typing import TYPE_CHECKING
 
 from src.DTO.Exception.FormatableExceptionInterface import FormatableExceptionInterface
 
+if TYPE_CHECKING:
+    from requests import Response
+
 
 class InvalidHTTPResponseException(Exception, FormatableExceptionInterface):
     _response: Response
@@ -0,0 +1,24 @@
+from collections.abc import Callable
+
+
+class ScheduledJob:
+    callback: Callable[[], None]
+    deadline: float
+    """time.time() when the job should run next"""
+    interval: float | None
+    """Seconds between runs of a periodic job. None for one-shot job"""
+    sequence: int
+    """Orders jobs with the same deadline by scheduling order"""
+    cancelled: bool
+
+    def __init__(
+        self, callback: Callable[[], None], deadline: float, interval: float | None, sequence: int
+    ):
+        self.callback = callback
+        self.deadline = deadline
+        self.interval = interval
+        self.sequence = sequence
+        self.cancelled = False
+
+    def __lt__(self, other: ScheduledJob) -> bool:
+        return (self.deadline, self.sequence) < (other.deadline, other.sequence)
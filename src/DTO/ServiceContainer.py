@@ -1,22 +1,70 @@
-from typing import TypeVar
+import threading
+from collections.abc import Callable
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from src.Service.StartupProfiler import StartupProfiler
 
 
 class ServiceContainer:
     T = TypeVar('T')
 
     _services: dict[type, object]
+    _factories: dict[type, Callable[[], object]]
+    _building: set[type]
+    """Services whose factories are running, to detect circular dependencies"""
+    _lock: threading.RLock
+    """Reentrant, as factories get their dependencies from the container"""
+    _profiler: StartupProfiler | None
 
-    def __init__(self):
+    def __init__(self, profiler: StartupProfiler | None = None):
         self._services = {}
+        self._factories = {}
+        self._building = set()
+        self._lock = threading.RLock()
+        self._profiler = profiler
 
     def __getitem__(self, key: type[T]) -> T:
-        if key not in self._services:
-            raise Exception(f'Service with id "{key}" not found in the container')
+        with self._lock:
+            if key not in self._services:
+                if key not in self._factories:
+                    raise Exception(f'Service with id "{key}" not found in the container')
+
+                if key in self._building:
+                    raise Exception(f'Service with id "{key}" depends on itself')
+
+                # Factory is removed only after the service is built, so a failed build can be retried
+                self._building.add(key)
 
-        return self._services[key]  # type: ignore[return-value]
+                try:
+                    self._services[key] = self._build(key, self._factories[key])
+                finally:
+                    self._building.discard(key)
+
+                del self._factories[key]
+
+            return self._services[key]  # type: ignore[return-value]
 
     def __setitem__(self, key: type[T], service: T) -> None:
-        if key in self._services:
-            raise Exception(f'Service with id "{key}" already exists in the container')
+        with self._lock:
+            self._checkNotExists(key)
+            self._services[key] = service
 
-        self._services[key] = service
+    def setFactory(self, key: type[T], factory: Callable[[], T]) -> None:
+        """
+        Add a service which is built only on the first access
+        """
+
+        with self._lock:
+            self._checkNotExists(key)
+            self._factories[key] = factory
+
+    def _build(self, key: type, factory: Callable[[], object]) -> object:
+        if self._profiler is None:
+            return factory()
+
+        return self._profiler.measureService(getattr(key, '__name__', str(key)), factory)
+
+    def _checkNotExists(self, key: type) -> None:
+        if key in self._services or key in self._factories:
+            raise Exception(f'Service with id "{key}" already exists in the container')
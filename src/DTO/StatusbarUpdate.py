@@ -0,0 +1,11 @@
+from src.DTO.ConvertResult import ConvertResult
+
+
+class StatusbarUpdate:
+    iconText: str
+    result: ConvertResult | None
+    """Conversion to show in the menu. None to leave the menu unchanged"""
+
+    def __init__(self, iconText: str, result: ConvertResult | None):
+        self.iconText = iconText
+        self.result = result
@@ -0,0 +1,19 @@
+from src.DTO.ConvertResult import ConvertResult
+from src.DTO.Timestamp import Timestamp
+
+
+class TimestampConvertResult(ConvertResult):
+    timestamp: Timestamp
+    """Parsed timestamp, to re-render texts with up-to-date relative time"""
+
+    def __init__(
+        self,
+        iconText: str,
+        originalText: str,
+        convertedText: str,
+        converterName: str,
+        timestamp: Timestamp,
+    ):
+        super().__init__(iconText, originalText, convertedText, converterName)
+
+        self.timestamp = timestamp
@@ -0,0 +1,67 @@
+from src.Constant.InputShape import InputShape
+
+
+class TokenizedText:
+    """
+    Clipboard text tokenized once by TextLexer and shared by all converters
+    """
+
+    shape: str
+    """One of InputShape constants"""
+    text: str
+    """Original text, with whitespace trimmed around start and end"""
+    compact: str
+    """Text with all whitespace removed and lowercased"""
+    isDigitsOnly: bool
+    """Original text consists only of digits"""
+
+    unitBefore: str | None
+    number: str | None
+    """Number with sign and separators, as found in the compact text"""
+    unitAfter: str | None
+
+    isNegative: bool
+    digitCount: int
+    hasSeparators: bool
+    """Number contains a thousands or decimal separator (, or .)"""
+
+    def __init__(
+        self,
+        text: str,
+        compact: str,
+        isDigitsOnly: bool,
+        unitBefore: str | None = None,
+        number: str | None = None,
+        unitAfter: str | None = None,
+        isNegative: bool = False,
+        digitCount: int = 0,
+        hasSeparators: bool = False,
+    ):
+        self.text = text
+        self.compact = compact
+        self.isDigitsOnly = isDigitsOnly
+        self.unitBefore = unitBefore
+        self.number = number
+        self.unitAfter = unitAfter
+        self.isNegative = isNegative
+        self.digitCount = digitCount
+        self.hasSeparators = hasSeparators
+        self.shape = self._detectShape()
+
+    def hasNumber(self) -> bool:
+        return self.number is not None
+
+    def _detectShape(self) -> str:
+        if self.isDigitsOnly:
+            return InputShape.PURE_DIGITS
+
+        if self.number is None:
+            return InputShape.OTHER
+
+        if self.unitBefore is None and self.unitAfter is not None:
+            return InputShape.NUMBER_UNIT_SUFFIX
+
+        if self.unitBefore is not None and self.unitAfter is None:
+            return InputShape.UNIT_PREFIX_NUMBER
+
+        return InputShape.OTHER
@@ -0,0 +1,57 @@
+from typing import Final
+
+from src.Service.PollableClipboardInterface import PollableClipboardInterface
+from src.Service.Scheduler import Scheduler
+
+
+class AdaptiveClipboardPoller:
+    """
+    Polls clipboard with an interval, which grows exponentially while clipboard does not change,
+    and goes back to the fastest one right after a change. So an idle app rarely wakes up, while
+    changes during active use are still noticed quickly
+    """
+
+    _MIN_INTERVAL: Final[float] = 0.33
+    _MAX_INTERVAL: Final[float] = 1.5
+    """Also the longest delay, until the first change after a long idle time is noticed"""
+    _BACKOFF_FACTOR: Final[float] = 1.5
+
+    _scheduler: Scheduler
+    _clipboard: PollableClipboardInterface
+
+    _interval: float
+    _changeCount: int | None
+
+    def __init__(self, scheduler: Scheduler, clipboard: PollableClipboardInterface):
+        self._scheduler = scheduler
+        self._clipboard = clipboard
+
+        self._interval = self._MIN_INTERVAL
+        self._changeCount = None
+
+    def start(self) -> None:
+        self._scheduler.scheduleOnce(0, self._pollAndReschedule)
+
+    def getInterval(self) -> float:
+        """
+        :return: seconds until the next poll
+        """
+
+        return self._interval
+
+    def poll(self) -> None:
+        self._clipboard.pollClipboard()
+        changeCount = self._clipboard.getChangeCount()
+
+        if changeCount != self._changeCount:
+            self._changeCount = changeCount
+            self._interval = self._MIN_INTERVAL
+        else:
+            self._interval = min(self._interval * self._BACKOFF_FACTOR, self._MAX_INTERVAL)
+
+    def _pollAndReschedule(self) -> None:
+        try:
+            self.poll()
+        finally:
+            # Polling must go on, even if one poll failed
+            self._scheduler.scheduleOnce(self._interval, self._pollAndReschedule)
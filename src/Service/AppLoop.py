@@ -1,21 +1,21 @@
 import threading
 from abc import ABC, abstractmethod
-from typing import Final
 
-from src.Service.EventService import EventService
+from src.Service.Scheduler import Scheduler
 
 
 class AppLoop(ABC):
-    _SLOW_LOOP_INTERVAL: Final = 10
+    _scheduler: Scheduler
 
-    _events: EventService
-
-    def __init__(self, events: EventService):
-        self._events = events
+    def __init__(self, scheduler: Scheduler):
+        self._scheduler = scheduler
 
     def startLoop(self) -> None:
-        threading.Thread(target=self._processIteration, daemon=True).start()
+        self._scheduleJobs()
+        threading.Thread(target=self._scheduler.run, daemon=True).start()
 
     @abstractmethod
-    def _processIteration(self) -> None:
+    def _scheduleJobs(self) -> None:
+        """Schedules platform specific jobs. Other services schedule their jobs themselves"""
+
         pass
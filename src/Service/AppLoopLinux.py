@@ -1,10 +1,7 @@
-import time
-
 from src.Service.AppLoop import AppLoop
 
 
 class AppLoopLinux(AppLoop):
-    def _processIteration(self) -> None:
-        while True:
-            self._events.dispatchAppLoopIteration()
-            time.sleep(self._SLOW_LOOP_INTERVAL)
+    def _scheduleJobs(self) -> None:
+        # Clipboard is watched in its own thread, so there are no Linux specific jobs
+        pass
@@ -39,6 +39,35 @@ class ArgumentParser:
         so instead we sleep inside the app
         """
 
+        argsCreator.addOptionBool(
+            '--profile-startup',
+            'Log import and construction time of each service and peak memory usage, when the app '
+            'has started',
+        )
+
+        argsCreator.addOptionBool(
+            ['--stdin', '--batch'],
+            'Headless mode: convert each line from stdin and print results to stdout as JSON lines. '
+            'Statusbar, clipboard watch and GUI are not started',
+            'stdin',
+        )
+
+        argsCreator.addOptionString(
+            '--convert-file',
+            'Headless mode: convert each line of the given file in multiple processes and print '
+            'results as JSON lines, same as --stdin',
+        )
+
+        argsCreator.addOptionString(
+            '--output',
+            'Used with --stdin or --convert-file. Path to write results to, instead of stdout',
+        )
+
+        argsCreator.addOptionInt(
+            '--workers',
+            'Used with --convert-file. Number of worker processes, defaults to CPU cores count',
+        )
+
         self._arguments = parser.parse_args()
 
     def isDebugEnabled(self) -> bool:
@@ -55,3 +84,18 @@ class ArgumentParser:
 
     def getSleep(self) -> int | None:
         return self._arguments.sleep
+
+    def isProfileStartupEnabled(self) -> bool:
+        return self._arguments.profile_startup
+
+    def isHeadless(self) -> bool:
+        return self._arguments.stdin
+
+    def getConvertFile(self) -> str | None:
+        return self._arguments.convert_file
+
+    def getOutput(self) -> str | None:
+        return self._arguments.output
+
+    def getWorkers(self) -> int | None:
+        return self._arguments.workers
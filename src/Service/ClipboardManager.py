@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import Final
 
+from src.Constant.ConfigId import ConfigId
 from src.Constant.Logs import Logs
+from src.Service.ClipboardWriter import ClipboardWriter
+from src.Service.Configuration import Configuration
 from src.Service.EventService import EventService
 from src.Service.Logger import Logger
 
@@ -9,13 +13,44 @@ from src.Service.Logger import Logger
 class ClipboardManager(ABC):
     _MAX_CONTENT_LENGTH: Final[int] = 100
     _MAX_CONTENT_LENGTH_TRIMMED: Final[int] = 25
+    _MAX_CONTENT_LENGTH_EXTRACTION: Final[int] = 10000
+    """Limit for both untrimmed and trimmed text, when quantities extraction is enabled"""
 
     _events: EventService
     _logger: Logger
+    _writer: ClipboardWriter
 
-    def __init__(self, events: EventService, logger: Logger):
+    _maxContentLength: int
+    _maxContentLengthTrimmed: int
+    _debounceTime: float
+    """Seconds, for which content must stay unchanged before it's processed"""
+
+    _lastContentHash: int | None
+    """Hash of the last processed content, to skip processing the same content again"""
+    _droppedChanges: int
+    """Changes not processed since the last processed one, because of debounce or same content"""
+
+    def __init__(self, events: EventService, config: Configuration, logger: Logger):
         self._events = events
         self._logger = logger
+        self._writer = ClipboardWriter(self._writeClipboardContent, logger)
+        self._debounceTime = config.get(ConfigId.Clipboard_DebounceTime) / 1000
+        self._lastContentHash = None
+        self._droppedChanges = 0
+
+        # Same content should be converted again, if the previous result is no longer shown
+        # or could be converted differently
+        self._events.subscribeStatusbarClear(self._forgetLastContent)
+        self._events.subscribeConfigurationChanged(self._forgetLastContent)
+
+        if config.get(ConfigId.Converter_Extraction_Enabled):
+            # Lexing and extraction patterns don't backtrack, so their time is linear to the text
+            # length and longer texts are safe to parse. See TextLexer._PATTERN
+            self._maxContentLength = ClipboardManager._MAX_CONTENT_LENGTH_EXTRACTION
+            self._maxContentLengthTrimmed = ClipboardManager._MAX_CONTENT_LENGTH_EXTRACTION
+        else:
+            self._maxContentLength = ClipboardManager._MAX_CONTENT_LENGTH
+            self._maxContentLengthTrimmed = ClipboardManager._MAX_CONTENT_LENGTH_TRIMMED
 
     @abstractmethod
     def validateSystem(self) -> bool:
@@ -25,13 +60,76 @@ class ClipboardManager(ABC):
     def initializeClipboardWatch(self) -> None:
         pass
 
+    def setClipboardContent(
+        self, content: str, onCompleted: Callable[[bool], None] | None = None
+    ) -> None:
+        """
+        Content is written in a background thread, so the calling UI thread is not blocked
+
+        :param onCompleted: called from the writer thread, with True if content was written
+        """
+
+        self._rememberOwnContent(content)
+        self._writer.write(content, onCompleted)
+
     @abstractmethod
-    def setClipboardContent(self, content: str) -> None:
+    def _writeClipboardContent(self, content: str) -> None:
+        """
+        Blocks until content is written
+
+        :raises Exception: if content could not be written
+        """
+
         pass
 
+    def _rememberOwnContent(self, content: str) -> None:
+        # Content written by the app itself is already converted or is a conversion result,
+        # so it's not converted again when clipboard watch notices the change
+        self._lastContentHash = hash(content)
+
+    def _getMaxContentBytes(self) -> int:
+        """
+        :return: UTF-8 size of the longest allowed content. Content longer than this is too long
+            in any encoding, so reading more is not needed
+        """
+
+        return self._maxContentLength * 4
+
+    def _waitForSettledChange(self, waitForChange: Callable[[float | None], bool]) -> None:
+        """
+        Blocks until clipboard changes and then stays unchanged for the debounce time. So from a
+        burst of changes, e.g. while selecting text by dragging, only the final content is read
+
+        :param waitForChange: blocks until clipboard changes or timeout in seconds passes (None to
+            wait without timeout). Returns False if timeout passed
+        """
+
+        waitForChange(None)
+
+        while self._debounceTime > 0 and waitForChange(self._debounceTime):
+            self._droppedChanges += 1
+
+    def _forgetLastContent(self) -> None:
+        self._lastContentHash = None
+
     def _handleChangedClipboard(self, text: str) -> None:
+        contentHash = hash(text)
+
+        if contentHash == self._lastContentHash:
+            self._droppedChanges += 1
+
+            return
+
+        self._lastContentHash = contentHash
+
+        if self._droppedChanges > 0:
+            self._logger.logDebug(
+                f'{Logs.catClipboard}Dropped {self._droppedChanges} changes before this one'
+            )
+            self._droppedChanges = 0
+
         # Avoid parsing huge texts to not impact performance
-        if len(text) > ClipboardManager._MAX_CONTENT_LENGTH:
+        if len(text) > self._maxContentLength:
             self._logger.logDebug(Logs.catClipboard + 'Changed: Too long content, skipping')
             self._events.dispatchClipboardChanged(None)
 
@@ -45,7 +143,7 @@ class ClipboardManager(ABC):
 
             return
 
-        if len(trimmed) > ClipboardManager._MAX_CONTENT_LENGTH_TRIMMED:
+        if len(trimmed) > self._maxContentLengthTrimmed:
             self._logger.logDebug(
                 Logs.catClipboard + 'Changed: Too long clipboard content after trimming, skipping'
             )
@@ -2,13 +2,19 @@ import os
 import shutil
 import subprocess
 import threading
+import time
 
+from src.Constant.Logs import Logs
 from src.Constant.ModalId import ModalId
 from src.Service.ClipboardManager import ClipboardManager
+from src.Service.Configuration import Configuration
 from src.Service.EventService import EventService
 from src.Service.FilesystemHelper import FilesystemHelper
 from src.Service.Logger import Logger
 from src.Service.ModalWindow.ModalWindowManager import ModalWindowManager
+from src.Service.SubprocessReader import SubprocessReader
+from src.Service.X11Library import X11Library
+from src.Service.X11SelectionWatcher import X11SelectionWatcher
 
 
 class ClipboardManagerLinux(ClipboardManager):
@@ -19,11 +25,12 @@ class ClipboardManagerLinux(ClipboardManager):
     def __init__(
         self,
         events: EventService,
+        config: Configuration,
         logger: Logger,
         modalWindowManager: ModalWindowManager,
         filesystemHelper: FilesystemHelper,
     ):
-        super().__init__(events, logger)
+        super().__init__(events, config, logger)
 
         self._modalWindowManager = modalWindowManager
 
@@ -43,18 +50,79 @@ class ClipboardManagerLinux(ClipboardManager):
     def initializeClipboardWatch(self) -> None:
         threading.Thread(target=self._watchClipboard, daemon=True).start()
 
-    def setClipboardContent(self, content: str) -> None:
-        subprocess.run(['xsel', '-ib'], input=content, text=True)
-        subprocess.run(['xsel', '-ip'], input=content, text=True)
+    def _writeClipboardContent(self, content: str) -> None:
+        # Clipboard and primary selection are written in parallel
+        processes = [
+            subprocess.Popen(['xsel', option], stdin=subprocess.PIPE, text=True)
+            for option in ['-ib', '-ip']
+        ]
+
+        for process in processes:
+            process.communicate(content)
+
+        for process in processes:
+            if process.returncode != 0:
+                raise Exception(f'xsel exited with code {process.returncode}')
 
     def _watchClipboard(self) -> None:
+        # Watcher must be created in the same thread, where it's used
+        try:
+            watcher = X11SelectionWatcher(X11Library())
+        except Exception as e:
+            self._logger.log(
+                f'{Logs.catClipboard}Native X11 watcher is not available, falling back to '
+                f'clipnotify and xsel: {e}'
+            )
+            self._watchClipboardSubprocess()
+
+            return
+
+        self._logger.logDebug(f'{Logs.catClipboard}Watching with native X11 watcher')
+        self._watchClipboardNative(watcher)
+
+    def _watchClipboardNative(self, watcher: X11SelectionWatcher) -> None:
+        # One more byte than allowed, so longer content is still detected as too long
+        maxBytes = self._getMaxContentBytes() + 1
+
+        while True:
+            self._waitForSettledChange(watcher.waitForChange)
+
+            if not watcher.probeTextTarget():
+                # Same as on macOS, non-text content, e.g. image or files, is ignored
+                self._logger.logDebug(f'{Logs.catClipboard}Changed: Not text content, skipping')
+
+                continue
+
+            selection = watcher.readSelection(maxBytes)
+
+            if selection is None:
+                self._logger.logDebug(
+                    f'{Logs.catClipboard}Changed: Could not read selection, skipping'
+                )
+                self._forgetLastContent()
+                self._events.dispatchClipboardChanged(None)
+
+                continue
+
+            self._handleChangedClipboard(selection)
+
+    def _watchClipboardSubprocess(self) -> None:
         while True:
-            # Clipnotify will block thread until selection changes, so we run command and simply wait.
-            # To allow clipnotify to block, it must be run with `call`
-            # See https://stackoverflow.com/a/2562292/4110469
+            self._waitForChangeClipnotify()
 
-            subprocess.call([self._clipnotifyPath], stdout=None, stderr=None)
+            # Changes are not watched while sleeping, but content is read after it. So a burst of
+            # changes is still read once, as its final content, without running clipnotify again
+            time.sleep(self._debounceTime)
 
-            selection = os.popen('xsel -o').read()
+            # One more byte than allowed, so longer content is still detected as too long
+            selection = SubprocessReader.readOutput(
+                ['xsel', '-o'], self._getMaxContentBytes() + 1
+            ).decode('utf-8', errors='replace')
 
             self._handleChangedClipboard(selection)
+
+    def _waitForChangeClipnotify(self) -> None:
+        # Clipnotify will block thread until selection changes, so we run command and simply wait.
+        # To allow clipnotify to block, it must be run with `call`
+        # See https://stackoverflow.com/a/2562292/4110469
+        subprocess.call([self._clipnotifyPath], stdout=None, stderr=None)
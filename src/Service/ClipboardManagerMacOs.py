@@ -1,17 +1,21 @@
+from collections.abc import Callable
+
 from AppKit import NSArray, NSPasteboard, NSStringPboardType
 
 from src.Service.ClipboardManager import ClipboardManager
+from src.Service.Configuration import Configuration
 from src.Service.EventService import EventService
 from src.Service.Logger import Logger
+from src.Service.PollableClipboardInterface import PollableClipboardInterface
 
 
-class ClipboardManagerMacOs(ClipboardManager):
+class ClipboardManagerMacOs(ClipboardManager, PollableClipboardInterface):
     _pasteboard: NSPasteboard
 
     _changeCount: int
 
-    def __init__(self, events: EventService, logger: Logger):
-        super().__init__(events, logger)
+    def __init__(self, events: EventService, config: Configuration, logger: Logger):
+        super().__init__(events, config, logger)
 
         self._changeCount = -1
 
@@ -22,7 +26,15 @@ class ClipboardManagerMacOs(ClipboardManager):
         self._pasteboard = NSPasteboard.generalPasteboard()
         self._changeCount = self._pasteboard.changeCount()
 
-    def setClipboardContent(self, content: str) -> None:
+    def setClipboardContent(
+        self, content: str, onCompleted: Callable[[bool], None] | None = None
+    ) -> None:
+        # Pasteboard is written in-process, so it's fast enough to do in the calling UI thread,
+        # where AppKit objects are safe to use
+        self._rememberOwnContent(content)
+        self._writer.writeNow(content, onCompleted)
+
+    def _writeClipboardContent(self, content: str) -> None:
         try:
             # From https://stackoverflow.com/a/3555675/4110469
             self._pasteboard.clearContents()
@@ -33,14 +45,23 @@ class ClipboardManagerMacOs(ClipboardManager):
                 'Could not set clipboard content.\nOriginal exception: ' + str(e)
             ) from e
 
+    def getChangeCount(self) -> int:
+        return self._pasteboard.changeCount()
+
     def pollClipboard(self) -> None:
         # From https://stackoverflow.com/a/8317794/4110469
         # Apple documentation: https://developer.apple.com/documentation/appkit/nspasteboard
 
-        if self._pasteboard.changeCount() == self._changeCount:
+        changeCount = self._pasteboard.changeCount()
+
+        if changeCount == self._changeCount:
             return
 
-        self._changeCount = self._pasteboard.changeCount()
+        # Changes between 2 polls are noticed as one, but still counted. Change is processed right
+        # away, without debounce: macOS has no selection bursts while dragging, as there is no
+        # primary selection
+        self._droppedChanges += changeCount - self._changeCount - 1
+        self._changeCount = changeCount
         content = self._pasteboard.stringForType_(NSStringPboardType)
 
         if content is None:
@@ -0,0 +1,75 @@
+import os
+import shutil
+import subprocess
+import threading
+
+from src.Constant.Logs import Logs
+from src.Service.ClipboardManager import ClipboardManager
+from src.Service.Configuration import Configuration
+from src.Service.EventService import EventService
+from src.Service.Logger import Logger
+from src.Service.WlPasteWatcher import WlPasteWatcher
+
+
+class ClipboardManagerWayland(ClipboardManager):
+    _wlPastePath: str
+
+    def __init__(
+        self,
+        events: EventService,
+        config: Configuration,
+        logger: Logger,
+        wlPastePath: str = 'wl-paste',
+    ):
+        super().__init__(events, config, logger)
+
+        self._wlPastePath = wlPastePath
+
+    @staticmethod
+    def isSupported() -> bool:
+        """
+        :return: True if running in a Wayland session with wl-clipboard installed
+        """
+
+        return bool(os.environ.get('WAYLAND_DISPLAY')) and shutil.which('wl-paste') is not None
+
+    def validateSystem(self) -> bool:
+        return True
+
+    def initializeClipboardWatch(self) -> None:
+        threading.Thread(target=self._watchClipboard, daemon=True).start()
+
+    def _writeClipboardContent(self, content: str) -> None:
+        # Clipboard and primary selection are written in parallel
+        processes = [
+            subprocess.Popen(['wl-copy'] + options, stdin=subprocess.PIPE, text=True)
+            for options in [[], ['--primary']]
+        ]
+
+        for process in processes:
+            process.communicate(content)
+
+        for process in processes:
+            if process.returncode != 0:
+                raise Exception(f'wl-copy exited with code {process.returncode}')
+
+    def _watchClipboard(self) -> None:
+        # Primary selection, same as on X11. Some compositors don't support it, then wl-paste
+        # exits and the regular clipboard is watched instead
+        for primary in [True, False]:
+            selectionName = 'primary selection' if primary else 'clipboard'
+            # One more byte than allowed, so longer content is still detected as too long
+            watcher = WlPasteWatcher(self._getMaxContentBytes() + 1, primary, self._wlPastePath)
+            self._logger.logDebug(f'{Logs.catClipboard}Watching {selectionName} with wl-paste')
+
+            try:
+                self._watchClipboardStream(watcher)
+            except Exception as e:
+                self._logger.log(f'{Logs.catClipboard}Could not watch {selectionName}: {e}')
+            finally:
+                watcher.close()
+
+    def _watchClipboardStream(self, watcher: WlPasteWatcher) -> None:
+        while True:
+            self._waitForSettledChange(watcher.waitForChange)
+            self._handleChangedClipboard(watcher.getContent())
@@ -0,0 +1,61 @@
+import queue
+import threading
+from collections.abc import Callable
+
+from src.Constant.Logs import Logs
+from src.Service.Logger import Logger
+
+
+class ClipboardWriter:
+    """
+    Writes clipboard content in a single background thread, so the UI thread is not blocked while
+    clipboard helper processes run. Writes are done in the same order as requested
+    """
+
+    _writeContent: Callable[[str], None]
+    _logger: Logger
+
+    _queue: queue.SimpleQueue[tuple[str, Callable[[bool], None] | None]]
+    _thread: threading.Thread | None
+    _threadLock: threading.Lock
+
+    def __init__(self, writeContent: Callable[[str], None], logger: Logger):
+        """
+        :param writeContent: blocks until content is written. Raises exception if it failed
+        """
+
+        self._writeContent = writeContent
+        self._logger = logger
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+        self._threadLock = threading.Lock()
+
+    def write(self, content: str, onCompleted: Callable[[bool], None] | None = None) -> None:
+        """
+        :param onCompleted: called from the writer thread, with True if content was written
+        """
+
+        with self._threadLock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._processWrites, daemon=True)
+                self._thread.start()
+
+        self._queue.put((content, onCompleted))
+
+    def writeNow(self, content: str, onCompleted: Callable[[bool], None] | None = None) -> None:
+        """Same as write, but blocks the calling thread until content is written"""
+
+        try:
+            self._writeContent(content)
+            written = True
+        except Exception as e:
+            self._logger.log(f'{Logs.catClipboard}Could not set clipboard content: {e}')
+            written = False
+
+        if onCompleted is not None:
+            onCompleted(written)
+
+    def _processWrites(self) -> None:
+        while True:
+            content, onCompleted = self._queue.get()
+            self.writeNow(content, onCompleted)
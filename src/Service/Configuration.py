@@ -1,17 +1,25 @@
-from typing import Any
+from typing import Any, Final
 
 import yaml
 
 from src.Constant.Logs import Logs
 from src.DTO.ConfigParameter import ConfigParameter
 from src.Service.ConfigFileManager import ConfigFileManager
+from src.Service.EventService import EventService
 from src.Service.FilesystemHelper import FilesystemHelper
 from src.Service.Logger import Logger
 
 
 class Configuration:
+    _YAML_LOADER: Final[type] = getattr(yaml, 'CLoader', yaml.Loader)
+    """
+    Same as yaml.Loader, but implemented in C (libyaml) and a few times faster. Used if PyYAML was
+    built with libyaml
+    """
+
     _filesystemHelper: FilesystemHelper
     _configFileManager: ConfigFileManager
+    _events: EventService
     _logger: Logger
 
     _appVersion: str
@@ -39,10 +47,12 @@ class Configuration:
         self,
         filesystemHelper: FilesystemHelper,
         configFileManager: ConfigFileManager,
+        events: EventService,
         logger: Logger,
     ):
         self._filesystemHelper = filesystemHelper
         self._configFileManager = configFileManager
+        self._events = events
         self._logger = logger
 
         self._configInitialized = False
@@ -69,6 +79,7 @@ class Configuration:
             )
 
         self._setState(parameter.key, value)
+        self._events.dispatchConfigurationChanged()
 
     def _initializeConfig(self) -> None:
         if self._configInitialized:
@@ -76,17 +87,17 @@ class Configuration:
 
         self._configApp = yaml.load(
             self._configFileManager.getAppConfigContent(),
-            yaml.Loader,
+            self._YAML_LOADER,
         )
 
         self._configUser = yaml.load(
             self._configFileManager.getUserConfigContent(),
-            yaml.Loader,
+            self._YAML_LOADER,
         )
 
         self._state = yaml.load(
             self._configFileManager.getStateDataContent(),
-            yaml.Loader,
+            self._YAML_LOADER,
         )
 
         with open(self._filesystemHelper.getProjectDir() + '/version', 'r') as versionFile:
@@ -2,46 +2,63 @@
 import time
 
 from src.Constant.ConfigId import ConfigId
+from src.Constant.InputShape import InputShape
 from src.Constant.Logs import Logs
+from src.Constant.ThreadAffinity import ThreadAffinity
+from src.DTO.ConvertResult import ConvertResult
+from src.DTO.ScheduledJob import ScheduledJob
 from src.Service.Configuration import Configuration
+from src.Service.Conversion.ConversionResultCache import ConversionResultCache
 from src.Service.Conversion.ConverterInterface import ConverterInterface
+from src.Service.Conversion.TextLexer import TextLexer
 from src.Service.Debug import Debug
 from src.Service.EventService import EventService
 from src.Service.ExceptionHandler import ExceptionHandler
 from src.Service.Logger import Logger
+from src.Service.Scheduler import Scheduler
 
 
 class ConversionManager:
-    _converters: list[ConverterInterface]
+    _routes: dict[str, list[ConverterInterface]]
+    """InputShape => enabled converters accepting that shape, in the original order"""
+    _textLexer: TextLexer
+    _cache: ConversionResultCache
     _events: EventService
+    _scheduler: Scheduler
     _logger: Logger
     _debug: Debug
 
     _clearOnChangeEnabled: bool
     _clearAfterTime: int
     _convertedAt: int | None
+    _clearJob: ScheduledJob | None
 
     def __init__(
         self,
         converters: list[ConverterInterface],
+        textLexer: TextLexer,
+        cache: ConversionResultCache,
         events: EventService,
+        scheduler: Scheduler,
         config: Configuration,
         logger: Logger,
         debug: Debug,
     ):
-        self._converters = [c for c in converters if c.isEnabled()]
+        self._routes = self._buildRoutes([c for c in converters if c.isEnabled()])
+        self._textLexer = textLexer
+        self._cache = cache
         self._events = events
+        self._scheduler = scheduler
         self._logger = logger
         self._debug = debug
 
         self._clearOnChangeEnabled = config.get(ConfigId.ClearOnChange)
         self._clearAfterTime = config.get(ConfigId.ClearAfterTime)
         self._convertedAt = None
+        self._clearJob = None
 
-        self._events.subscribeClipboardChanged(self.onClipboardChange)
-
-        if self._clearAfterTime > 0:
-            self._events.subscribeAppLoopIteration(self._tryClearAfterTime)
+        # Clipboard watch should not wait for conversion and UI update
+        self._events.subscribeClipboardChanged(self.onClipboardChange, ThreadAffinity.WORKER)
 
     def onClipboardChange(self, text: str | None) -> None:
         if text is None:
@@ -49,18 +66,64 @@ class ConversionManager:
 
             return
 
-        for converter in self._converters:
+        result = self.convert(text)
+
+        if self._debug.isDebugEnabled():
+            self._logger.log(f'{Logs.catConvert}Result cache: {self._cache.getStatsLog()}')
+
+        if result is None:
+            self._tryClearOnChange()
+
+            return
+
+        self._convertedAt = int(time.time())
+
+        if self._clearAfterTime > 0:
+            self._scheduler.cancel(self._clearJob)
+            self._clearJob = self._scheduler.scheduleOnce(
+                self._clearAfterTime, self._tryClearAfterTime
+            )
+
+        self._events.dispatchConverted(result)
+
+    def convert(self, text: str) -> ConvertResult | None:
+        """
+        Converts text without dispatching any events
+
+        :param text: whitespace around start and end is ignored
+        :return: result of the first converter that succeeded, None if none did
+        """
+
+        # Cache is keyed by the same trimmed text, which is tokenized
+        text = text.strip()
+        result: ConvertResult | None
+        generation = self._cache.getGeneration()
+        isCached, entry = self._cache.get(text)
+
+        if isCached:
+            if entry is None:
+                return None
+
+            converter, result = entry
+
+            return converter.refreshResult(result)
+
+        token = self._textLexer.tokenize(text)
+        hadException = False
+
+        for converter in self._routes[token.shape]:
             try:
-                success, result = converter.tryConvert(text)
+                success, result = converter.tryConvert(token)
             except Exception as e:
                 self._logger.log(
                     f'{Logs.catConverter}{converter.getName()}] CONVERTER EXCEPTION:\n'
                     f'{ExceptionHandler.formatExceptionLog(e)}',
                 )
+                hadException = True
 
                 continue
 
-            if not success:
+            if not success or result is None:
                 continue
 
             if self._debug.isDebugEnabled():
@@ -69,17 +132,38 @@ class ConversionManager:
                     f'{result.iconText} / {result.originalText} / {result.convertedText}',
                 )
 
-            self._convertedAt = int(time.time())
-            self._events.dispatchConverted(result)  # type: ignore[arg-type]
+            self._cache.set(generation, text, (converter, result))
 
-            return
+            return result
+
+        if not hadException:
+            # After an exception, same text may still be converted on the next try
+            self._cache.set(generation, text, None)
+
+        return None
+
+    def _buildRoutes(
+        self, converters: list[ConverterInterface]
+    ) -> dict[str, list[ConverterInterface]]:
+        routes: dict[str, list[ConverterInterface]] = {shape: [] for shape in InputShape.ALL}
+
+        for converter in converters:
+            for shape in converter.getAcceptedShapes():
+                if shape not in routes:
+                    raise Exception(
+                        f'Converter {converter.getName()} accepts unknown shape: {shape}'
+                    )
+
+                routes[shape].append(converter)
 
-        self._tryClearOnChange()
+        return routes
 
     def dispatchClear(self, reason: str) -> None:
         self._logger.logDebug(Logs.catConvert + ' Statusbar clear: ' + reason)
 
         self._convertedAt = None
+        self._scheduler.cancel(self._clearJob)
+        self._clearJob = None
         self._events.dispatchStatusbarClear()
 
     def _tryClearOnChange(self) -> None:
@@ -0,0 +1,112 @@
+import copy
+import threading
+from collections import OrderedDict
+from typing import Final
+
+from src.DTO.ConvertResult import ConvertResult
+from src.Service.Conversion.ConverterInterface import ConverterInterface
+from src.Service.Conversion.Unit.UnitConverterInterface import UnitConverterInterface
+from src.Service.EventService import EventService
+
+CacheEntry = tuple[ConverterInterface, ConvertResult] | None
+"""Converter that produced the result and the result itself. None if text was not converted"""
+
+
+class ConversionResultCache:
+    """
+    Bounded LRU cache of conversion results, keyed by the clipboard text as ConversionManager
+    tokenizes it, i.e. with whitespace trimmed around start and end. Results are copied when stored
+    and returned, so changes by a caller can't leak into other hits.
+
+    Every key also includes the generation, which is incremented when currency rates are refreshed
+    or configuration is changed. So entries of older generations are never returned, even if they
+    are stored after the change by a conversion that started before it.
+
+    Thread safe, conversions run in the worker thread, while invalidation comes from other threads.
+    """
+
+    _MAX_SIZE: Final[int] = 256
+
+    _entries: OrderedDict[tuple[int, str], CacheEntry]
+    _generation: int
+    _hits: int
+    _misses: int
+    _lock: threading.Lock
+
+    def __init__(self, events: EventService):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+
+        events.subscribeDelayedConverterInitialized(self._onDelayedConverterInitialized)
+        events.subscribeConfigurationChanged(self.invalidate)
+
+    def getGeneration(self) -> int:
+        """
+        Must be taken before converting, and passed to set() after it
+        """
+
+        return self._generation
+
+    def get(self, text: str) -> tuple[bool, CacheEntry]:
+        """
+        :return: (True, entry) if text is cached. (False, None) otherwise
+        """
+
+        with self._lock:
+            key = (self._generation, text)
+
+            if key not in self._entries:
+                self._misses += 1
+
+                return False, None
+
+            self._hits += 1
+            self._entries.move_to_end(key)
+            entry = self._entries[key]
+
+        return True, self._copyEntry(entry)
+
+    def set(self, generation: int, text: str, entry: CacheEntry) -> None:
+        entry = self._copyEntry(entry)
+
+        with self._lock:
+            if generation != self._generation:
+                # Conversion started before the cache was invalidated, so result may be outdated
+                return
+
+            self._entries[(generation, text)] = entry
+
+            if len(self._entries) > self._MAX_SIZE:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries = OrderedDict()
+
+    def getStatsLog(self) -> str:
+        return f'{self._hits} hits, {self._misses} misses, {len(self._entries)} entries'
+
+    def _copyEntry(self, entry: CacheEntry) -> CacheEntry:
+        if entry is None:
+            return None
+
+        converter, result = entry
+
+        return converter, self._copyResult(result)
+
+    def _copyResult(self, result: ConvertResult) -> ConvertResult:
+        """
+        Shallow copy keeps the result subclass and its own fields, e.g. TimestampConvertResult
+        """
+
+        copied = copy.copy(result)
+        copied.otherResults = [self._copyResult(other) for other in result.otherResults]
+
+        return copied
+
+    def _onDelayedConverterInitialized(self, converter: UnitConverterInterface) -> None:
+        self.invalidate()
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
 from src.DTO.ConvertResult import ConvertResult
+from src.DTO.TokenizedText import TokenizedText
 
 
 class ConverterInterface(ABC):
@@ -12,11 +13,30 @@ class ConverterInterface(ABC):
     def getName(self) -> str:
         pass
 
+    @abstractmethod
+    def getAcceptedShapes(self) -> list[str]:
+        """
+        :return: InputShape constants. Converter will receive only text of these shapes
+        """
+        pass
+
     # TODO does return type really need 2 variables here? Maybe `ConvertResult | None` would be enough?
     @abstractmethod
-    def tryConvert(self, text: str) -> tuple[bool, ConvertResult | None]:
+    def tryConvert(self, token: TokenizedText) -> tuple[bool, ConvertResult | None]:
         """
-        :param text: text will already have whitespace trimmed around start and end
+        :param token: clipboard text, tokenized once and shared between all converters.
+            Original text will already have whitespace trimmed around start and end
         :return: (True, ConvertResult) if conversion happened. (False, None) otherwise
         """
         pass
+
+    @abstractmethod
+    def refreshResult(self, result: ConvertResult) -> ConvertResult:
+        """
+        Called when result of this converter is reused from the cache, instead of converting again
+
+        :param result: result previously returned by tryConvert
+        :return: given result, or a new one if it depends on something besides the text itself,
+            e.g. on the current time
+        """
+        pass
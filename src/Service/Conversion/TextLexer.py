@@ -0,0 +1,52 @@
+import re
+from typing import Final
+
+from src.DTO.TokenizedText import TokenizedText
+
+
+class TextLexer:
+    """
+    Tokenizes clipboard text once per change, so converters don't need to re-run their own regexes
+    """
+
+    # Same grammar as the former UnitParser pattern `^([^\d\s-]+)?(-?[\d,.]*\d[\d,.]*)([^\d\s]+3?)?`,
+    # rewritten so that matching is linear to the text length. Number group does not backtrack, as
+    # its separators prefix can't overlap with digits. Unit before is possessive: it stops only at
+    # a digit, whitespace, minus or the end, so giving back its trailing separators can never let
+    # the number match. Without it, runs of separators backtracked quadratically
+    _PATTERN: Final = re.compile(r'([^\d\s-]++)?(-)?([,.]*\d[\d,.]*)([^\d\s]+3?)?')
+    _GROUP_UNIT_BEFORE: Final = 1
+    _GROUP_SIGN: Final = 2
+    _GROUP_NUMBER: Final = 3
+    _GROUP_UNIT_AFTER: Final = 4
+
+    def tokenize(self, text: str) -> TokenizedText:
+        """
+        :param text: text with whitespace trimmed around start and end
+        """
+
+        if text.isdecimal():
+            # Fast path for plain numbers, e.g. timestamps
+            return TokenizedText(text, text, True, None, text, None, False, len(text), False)
+
+        # Remove all whitespace from anywhere in the string
+        compact = ''.join(text.split()).lower()
+        match = self._PATTERN.match(compact)
+
+        if match is None:
+            return TokenizedText(text, compact, False)
+
+        sign, digits = match.group(self._GROUP_SIGN, self._GROUP_NUMBER)
+        separatorsCount = digits.count(',') + digits.count('.')
+
+        return TokenizedText(
+            text,
+            compact,
+            False,
+            match.group(self._GROUP_UNIT_BEFORE),
+            digits if sign is None else sign + digits,
+            match.group(self._GROUP_UNIT_AFTER),
+            sign is not None,
+            len(digits) - separatorsCount,
+            separatorsCount > 0,
+        )
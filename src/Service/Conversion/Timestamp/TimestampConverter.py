@@ -1,10 +1,12 @@
-import re
 from typing import Final
 
 from src.Constant.ConfigId import ConfigId
+from src.Constant.InputShape import InputShape
 from src.Constant.Logs import Logs
 from src.DTO.ConvertResult import ConvertResult
 from src.DTO.Timestamp import Timestamp
+from src.DTO.TimestampConvertResult import TimestampConvertResult
+from src.DTO.TokenizedText import TokenizedText
 from src.Service.Configuration import Configuration
 from src.Service.Conversion.ConverterInterface import ConverterInterface
 from src.Service.Conversion.Timestamp.TimestampTextFormatter import TimestampTextFormatter
@@ -12,7 +14,7 @@ from src.Service.Logger import Logger
 
 
 class TimestampConverter(ConverterInterface):
-    _REGEX_PATTERN: Final[str] = '^\\d{1,14}$'
+    _MAX_CHARACTERS: Final[int] = 14
     _MIN_VALUE: Final[int] = 100000000  # 1973-03-03
     _MAX_VALUE: Final[int] = 9999999999  # 2286-11-20
 
@@ -48,28 +50,41 @@ class TimestampConverter(ConverterInterface):
     def getName(self) -> str:
         return 'Timestamp'
 
-    def tryConvert(self, text: str) -> tuple[bool, ConvertResult | None]:
-        timestamp = self._extractTimestamp(text)
+    def getAcceptedShapes(self) -> list[str]:
+        return [InputShape.PURE_DIGITS]
+
+    def tryConvert(self, token: TokenizedText) -> tuple[bool, ConvertResult | None]:
+        timestamp = self._extractTimestamp(token)
 
         if timestamp is None:
             return False, None
 
-        return (
-            True,
-            ConvertResult(
-                self._formatter.formatForIcon(timestamp),
-                self._formatter.format(timestamp, self._templateOriginalText),
-                self._formatter.format(timestamp, self._templateConvertedText),
-                self.getName(),
-            ),
-        )
+        return True, self._buildResult(timestamp)
+
+    def refreshResult(self, result: ConvertResult) -> ConvertResult:
+        if not isinstance(result, TimestampConvertResult):
+            raise Exception(
+                f'{self.getName()} converter cannot refresh result of another converter'
+            )
 
-    def _extractTimestamp(self, text: str) -> Timestamp | None:
-        regexResult = re.match(self._REGEX_PATTERN, text)
+        # Whole texts are re-rendered, as relative time can also change the icon template
+        return self._buildResult(result.timestamp)
 
-        if regexResult is None:
+    def _buildResult(self, timestamp: Timestamp) -> TimestampConvertResult:
+        return TimestampConvertResult(
+            self._formatter.formatForIcon(timestamp),
+            self._formatter.format(timestamp, self._templateOriginalText),
+            self._formatter.format(timestamp, self._templateConvertedText),
+            self.getName(),
+            timestamp,
+        )
+
+    def _extractTimestamp(self, token: TokenizedText) -> Timestamp | None:
+        if not token.isDigitsOnly or len(token.text) > self._MAX_CHARACTERS:
             return None
 
+        text = token.text
+
         try:
             number = int(text)
         except Exception as e:
@@ -0,0 +1,86 @@
+from collections.abc import Iterable, Iterator
+
+
+class AhoCorasickAutomaton:
+    """
+    Finds all occurrences of multiple words in a text in a single pass, in time linear to the text
+    length plus the number of occurrences
+    """
+
+    _transitions: list[dict[str, int]]
+    """State => character => next state. State 0 is the root"""
+    _fallbacks: list[int]
+    """State => state of the longest proper suffix, that is also a prefix of some word"""
+    _outputs: list[tuple[str, ...]]
+    """State => words ending at this state, longest first"""
+
+    def __init__(self, words: Iterable[str]):
+        self._transitions = [{}]
+        self._fallbacks = [0]
+        self._outputs = [()]
+
+        for word in words:
+            self._addWord(word)
+
+        self._buildFallbacks()
+
+    def findAll(self, text: str) -> Iterator[tuple[int, tuple[str, ...]]]:
+        """
+        :return: (end index, exclusive; all words ending there, longest first) for each position,
+            where at least one word ends
+        """
+
+        transitions = self._transitions
+        fallbacks = self._fallbacks
+        outputs = self._outputs
+        state = 0
+
+        for index, char in enumerate(text):
+            while state != 0 and char not in transitions[state]:
+                state = fallbacks[state]
+
+            state = transitions[state].get(char, 0)
+
+            if outputs[state]:
+                yield index + 1, outputs[state]
+
+    def _addWord(self, word: str) -> None:
+        if word == '':
+            return
+
+        state = 0
+
+        for char in word:
+            nextState = self._transitions[state].get(char)
+
+            if nextState is None:
+                nextState = len(self._transitions)
+                self._transitions.append({})
+                self._fallbacks.append(0)
+                self._outputs.append(())
+                self._transitions[state][char] = nextState
+
+            state = nextState
+
+        self._outputs[state] = (word,)
+
+    def _buildFallbacks(self) -> None:
+        # Breadth-first, so fallback states are always processed before the states using them
+        queue = list(self._transitions[0].values())
+        queueIndex = 0
+
+        while queueIndex < len(queue):
+            state = queue[queueIndex]
+            queueIndex += 1
+
+            for char, nextState in self._transitions[state].items():
+                fallback = self._fallbacks[state]
+
+                while fallback != 0 and char not in self._transitions[fallback]:
+                    fallback = self._fallbacks[fallback]
+
+                fallback = self._transitions[fallback].get(char, 0)
+                self._fallbacks[nextState] = fallback
+                # Words of the fallback state are suffixes, so shorter than the own word
+                self._outputs[nextState] = self._outputs[nextState] + self._outputs[fallback]
+                queue.append(nextState)
@@ -6,8 +6,6 @@ import threading
 import time
 from typing import Final
 
-import requests
-
 from src.Constant.ConfigId import ConfigId
 from src.Constant.Logs import Logs
 from src.DTO.Converter.CurrenciesFileData import CurrenciesFileData
@@ -16,11 +14,11 @@ from src.DTO.Exception.InvalidHTTPResponseException import InvalidHTTPResponseEx
 from src.Service.ArgumentParser import ArgumentParser
 from src.Service.Configuration import Configuration
 from src.Service.Conversion.Unit.Currency.CurrencyConverter import CurrencyConverter
-from src.Service.EventService import EventService
 from src.Service.ExceptionHandler import ExceptionHandler
 from src.Service.FilesystemHelper import FilesystemHelper
 from src.Service.Logger import Logger
 from src.Service.OSSwitch import OSSwitch
+from src.Service.Scheduler import Scheduler
 
 
 class ConversionRateUpdater:
@@ -35,13 +33,15 @@ class ConversionRateUpdater:
 
     _currencyConverter: CurrencyConverter
     _config: Configuration
-    _events: EventService
+    _scheduler: Scheduler
     _osSwitch: OSSwitch
     _logger: Logger
 
     _url: str
     _ratesFilePath: str
     _lastOnlineRefreshAt: int | None
+    _currencies: dict | None
+    """Currencies data last given to the converter"""
     _requestHeaders: dict[str, str]
 
     def __init__(
@@ -50,17 +50,18 @@ class ConversionRateUpdater:
         filesystemHelper: FilesystemHelper,
         argumentParser: ArgumentParser,
         config: Configuration,
-        events: EventService,
+        scheduler: Scheduler,
         osSwitch: OSSwitch,
         logger: Logger,
     ):
         self._currencyConverter = currencyConverter
         self._config = config
-        self._events = events
+        self._scheduler = scheduler
         self._osSwitch = osSwitch
         self._logger = logger
 
         self._lastOnlineRefreshAt = None
+        self._currencies = None
         self._ratesFilePath = filesystemHelper.getUserDataDir() + '/currency_rates.json'
 
         cliUrlOverride = argumentParser.getCurrencyRatesUrl()
@@ -75,7 +76,15 @@ class ConversionRateUpdater:
         # That is needed to have currency list, to allow enabling converter in settings
         # and immediately select primary currency, instead of having to restart the app
 
-        threading.Thread(target=self._initializeRates, daemon=True).start()
+        threading.Thread(target=self.initializeRates, daemon=True).start()
+
+    def getCurrencies(self) -> dict | None:
+        """
+        :return: currencies data, as loaded from the rates file or online. None if not loaded yet.
+            Allows passing already parsed rates to other processes
+        """
+
+        return self._currencies
 
     def _buildDefaultRatesUrl(self) -> str:
         # URL assembled from fragments so naive bots don't see it as a valid URL to scrape
@@ -86,7 +95,9 @@ class ConversionRateUpdater:
             + '/ra' + 'tes'
         )
 
-    def _initializeRates(self) -> None:
+    def initializeRates(self) -> None:
+        """Blocking version of initializeRatesAsync, for when rates are needed right away"""
+
         fileResult = self._refreshFromLocalFile()
 
         self._logger.log(
@@ -109,10 +120,13 @@ class ConversionRateUpdater:
                 parsedData = onlineResult.data
 
         if fileResult.success and (onlineResult is None or not onlineResult.success):
-            self._currencyConverter.refreshUnits(parsedData.currencies)  # type: ignore[union-attr]
+            self._refreshUnits(parsedData.currencies)  # type: ignore[union-attr]
 
         if self._config.get(ConfigId.Converter_Currency_Enabled):
-            self._events.subscribeAppLoopIteration(self._updateCheck)
+            nextRefreshAt = (self._lastOnlineRefreshAt or 0) + self._UPDATE_INTERVAL
+            self._scheduler.schedulePeriodic(
+                self._UPDATE_INTERVAL, self._updateCheck, max(0, nextRefreshAt - time.time())
+            )
 
     def _refreshFromLocalFile(self) -> CurrenciesRefreshResult:
         try:
@@ -142,6 +156,9 @@ class ConversionRateUpdater:
     def _refreshFromOnline(self) -> CurrenciesRefreshResult:
         self._lastOnlineRefreshAt = int(time.time())
 
+        # Imported only here, as it's slow to import and not needed until the first online refresh
+        import requests
+
         try:
             response = requests.get(self._url, headers=self._getRequestHeaders())
             statusCode = response.status_code
@@ -164,7 +181,7 @@ class ConversionRateUpdater:
                 f'refreshedAt: {self._timestampRelativeLog(parsedData.refreshedAt)}',
             )
 
-            self._currencyConverter.refreshUnits(parsedData.currencies)
+            self._refreshUnits(parsedData.currencies)
 
             return CurrenciesRefreshResult(True, False, parsedData)
         except Exception as e:
@@ -175,6 +192,10 @@ class ConversionRateUpdater:
 
             return CurrenciesRefreshResult(False, True)
 
+    def _refreshUnits(self, currencies: dict) -> None:
+        self._currencies = currencies
+        self._currencyConverter.refreshUnits(currencies)
+
     def _parseJsonText(self, text: str) -> CurrenciesFileData:
         data = json.loads(text)
 
@@ -185,12 +206,6 @@ class ConversionRateUpdater:
         )
 
     def _updateCheck(self) -> None:
-        if (
-            self._lastOnlineRefreshAt
-            and (int(time.time()) - self._UPDATE_INTERVAL) < self._lastOnlineRefreshAt
-        ):
-            return
-
         threading.Thread(target=self._refreshFromOnline, daemon=True).start()
 
     def _getRequestHeaders(self) -> dict[str, str]:
@@ -1,5 +1,8 @@
+from typing import TYPE_CHECKING
+
 from src.Constant.ConfigId import ConfigId
 from src.Constant.Logs import Logs
+from src.DTO.BatchConvertResult import BatchConvertResult
 from src.DTO.ConvertResult import ConvertResult
 from src.DTO.Converter.CurrencyUnit import CurrencyUnit
 from src.DTO.Converter.UnitDefinition import UnitDefinition
@@ -10,6 +13,9 @@ from src.Service.Conversion.Unit.UnitPreprocessor import UnitPreprocessor
 from src.Service.EventService import EventService
 from src.Service.Logger import Logger
 
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike
+
 
 class CurrencyConverter(UnitConverterInterface):
     _rounder: Rounder
@@ -73,6 +79,28 @@ class CurrencyConverter(UnitConverterInterface):
 
         return True, ConvertResult(f'{textFrom}  =  {textTo}', textFrom, textTo, self.getName())
 
+    def tryConvertBatch(
+        self, numbers: ArrayLike, unitId: str
+    ) -> tuple[bool, BatchConvertResult | None]:
+        import numpy
+
+        fromCurrency = self._unitsExpanded[unitId]
+        targetCurrency = self._unitsExpanded[self._primaryCurrency]
+
+        if fromCurrency is targetCurrency:
+            return False, None
+
+        numbersFrom = numpy.asarray(numbers, dtype=numpy.float64)
+        # Same operations order as in tryConvert, so results are exactly the same
+        numbersTo = (numbersFrom / fromCurrency.rate) * targetCurrency.rate
+
+        return True, BatchConvertResult(
+            numbersTo,
+            numpy.full(numbersTo.shape, targetCurrency.prettyFormat, dtype=object),
+            numpy.ones(numbersTo.shape, dtype=bool),
+            self.getName(),
+        )
+
     def refreshUnits(self, data: dict) -> None:
         self._unitsDefinition = self._buildUnitsDefinition(data)
         self._unitsExpanded = UnitPreprocessor.expandAliases(self._unitsDefinition)
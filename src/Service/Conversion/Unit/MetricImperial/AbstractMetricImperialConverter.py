@@ -1,5 +1,8 @@
+import bisect
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Final
 
+from src.DTO.BatchConvertResult import BatchConvertResult
 from src.DTO.ConvertResult import ConvertResult
 from src.DTO.Converter.MetricImperialUnit import MetricImperialUnit
 from src.DTO.Converter.UnitDefinition import UnitDefinition
@@ -7,8 +10,17 @@ from src.Service.Conversion.Rounder import Rounder
 from src.Service.Conversion.Unit.UnitConverterInterface import UnitConverterInterface
 from src.Service.Conversion.Unit.UnitPreprocessor import UnitPreprocessor
 
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike
+
 
 class AbstractMetricImperialConverter(UnitConverterInterface, ABC):
+    _THRESHOLD_TOLERANCE: Final = 1 + 1e-12
+    """
+    Thresholds are rounded products, so a value this close above one may still fit the smaller
+    unit when checked precisely by division
+    """
+
     _rounder: Rounder
 
     _enabled: bool
@@ -17,6 +29,10 @@ class AbstractMetricImperialConverter(UnitConverterInterface, ABC):
     _primaryUnitMetric: bool
     _unitsDefinition: dict[str, UnitDefinition[MetricImperialUnit]]
     _unitsExpanded: dict[str, MetricImperialUnit]
+    _unitsTo: list[MetricImperialUnit]
+    """Units of the primary system to convert to, in increasing order"""
+    _unitsToThresholds: list[float]
+    """Value in base units, from which the next bigger unit is shown, for each of _unitsTo"""
 
     def __init__(
         self,
@@ -33,6 +49,7 @@ class AbstractMetricImperialConverter(UnitConverterInterface, ABC):
         self._primaryUnitMetric = primaryUnitMetric
         self._unitsDefinition = self._getUnitsDefinition()
         self._unitsExpanded = UnitPreprocessor.expandAliases(self._unitsDefinition)
+        self._unitsTo, self._unitsToThresholds = self._buildUnitsToTable()
 
     def isEnabled(self) -> bool:
         return self._enabled
@@ -58,31 +75,133 @@ class AbstractMetricImperialConverter(UnitConverterInterface, ABC):
         if metersAbs > self._maxValueBaseUnit or metersAbs < self._minValueBaseUnit:
             return False, None
 
-        numberTo: float = -1
-        unitTo: MetricImperialUnit | None = None
+        unitTo, numberTo = self._selectUnitTo(meters, metersAbs)
 
-        for _, unitDef in self._unitsDefinition.items():
-            unitIteration = unitDef.unit
+        if unitTo is None:
+            return False, None
 
-            if unitIteration.isMetric != self._primaryUnitMetric or not unitIteration.convertToThis:
-                continue
+        numberFromRounded = self._rounder.round(number)
+        numberToRounded = self._rounder.round(numberTo)
+
+        textFrom = f'{numberFromRounded} {unitFrom.prettyFormat}'
+        textTo = f'{numberToRounded} {unitTo.prettyFormat}'
+
+        return True, ConvertResult(f'{textFrom}  =  {textTo}', textFrom, textTo, self.getName())
 
-            numberTo = meters / unitIteration.multiplierToBaseUnit
+    def tryConvertBatch(
+        self, numbers: ArrayLike, unitId: str
+    ) -> tuple[bool, BatchConvertResult | None]:
+        import numpy
 
-            if abs(numberTo) >= unitIteration.limitToShowUnit:
+        unitFrom = self._unitsExpanded[unitId]
+
+        if unitFrom.isMetric == self._primaryUnitMetric:
+            return False, None
+
+        meters = numpy.asarray(numbers, dtype=numpy.float64) * unitFrom.multiplierToBaseUnit
+        metersAbs = numpy.abs(meters)
+        unitsCount = len(self._unitsTo)
+        multipliers = numpy.array([unit.multiplierToBaseUnit for unit in self._unitsTo])
+        limits = numpy.array([unit.limitToShowUnit for unit in self._unitsTo])
+        thresholds = numpy.array(self._unitsToThresholds)
+
+        # Vectorized _selectUnitTo, so selected units are exactly the same
+        indexes = numpy.searchsorted(thresholds, metersAbs, side='right')
+        previous = numpy.maximum(indexes - 1, 0)
+        stepBack = (
+            (indexes > 0)
+            & (metersAbs < thresholds[previous] * self._THRESHOLD_TOLERANCE)
+            & ~(numpy.abs(meters / multipliers[previous]) >= limits[previous])
+        )
+        indexes[stepBack] -= 1
+
+        while True:
+            clipped = numpy.minimum(indexes, unitsCount - 1)
+            numbersTo = meters / multipliers[clipped]
+            overLimit = (indexes < unitsCount) & (numpy.abs(numbersTo) >= limits[clipped])
+
+            if not overLimit.any():
+                break
+
+            indexes[overLimit] += 1
+
+        # Negated comparisons, so NaN is handled same as in tryConvert
+        converted = ~((metersAbs > self._maxValueBaseUnit) | (metersAbs < self._minValueBaseUnit))
+        converted &= indexes < unitsCount
+        indexes[~converted] = unitsCount
+
+        # Last item is for not converted values
+        unitsTo = numpy.array([unit.prettyFormat for unit in self._unitsTo] + [''], dtype=object)
+
+        return True, BatchConvertResult(
+            numpy.where(converted, numbersTo, numpy.nan),
+            unitsTo[indexes],
+            converted,
+            self.getName(),
+        )
+
+    def _selectUnitTo(
+        self, meters: float, metersAbs: float
+    ) -> tuple[MetricImperialUnit | None, float]:
+        """
+        :return: (smallest unit, in which the number is below its limitToShowUnit, converted number)
+        """
+
+        units = self._unitsTo
+        thresholds = self._unitsToThresholds
+        index = bisect.bisect_right(thresholds, metersAbs)
+
+        # Precise checks below are the same as comparing number in each unit to its limit.
+        # Single step back is enough, as thresholds are further apart than the tolerance
+        if (
+            index > 0
+            and metersAbs < thresholds[index - 1] * self._THRESHOLD_TOLERANCE
+            and self._fitsUnit(meters, units[index - 1])
+        ):
+            index -= 1
+
+        while index < len(units):
+            unit = units[index]
+            numberTo = meters / unit.multiplierToBaseUnit
+
+            if not abs(numberTo) >= unit.limitToShowUnit:
+                return unit, numberTo
+
+            index += 1
+
+        return None, -1
+
+    def _fitsUnit(self, meters: float, unit: MetricImperialUnit) -> bool:
+        return not abs(meters / unit.multiplierToBaseUnit) >= unit.limitToShowUnit
+
+    def _buildUnitsToTable(self) -> tuple[list[MetricImperialUnit], list[float]]:
+        units: list[MetricImperialUnit] = []
+        thresholds: list[float] = []
+
+        for unitDef in self._unitsDefinition.values():
+            unit = unitDef.unit
+
+            if unit.isMetric != self._primaryUnitMetric or not unit.convertToThis:
                 continue
 
-            unitTo = unitIteration
+            threshold = unit.limitToShowUnit * unit.multiplierToBaseUnit
 
-            break
+            if len(thresholds) > 0 and threshold <= thresholds[-1]:
+                raise Exception(
+                    f'{self.getName()} converter units must be defined in increasing order, '
+                    f'but {unit.primaryAlias} is not bigger than {units[-1].primaryAlias}'
+                )
 
-        numberFromRounded = self._rounder.round(number)
-        numberToRounded = self._rounder.round(numberTo)
+            if len(thresholds) > 0 and threshold < thresholds[-1] * self._THRESHOLD_TOLERANCE:
+                raise Exception(
+                    f'{self.getName()} converter units {units[-1].primaryAlias} and '
+                    f'{unit.primaryAlias} have too close limits to select between them'
+                )
 
-        textFrom = f'{numberFromRounded} {unitFrom.prettyFormat}'
-        textTo = f'{numberToRounded} {unitTo.prettyFormat}'  # type: ignore[union-attr]
+            units.append(unit)
+            thresholds.append(threshold)
 
-        return True, ConvertResult(f'{textFrom}  =  {textTo}', textFrom, textTo, self.getName())
+        return units, thresholds
 
     @abstractmethod
     def _getUnitsDefinition(self) -> dict[str, UnitDefinition[MetricImperialUnit]]:
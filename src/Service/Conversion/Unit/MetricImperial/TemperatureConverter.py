@@ -1,6 +1,7 @@
-from typing import Final
+from typing import TYPE_CHECKING, Final
 
 from src.Constant.ConfigId import ConfigId
+from src.DTO.BatchConvertResult import BatchConvertResult
 from src.DTO.ConvertResult import ConvertResult
 from src.DTO.Converter.AbstractUnit import AbstractUnit
 from src.DTO.Converter.UnitDefinition import UnitDefinition
@@ -8,6 +9,9 @@ from src.Service.Configuration import Configuration
 from src.Service.Conversion.Unit.UnitConverterInterface import UnitConverterInterface
 from src.Service.Conversion.Unit.UnitPreprocessor import UnitPreprocessor
 
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike
+
 
 class TemperatureUnit(AbstractUnit):
     pass
@@ -75,6 +79,39 @@ class TemperatureConverter(UnitConverterInterface):
 
         return True, ConvertResult(f'{textFrom}  =  {textTo}', textFrom, textTo, self.getName())
 
+    def tryConvertBatch(
+        self, numbers: ArrayLike, unitId: str
+    ) -> tuple[bool, BatchConvertResult | None]:
+        import numpy
+
+        unitFrom = self._unitsExpanded[unitId]
+
+        if unitFrom == self._primaryUnit:
+            return False, None
+
+        numbersFrom = numpy.asarray(numbers, dtype=numpy.float64)
+
+        if unitFrom.primaryAlias == self._PRIMARY_ALIAS_CELSIUS:
+            numbersTo = (numbersFrom * 1.8) + 32
+            unitTo = self._unitsExpanded[self._PRIMARY_ALIAS_FAHRENHEIT]
+        elif unitFrom.primaryAlias == self._PRIMARY_ALIAS_FAHRENHEIT:
+            numbersTo = (numbersFrom - 32) / 1.8
+            unitTo = self._unitsExpanded[self._PRIMARY_ALIAS_CELSIUS]
+        else:
+            raise Exception(
+                f'Unknown unitFrom.primaryAlias "{unitFrom.primaryAlias}" in TemperatureConverter'
+            )
+
+        # Negated comparison, so NaN is handled same as in tryConvert
+        converted = ~(numpy.abs(numbersFrom) > self._MAX_VALUE)
+
+        return True, BatchConvertResult(
+            numpy.where(converted, numbersTo, numpy.nan),
+            numpy.where(converted, unitTo.prettyFormat, '').astype(object),
+            converted,
+            self.getName(),
+        )
+
     def _getUnitsDefinition(self) -> dict[str, UnitDefinition[TemperatureUnit]]:
         return {
             'c': UnitDefinition(
@@ -1,58 +1,327 @@
-import re
+import math
 from typing import Final
 
+from src.Constant.AmbiguousSeparator import AmbiguousSeparator
+
 
 class ThousandsDetector:
     """
     Responsible for detecting thousands separator vs decimal separator in a number.
     E.g. what number is 1,234.567 and what number is 100,500 ?
+
+    Number is parsed in a single scan by a deterministic automaton, which tracks both "1,234.5"
+    and "1.234,5" formats at once. Digits are accumulated into an integer mantissa during the same
+    scan, so no intermediate strings are created.
+    """
+
+    # States of a single number format, e.g. "1,234.5"
+    _STATE_START: Final = 0
+    """Nothing after the sign yet"""
+    _STATE_INTEGER: Final = 1
+    """Digits without thousands separators"""
+    _STATE_GROUP: Final = 2
+    """Digits after a thousands separator"""
+    _STATE_FRACTION: Final = 3
+    _STATE_FRACTION_NO_DIGITS: Final = 4
+    """Decimal separator without any digits before it, e.g. '.'"""
+    _STATE_INVALID: Final = 5
+
+    _ACCEPTED_DOT_DECIMAL: Final = 1
+    _ACCEPTED_COMMA_DECIMAL: Final = 2
+    _ACCEPTED_KEY: Final = ''
+    """Automaton row key, under which accepted formats flags are stored"""
+
+    _ASCII_DIGITS: Final = '0123456789'
+    _NON_ZERO_DIGITS: Final = '123456789'
+    _ALPHABET: Final = _ASCII_DIGITS + ',.-+'
+
+    _separatorAsDecimal: str | None
+    """Ambiguous separator that should be treated as decimal. None to always treat as thousands"""
+    _initialRow: dict[str, tuple[dict, int, int]]
+    """
+    Automaton row: character => (next row, mantissa multiplier, mantissa addend).
+    Multiplier is 10 for digits and 1 for other characters, so mantissa is updated without
+    branching. Each row is a pair of states, for "1,234.5" and "1.234,5" formats
     """
 
-    _PATTERN_CONFUSION_DOT_THOUSANDS: Final = re.compile(
-        r'^(?:[-+]?(?=.*\d)(?=.*[1-9]).{1,3}\.\d{3})$',  # for numbers like '100.000' (is it 100.0 or 100000?)
-    )
-    _PATTERN_CONFUSION_COMMA_THOUSANDS: Final = re.compile(
-        r'^(?:[-+]?(?=.*\d)(?=.*[1-9]).{1,3},\d{3})$',  # for numbers like '100,000' (is it 100.0 or 100000?)
-    )
-    _PATTERN_COMMA_THOUSANDS_DOT_DECIMAL: Final = re.compile(
-        r'^[-+]?((\d{1,3}(,\d{3})*)|(\d*))(\.|\.\d*)?$'
-    )
-    _PATTERN_DOT_THOUSANDS_COMMA_DECIMAL: Final = re.compile(
-        r'^[-+]?((\d{1,3}(\.\d{3})*)|(\d*))(,|,\d*)?$'
-    )
+    def __init__(self, ambiguousSeparator: str = AmbiguousSeparator.THOUSANDS):
+        if ambiguousSeparator == AmbiguousSeparator.THOUSANDS:
+            self._separatorAsDecimal = None
+        elif ambiguousSeparator == AmbiguousSeparator.DECIMAL_DOT:
+            self._separatorAsDecimal = '.'
+        elif ambiguousSeparator == AmbiguousSeparator.DECIMAL_COMMA:
+            self._separatorAsDecimal = ','
+        else:
+            raise Exception(f'Unknown ambiguous separator preference: {ambiguousSeparator}')
+
+        self._initialRow = self._buildAutomaton()
 
     def parseNumber(self, number: str) -> float | None:
         """
-        Algorithm source: https://stackoverflow.com/a/55518600/4110469
+        Number is scanned once by the automaton, which accepts "1,234.5" and "1.234,5" formats.
+        Single separator before the last 3 digits is ambiguous, e.g. '100,000', and resolved by
+        the ambiguous separator preference. Ambiguous numbers, which both formats reject, are
+        parsed by _parseAmbiguous
+
+        :param number: digits with optional leading sign and , . separators. Whitespace around is
+            ignored. Any other characters will return None
         """
 
-        number = number.strip().lstrip('0')
+        isStripped = False
+
+        if number == '' or number[0] == '0':
+            number = number.strip().lstrip('0')
+            isStripped = True
+
+            if number == '':
+                # If number is '0', the lstrip() above will return empty string
+                return 0.0
+
+        row = self._initialRow
+        mantissa = 0
+        isAsciiOnly = True
+
+        try:
+            for char in number:
+                row, multiplier, digit = row[char]
+                mantissa = mantissa * multiplier + digit
+        except KeyError:
+            # Whitespace around or non-ASCII digits. Rare, so it's fine to create new strings.
+            # Stripped only once, so whitespace after leading zeros, e.g. '0 123', stays invalid
+            if not isStripped:
+                number = number.strip().lstrip('0')
+
+                if number == '':
+                    return 0.0
+
+            if not all(char in self._ALPHABET or char.isdecimal() for char in number):
+                return None
+
+            isAsciiOnly = False
+            row, mantissa = self._scan(
+                ''.join(str(int(char)) if char.isdecimal() else char for char in number)
+            )
+
+        accepted = row[self._ACCEPTED_KEY][1]
+        length = len(number)
+
+        # Numbers like '100.000' or '100,000'. Is it 100.0 or 100000?
+        # Single separator before the last 3 digits is assumed to be thousands separator
+        if 5 <= length <= 8:
+            separator = number[-4]
 
-        if number == '':
-            # If number is '0', the lstrip() above will return empty string
-            number = '0'
+            if (separator == '.' or separator == ',') and separator != self._separatorAsDecimal:
+                # Format, in which this separator is thousands separator
+                thousandsFormat = (
+                    self._ACCEPTED_COMMA_DECIMAL if separator == '.' else self._ACCEPTED_DOT_DECIMAL
+                )
 
-        # "certain" - concept from algorithm source. Not needed currently, since there's no "max value"
-        # certain = True
+                if isAsciiOnly and accepted & thousandsFormat:
+                    if mantissa != 0:
+                        return -float(mantissa) if number[0] == '-' else float(mantissa)
+                elif self._isAmbiguous(number):
+                    return self._parseAmbiguous(number, mantissa)
 
-        if self._PATTERN_CONFUSION_DOT_THOUSANDS.match(number) is not None:
-            number = number.replace('.', '')  # assume dot is thousands separator
-            # certain = False
-        elif self._PATTERN_CONFUSION_COMMA_THOUSANDS.match(number) is not None:
-            number = number.replace(',', '')  # assume comma is thousands separator
-            # certain = False
-        elif self._PATTERN_COMMA_THOUSANDS_DOT_DECIMAL.match(number) is not None:
-            number = number.replace(',', '')
-        elif self._PATTERN_DOT_THOUSANDS_COMMA_DECIMAL.match(number) is not None:
-            number = number.replace('.', '').replace(',', '.')
+        # Both formats are accepted only for ambiguous numbers, e.g. '-0,000'
+        if accepted & self._ACCEPTED_COMMA_DECIMAL and (
+            not accepted & self._ACCEPTED_DOT_DECIMAL or self._separatorAsDecimal == ','
+        ):
+            decimalAt = number.find(',')
+        elif accepted & self._ACCEPTED_DOT_DECIMAL:
+            decimalAt = number.find('.')
         else:
             # For stuff like '10,000.000,0' and other nonsense
             return None
 
-        numberFloat = float(number)
+        # All characters after decimal separator are digits
+        return self._buildNumber(
+            mantissa, length - decimalAt - 1 if decimalAt != -1 else 0, number[0] == '-'
+        )
+
+    def _scan(self, number: str) -> tuple[dict, int]:
+        """
+        :param number: must contain only automaton alphabet characters
+        :return: (last automaton row, mantissa)
+        """
+
+        row = self._initialRow
+        mantissa = 0
+
+        for char in number:
+            row, multiplier, digit = row[char]
+            mantissa = mantissa * multiplier + digit
+
+        return row, mantissa
+
+    def _isAmbiguous(self, number: str) -> bool:
+        """
+        Checks ambiguous numbers as loosely as the original regex implementation did, to keep
+        compatibility: up to 3 any characters before the separator (not counting the sign), with
+        at least one non-zero digit. See _parseAmbiguous for such numbers
+        """
+
+        signLength = 1 if number[0] == '-' or number[0] == '+' else 0
+
+        if len(number) - 4 - signLength > 3:
+            return False
+
+        if not (number[-3].isdecimal() and number[-2].isdecimal() and number[-1].isdecimal()):
+            return False
+
+        return any(char in self._NON_ZERO_DIGITS for char in number)
+
+    def _parseAmbiguous(self, number: str, mantissa: int) -> float | None:
+        """
+        Separator before the last 3 digits is dropped, the rest must be a valid number. Keeps
+        results of the original regex implementation for numbers, which both formats reject:
+        - separators in front: '1.2,345' is 1.2345, '1.,234' is 1.234
+        - repeated separator: '1,,234' and '+1..234' are 1234
+        - separator first: '.5,000' is 0.5, '-.1.234' is -1234
+        - non-ASCII digits: '1٢.345' is 12345
+        """
+
+        separator = number[-4]
+        isNegative = False
+        hasContent = False
+        hasPoint = False
+        decimals = 3
+
+        for index in range(len(number) - 4):
+            char = number[index]
+
+            if char == separator:
+                continue
+
+            if char == '-' or char == '+':
+                if hasContent:
+                    return None
+
+                isNegative = char == '-'
+            elif char == '.':
+                if hasPoint:
+                    return None
+
+                hasPoint = True
+            elif char == ',':
+                return None
+            elif hasPoint:
+                decimals += 1
+
+            hasContent = True
+
+        return self._buildNumber(mantissa, decimals if hasPoint else 0, isNegative)
+
+    def _buildNumber(self, mantissa: int, decimals: int, isNegative: bool) -> float:
+        # Integer division is correctly rounded, same as float() from a string
+        try:
+            result = mantissa / 10**decimals if decimals > 0 else float(mantissa)
+        except OverflowError:
+            result = math.inf
+
+        return -result if isNegative else result
+
+    def _buildAutomaton(self) -> dict[str, tuple[dict, int, int]]:
+        """
+        Builds product automaton of "1,234.5" and "1.234,5" formats from all states reachable
+        from the initial one
+
+        :return: initial row
+        """
+
+        initialState = ((self._STATE_START, 0), (self._STATE_START, 0))
+        invalidState = ((self._STATE_INVALID, 0), (self._STATE_INVALID, 0))
+
+        rows: dict[tuple, dict] = {}
+        queue: list[tuple] = []
+
+        def getRow(state: tuple) -> dict:
+            if state not in rows:
+                rows[state] = {}
+                queue.append(state)
+
+            return rows[state]
+
+        # Separate row for the first character, as only there sign is allowed
+        initialRow: dict[str, tuple[dict, int, int]] = {}
+
+        for char in self._ALPHABET:
+            nextState = initialState if char in '-+' else self._transition(initialState, char)
+            initialRow[char] = self._buildTransition(getRow(nextState), char)
+
+        initialRow[self._ACCEPTED_KEY] = (initialRow, 0, 0)
+
+        while len(queue) > 0:
+            state = queue.pop()
+            row = rows[state]
+
+            for char in self._ALPHABET:
+                nextState = invalidState if char in '-+' else self._transition(state, char)
+                row[char] = self._buildTransition(getRow(nextState), char)
+
+            accepted = 0
+
+            if self._isAccepted(*state[0]):
+                accepted |= self._ACCEPTED_DOT_DECIMAL
+
+            if self._isAccepted(*state[1]):
+                accepted |= self._ACCEPTED_COMMA_DECIMAL
+
+            row[self._ACCEPTED_KEY] = (row, accepted, 0)
+
+        return initialRow
+
+    def _buildTransition(self, nextRow: dict, char: str) -> tuple[dict, int, int]:
+        if char in self._ASCII_DIGITS:
+            return nextRow, 10, int(char)
+
+        return nextRow, 1, 0
+
+    def _transition(self, state: tuple, char: str) -> tuple:
+        dotDecimal, commaDecimal = state
+
+        if char == ',':
+            return self._onThousands(*dotDecimal), self._onDecimal(*commaDecimal)
+
+        if char == '.':
+            return self._onDecimal(*dotDecimal), self._onThousands(*commaDecimal)
+
+        return self._onDigit(*dotDecimal), self._onDigit(*commaDecimal)
+
+    def _onDigit(self, state: int, count: int) -> tuple[int, int]:
+        if state == self._STATE_START:
+            return self._STATE_INTEGER, 1
+
+        if state == self._STATE_INTEGER:
+            # Only need to know if there are more than 3 digits
+            return self._STATE_INTEGER, min(count + 1, 4)
+
+        if state == self._STATE_GROUP:
+            return (self._STATE_GROUP, count + 1) if count < 3 else (self._STATE_INVALID, 0)
+
+        if state == self._STATE_FRACTION_NO_DIGITS:
+            return self._STATE_FRACTION, 0
+
+        return state, 0
+
+    def _onThousands(self, state: int, count: int) -> tuple[int, int]:
+        if (state == self._STATE_INTEGER and count <= 3) or (
+            state == self._STATE_GROUP and count == 3
+        ):
+            return self._STATE_GROUP, 0
+
+        return self._STATE_INVALID, 0
+
+    def _onDecimal(self, state: int, count: int) -> tuple[int, int]:
+        if state == self._STATE_START:
+            return self._STATE_FRACTION_NO_DIGITS, 0
+
+        if state == self._STATE_INTEGER or (state == self._STATE_GROUP and count == 3):
+            return self._STATE_FRACTION, 0
+
+        return self._STATE_INVALID, 0
 
-        # if not certain and max_val is not None and number > max_val:
-        #     number *= 0.001  # Change previous assumption to decimal separator, so '100.000' goes from 100000.0 to 100.0
-        #     certain = True  # Since this uniquely satisfies the given constraint, it should be a certainly correct interpretation
+    def _isAccepted(self, state: int, count: int) -> bool:
+        if state == self._STATE_GROUP:
+            return count == 3
 
-        return numberFloat
+        return state == self._STATE_INTEGER or state == self._STATE_FRACTION
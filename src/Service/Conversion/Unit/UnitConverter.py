@@ -1,4 +1,6 @@
+from src.Constant.InputShape import InputShape
 from src.DTO.ConvertResult import ConvertResult
+from src.DTO.TokenizedText import TokenizedText
 from src.Service.Conversion.ConverterInterface import ConverterInterface
 from src.Service.Conversion.Unit.ThousandsDetector import ThousandsDetector
 from src.Service.Conversion.Unit.UnitParser import UnitParser
@@ -24,8 +26,11 @@ class UnitConverter(ConverterInterface):
     def getName(self) -> str:
         return 'Simple'
 
-    def tryConvert(self, text: str) -> tuple[bool, ConvertResult | None]:
-        parsed = self._unitParser.parseText(text)
+    def getAcceptedShapes(self) -> list[str]:
+        return [InputShape.NUMBER_UNIT_SUFFIX, InputShape.UNIT_PREFIX_NUMBER]
+
+    def tryConvert(self, token: TokenizedText) -> tuple[bool, ConvertResult | None]:
+        parsed = self._unitParser.parseToken(token)
 
         if parsed is None:
             return False, None
@@ -39,3 +44,6 @@ class UnitConverter(ConverterInterface):
         result.converterName = f'{self.getName()}.{result.converterName}'
 
         return True, result
+
+    def refreshResult(self, result: ConvertResult) -> ConvertResult:
+        return result
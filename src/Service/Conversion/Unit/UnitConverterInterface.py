@@ -1,7 +1,13 @@
+import importlib.util
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
+from src.DTO.BatchConvertResult import BatchConvertResult
 from src.DTO.ConvertResult import ConvertResult
 
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike
+
 
 class UnitConverterInterface(ABC):
     @abstractmethod
@@ -29,3 +35,29 @@ class UnitConverterInterface(ABC):
         :return: (True, ConvertResult) if conversion happened. (False, None) otherwise
         """
         pass
+
+    @abstractmethod
+    def tryConvertBatch(
+        self, numbers: ArrayLike, unitId: str
+    ) -> tuple[bool, BatchConvertResult | None]:
+        """
+        Converts many numbers of the same unit at once, with the same rules as tryConvert.
+        Computed with NumPy, which is imported only when this method is called. NumPy is an
+        optional dependency, check isBatchAvailable first
+
+        :param numbers: array or sequence of numbers
+        :param unitId: same as in tryConvert
+        :return: (True, BatchConvertResult) if conversion happened, even if some of the values are
+            out of range. (False, None) if the unit itself is not converted, e.g. it's already the
+            primary unit
+        """
+        pass
+
+    @staticmethod
+    def isBatchAvailable() -> bool:
+        """
+        :return: True if NumPy is installed, which tryConvertBatch needs. It's not bundled with the
+            app, see requirements_optional.txt
+        """
+
+        return importlib.util.find_spec('numpy') is not None
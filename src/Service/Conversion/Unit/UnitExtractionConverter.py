@@ -0,0 +1,66 @@
+from src.Constant.ConfigId import ConfigId
+from src.Constant.InputShape import InputShape
+from src.DTO.ConvertResult import ConvertResult
+from src.DTO.TokenizedText import TokenizedText
+from src.Service.Configuration import Configuration
+from src.Service.Conversion.ConverterInterface import ConverterInterface
+from src.Service.Conversion.Unit.UnitExtractor import UnitExtractor
+
+
+class UnitExtractionConverter(ConverterInterface):
+    """
+    Convert all quantities found in a longer text, e.g.: the box is 40 cm by 2 ft.
+    First converted quantity is the main result, all others are in its otherResults
+    """
+
+    _unitExtractor: UnitExtractor
+
+    _enabled: bool
+
+    def __init__(self, unitExtractor: UnitExtractor, config: Configuration):
+        self._unitExtractor = unitExtractor
+
+        self._enabled = config.get(ConfigId.Converter_Extraction_Enabled)
+
+    def isEnabled(self) -> bool:
+        return self._enabled
+
+    def getName(self) -> str:
+        return 'Extraction'
+
+    def getAcceptedShapes(self) -> list[str]:
+        return [InputShape.NUMBER_UNIT_SUFFIX, InputShape.UNIT_PREFIX_NUMBER, InputShape.OTHER]
+
+    def tryConvert(self, token: TokenizedText) -> tuple[bool, ConvertResult | None]:
+        results: list[ConvertResult] = []
+
+        for parsed in self._unitExtractor.extract(token.text):
+            success, result = parsed.converter.tryConvert(parsed.number, parsed.unit)
+
+            if not success or result is None:
+                continue
+
+            results.append(result)
+
+        if len(results) == 0:
+            return False, None
+
+        return True, self._buildResult(results[0], results[1:])
+
+    def refreshResult(self, result: ConvertResult) -> ConvertResult:
+        return result
+
+    def _buildResult(
+        self, result: ConvertResult, otherResults: list[ConvertResult]
+    ) -> ConvertResult:
+        """
+        Unit converter results are copied, not changed, as they may be shared
+        """
+
+        return ConvertResult(
+            result.iconText,
+            result.originalText,
+            result.convertedText,
+            f'{self.getName()}.{result.converterName}',
+            [self._buildResult(other, []) for other in otherResults],
+        )
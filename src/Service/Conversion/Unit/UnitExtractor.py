@@ -0,0 +1,190 @@
+import re
+from typing import Final
+
+from src.Constant.UnitPosition import UnitPosition
+from src.DTO.Converter.UnitParseResult import UnitParseResult
+from src.Service.Conversion.Unit.AhoCorasickAutomaton import AhoCorasickAutomaton
+from src.Service.Conversion.Unit.ThousandsDetector import ThousandsDetector
+from src.Service.Conversion.Unit.UnitConverterInterface import UnitConverterInterface
+from src.Service.Conversion.Unit.UnitToConverterMapper import UnitToConverterMapper
+from src.Service.EventService import EventService
+
+
+class UnitExtractor:
+    """
+    Finds all number and unit pairs in a longer text, e.g. "the box is 40 cm by 2 ft".
+
+    Unit aliases are found in a single pass by Aho-Corasick automaton, built from all aliases of
+    UnitToConverterMapper. Same as in TextLexer, whitespace is ignored inside aliases and between
+    number and unit. So the whole extraction is linear to the text length.
+    """
+
+    # Same number grammar as in TextLexer, except only a single separator is allowed before the
+    # first digit, so that matching is linear even on long runs of separators
+    _NUMBER_PATTERN: Final = re.compile(r'-?[,.]?\d[\d,.]*')
+
+    _unitToConverterMapper: UnitToConverterMapper
+    _thousandsDetector: ThousandsDetector
+
+    _automaton: AhoCorasickAutomaton | None
+    """Built on first use and after each units change"""
+
+    def __init__(
+        self,
+        unitToConverterMapper: UnitToConverterMapper,
+        thousandsDetector: ThousandsDetector,
+        events: EventService,
+    ):
+        self._unitToConverterMapper = unitToConverterMapper
+        self._thousandsDetector = thousandsDetector
+        self._automaton = None
+
+        events.subscribeDelayedConverterInitialized(self._onDelayedConverterInitialized)
+
+    def extract(self, text: str) -> list[UnitParseResult]:
+        """
+        :return: all found number and unit pairs, in order of the numbers in text
+        """
+
+        text = text.lower()
+
+        # Text without whitespace, where aliases are searched
+        compact: list[str] = []
+        # Original text index of each compact text character
+        compactToText: list[int] = []
+        # Count of non-whitespace characters before each original text index
+        textToCompact: list[int] = []
+
+        for index, char in enumerate(text):
+            textToCompact.append(len(compact))
+
+            if not char.isspace():
+                compact.append(char)
+                compactToText.append(index)
+
+        textToCompact.append(len(compact))
+
+        # Numbers by compact index, at which unit after the number would start
+        numbersBeforeUnit: dict[int, re.Match] = {}
+        # Numbers by compact index, at which unit before the number would end
+        numbersAfterUnit: dict[int, re.Match] = {}
+
+        for match in self._NUMBER_PATTERN.finditer(text):
+            numbersBeforeUnit[textToCompact[match.end()]] = match
+            numbersAfterUnit[textToCompact[match.start()]] = match
+
+        if self._automaton is None:
+            self._automaton = self._buildAutomaton()
+
+        usedNumbers: set[int] = set()
+        found: list[tuple[int, UnitParseResult]] = []
+
+        for end, aliases in self._automaton.findAll(''.join(compact)):
+            aliasEnd = compactToText[end - 1] + 1
+
+            for alias in aliases:
+                start = end - len(alias)
+                parsed = self._tryParseUnitAfter(
+                    text, alias, aliasEnd, numbersBeforeUnit.get(start)
+                )
+
+                if parsed is None:
+                    parsed = self._tryParseUnitBefore(
+                        text, alias, compactToText[start], aliasEnd, numbersAfterUnit.get(end)
+                    )
+
+                if parsed is None:
+                    continue
+
+                numberMatch, result = parsed
+
+                if numberMatch.start() in usedNumbers:
+                    continue
+
+                usedNumbers.add(numberMatch.start())
+                found.append((numberMatch.start(), result))
+
+                break
+
+        found.sort(key=lambda item: item[0])
+
+        return [result for _, result in found]
+
+    def _tryParseUnitAfter(
+        self, text: str, alias: str, aliasEnd: int, numberMatch: re.Match | None
+    ) -> tuple[re.Match, UnitParseResult] | None:
+        if numberMatch is None:
+            return None
+
+        converter = self._unitToConverterMapper.getConverter(alias, UnitPosition.AFTER)
+
+        if converter is None:
+            return None
+
+        # Neither number nor unit must be a part of a word, e.g. 'x5 m' or 'm' in '5 miles'
+        numberStart = numberMatch.start()
+
+        if numberStart > 0 and text[numberStart - 1].isalnum():
+            return None
+
+        if aliasEnd < len(text) and text[aliasEnd].isalnum():
+            return None
+
+        return self._parseNumber(numberMatch, alias, converter)
+
+    def _tryParseUnitBefore(
+        self,
+        text: str,
+        alias: str,
+        aliasStart: int,
+        aliasEnd: int,
+        numberMatch: re.Match | None,
+    ) -> tuple[re.Match, UnitParseResult] | None:
+        if numberMatch is None:
+            return None
+
+        converter = self._unitToConverterMapper.getConverter(alias, UnitPosition.BEFORE)
+
+        if converter is None:
+            return None
+
+        # Neither unit nor number must be a part of a word, e.g. 'z$5' or '$5x'
+        if aliasStart > 0 and text[aliasStart - 1].isalnum():
+            return None
+
+        numberEnd = numberMatch.end()
+
+        if numberEnd < len(text) and text[numberEnd].isalpha():
+            return None
+
+        # Word units before a number are common in regular text, e.g. 'all 5 boxes'.
+        # So only symbols can be separated by whitespace, e.g. '$ 5', but not 'eur 5'
+        if alias[-1].isalpha() and numberMatch.start() != aliasEnd:
+            return None
+
+        return self._parseNumber(numberMatch, alias, converter)
+
+    def _parseNumber(
+        self, numberMatch: re.Match, alias: str, converter: UnitConverterInterface
+    ) -> tuple[re.Match, UnitParseResult] | None:
+        numberText = numberMatch.group()
+        number: float | None
+
+        if ',' in numberText or '.' in numberText:
+            number = self._thousandsDetector.parseNumber(numberText)
+        else:
+            number = float(numberText)
+
+        if number is None:
+            return None
+
+        return numberMatch, UnitParseResult(number, alias, converter)
+
+    def _buildAutomaton(self) -> AhoCorasickAutomaton:
+        return AhoCorasickAutomaton(
+            set(self._unitToConverterMapper.getUnitIds(UnitPosition.BEFORE))
+            | set(self._unitToConverterMapper.getUnitIds(UnitPosition.AFTER))
+        )
+
+    def _onDelayedConverterInitialized(self, converter: UnitConverterInterface) -> None:
+        self._automaton = None
@@ -1,46 +1,38 @@
-import re
-from typing import Final
-
 from src.Constant.UnitPosition import UnitPosition
 from src.DTO.Converter.UnitParseResult import UnitParseResult
+from src.DTO.TokenizedText import TokenizedText
+from src.Service.Conversion.TextLexer import TextLexer
 from src.Service.Conversion.Unit.ThousandsDetector import ThousandsDetector
 from src.Service.Conversion.Unit.UnitConverterInterface import UnitConverterInterface
 from src.Service.Conversion.Unit.UnitToConverterMapper import UnitToConverterMapper
 
 
 class UnitParser:
-    # For debugging pattern see https://regexr.com/8ds6v
-    _PATTERN: Final = re.compile(r'^([^\d\s-]+)?(-?[\d,.]*\d[\d,.]*)([^\d\s]+3?)?')
-    _REGEX_GROUP_UNIT_BEFORE: Final = 1
-    _REGEX_GROUP_NUMBER: Final = 2
-    _REGEX_GROUP_UNIT_AFTER: Final = 3
-
+    _textLexer: TextLexer
     _thousandsDetector: ThousandsDetector
     _unitToConverterMapper: UnitToConverterMapper
 
     def __init__(
         self,
+        textLexer: TextLexer,
         unitToConverterMapper: UnitToConverterMapper,
         thousandsDetector: ThousandsDetector,
     ):
+        self._textLexer = textLexer
         self._thousandsDetector = thousandsDetector
         self._unitToConverterMapper = unitToConverterMapper
 
     def parseText(self, text: str) -> UnitParseResult | None:
-        # Remove all whitespace from anywhere in the string
-        textSplit = text.split()
-        text = ''.join(textSplit).lower()
-
-        # Test if it meets required format and split into groups
-        regexResult = re.match(self._PATTERN, text)
+        return self.parseToken(self._textLexer.tokenize(text.strip()))
 
-        if regexResult is None:
+    def parseToken(self, token: TokenizedText) -> UnitParseResult | None:
+        if token.number is None:
             return None
 
-        # Split into number and unit by regex groups
+        # Split into number and unit
         unit: str
-        unitBefore: str | None = regexResult.group(self._REGEX_GROUP_UNIT_BEFORE)
-        unitAfter: str | None = regexResult.group(self._REGEX_GROUP_UNIT_AFTER)
+        unitBefore = token.unitBefore
+        unitAfter = token.unitAfter
 
         if (unitBefore is not None) and (unitAfter is not None):
             return None
@@ -66,8 +58,13 @@ class UnitParser:
             return None
 
         # Parse number
-        numberString = regexResult.group(self._REGEX_GROUP_NUMBER)
-        number = self._thousandsDetector.parseNumber(numberString)
+        number: float | None
+
+        if token.hasSeparators:
+            number = self._thousandsDetector.parseNumber(token.number)
+        else:
+            # Only sign and digits, no need to detect separators
+            number = float(token.number)
 
         if number is None:
             return None
@@ -22,6 +22,9 @@ class UnitToConverterMapper:
     def getConverter(self, unit: str, unitPosition: str) -> None | UnitConverterInterface:
         return self._map[unitPosition].get(unit)
 
+    def getUnitIds(self, unitPosition: str) -> list[str]:
+        return list(self._map[unitPosition].keys())
+
     def _generateMap(
         self, converters: list[UnitConverterInterface]
     ) -> dict[str, UnitConverterInterface]:
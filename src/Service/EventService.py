@@ -1,59 +1,120 @@
+import collections
+import functools
+import threading
+import time
 from collections.abc import Callable
-
 from typing import Final
 
+from src.Constant.Logs import Logs
+from src.Constant.ThreadAffinity import ThreadAffinity
 from src.DTO.ConvertResult import ConvertResult
 from src.DTO.Event import Event
 from src.Service.Conversion.Unit.UnitConverterInterface import UnitConverterInterface
+from src.Service.EventStatsRecorder import EventStatsRecorder
+from src.Service.ExceptionHandler import ExceptionHandler
+from src.Service.Logger import Logger
 from src.Type.Types import DialogButtonsDict
 
 
 class EventService:
-    _ID_APP_LOOP_ITERATION: Final[str] = 'app_loop_iteration'
     _ID_CLIPBOARD_CHANGED: Final[str] = 'clipboard_changed'
     _ID_CONVERTED: Final[str] = 'converted'
     _ID_STATUSBAR_CLEAR: Final[str] = 'statusbar_clear'
     _ID_UPDATE_CHECK_COMPLETED: Final[str] = 'update_check_completed'
     _ID_DELAYED_CONVERTER_INITIALIZED: Final[str] = 'delayed_converter_initialized'
+    _ID_CONFIGURATION_CHANGED: Final[str] = 'configuration_changed'
+
+    _ID_WORKER_QUEUE: Final[str] = 'worker_queue'
+    """Used only for stats, for calls run in the worker thread"""
+
+    _WORKER_QUEUE_SIZE: Final[int] = 64
+
+    _logger: Logger
 
     _events: dict[str, Event]
 
-    def __init__(self):
+    _workerQueue: collections.deque[functools.partial[None]]
+    """Bounded, so the oldest calls are dropped if worker can't keep up"""
+    _workerCondition: threading.Condition
+    _worker: threading.Thread | None
+    _droppedCount: int
+    _uiExecutor: Callable[[Callable[[], None]], object] | None
+    _statsRecorder: EventStatsRecorder | None
+
+    def __init__(self, logger: Logger):
+        self._logger = logger
+
         self._events = {}
+        self._workerQueue = collections.deque(maxlen=self._WORKER_QUEUE_SIZE)
+        self._workerCondition = threading.Condition()
+        self._worker = None
+        self._droppedCount = 0
+        self._uiExecutor = None
+        self._statsRecorder = None
+
+    def setUiExecutor(self, executor: Callable[[Callable[[], None]], object]) -> None:
+        """
+        :param executor: schedules the given function to run in the UI thread, e.g. GLib.idle_add
+        """
+
+        self._uiExecutor = executor
 
-    def subscribeAppLoopIteration(self, callback: Callable[[], None]) -> None:
-        self._subscribe(self._ID_APP_LOOP_ITERATION, callback)
+    def setStatsRecorder(self, recorder: EventStatsRecorder | None) -> None:
+        """
+        :param recorder: records durations of all dispatches and subscriber calls. None to stop
+            recording
+        """
 
-    def dispatchAppLoopIteration(self) -> None:
-        self._dispatch(self._ID_APP_LOOP_ITERATION)
+        self._statsRecorder = recorder
 
-    def subscribeClipboardChanged(self, callback: Callable[[str | None], None]) -> None:
+        for event in self._events.values():
+            event.recordDuration = None if recorder is None else recorder.record
+
+    def getStatsRecorder(self) -> EventStatsRecorder | None:
+        return self._statsRecorder
+
+    def getDroppedCount(self) -> int:
+        """
+        :return: how many worker calls were dropped, because the queue was full
+        """
+
+        return self._droppedCount
+
+    def subscribeClipboardChanged(
+        self, callback: Callable[[str | None], None], affinity: str = ThreadAffinity.DISPATCHER
+    ) -> None:
         """Raised when clipboard content changes, but before parsing it.
 
         Content has whitespace trimmed.
         If content is too long and should not be parsed, event is called with None argument.
         """
-        self._subscribe(self._ID_CLIPBOARD_CHANGED, callback)
+        self._subscribe(self._ID_CLIPBOARD_CHANGED, callback, affinity)
 
     def dispatchClipboardChanged(self, content: str | None) -> None:
         self._dispatch(self._ID_CLIPBOARD_CHANGED, content)
 
-    def subscribeConverted(self, callback: Callable[[ConvertResult], None]) -> None:
+    def subscribeConverted(
+        self, callback: Callable[[ConvertResult], None], affinity: str = ThreadAffinity.DISPATCHER
+    ) -> None:
         """Raised when one of the converters successfully converted newly changed clipboard content."""
-        self._subscribe(self._ID_CONVERTED, callback)
+        self._subscribe(self._ID_CONVERTED, callback, affinity)
 
     def dispatchConverted(self, result: ConvertResult) -> None:
         self._dispatch(self._ID_CONVERTED, result)
 
-    def subscribeStatusbarClear(self, callback: Callable[[], None]) -> None:
+    def subscribeStatusbarClear(
+        self, callback: Callable[[], None], affinity: str = ThreadAffinity.DISPATCHER
+    ) -> None:
         """Raised when statusbar clear was triggered."""
-        self._subscribe(self._ID_STATUSBAR_CLEAR, callback)
+        self._subscribe(self._ID_STATUSBAR_CLEAR, callback, affinity)
 
     def dispatchStatusbarClear(self) -> None:
         self._dispatch(self._ID_STATUSBAR_CLEAR)
 
     def subscribeUpdateCheckCompleted(
-        self, callback: Callable[[str, DialogButtonsDict], None]
+        self,
+        callback: Callable[[str, DialogButtonsDict], None],
+        affinity: str = ThreadAffinity.DISPATCHER,
     ) -> None:
         """Raised when check for app updates is completed.
 
@@ -64,24 +125,91 @@ class EventService:
         - text: str, text to show in a dialog
         - buttons: DialogButtonsDict, buttons to show and their callbacks
         """
-        self._subscribe(self._ID_UPDATE_CHECK_COMPLETED, callback)
+        self._subscribe(self._ID_UPDATE_CHECK_COMPLETED, callback, affinity)
 
     def dispatchUpdateCheckCompleted(self, text: str, buttons: DialogButtonsDict) -> None:
         self._dispatch(self._ID_UPDATE_CHECK_COMPLETED, text, buttons)
 
     def subscribeDelayedConverterInitialized(
-        self, callback: Callable[[UnitConverterInterface], None]
+        self,
+        callback: Callable[[UnitConverterInterface], None],
+        affinity: str = ThreadAffinity.DISPATCHER,
     ) -> None:
-        self._subscribe(self._ID_DELAYED_CONVERTER_INITIALIZED, callback)
+        self._subscribe(self._ID_DELAYED_CONVERTER_INITIALIZED, callback, affinity)
 
     def dispatchDelayedConverterInitialized(self, converter: UnitConverterInterface) -> None:
         self._dispatch(self._ID_DELAYED_CONVERTER_INITIALIZED, converter)
 
-    def _subscribe(self, _eventId: str, callback: Callable) -> None:
+    def subscribeConfigurationChanged(
+        self, callback: Callable[[], None], affinity: str = ThreadAffinity.DISPATCHER
+    ) -> None:
+        """Raised when a state value is changed, e.g. from settings GUI."""
+        self._subscribe(self._ID_CONFIGURATION_CHANGED, callback, affinity)
+
+    def dispatchConfigurationChanged(self) -> None:
+        self._dispatch(self._ID_CONFIGURATION_CHANGED)
+
+    def _subscribe(self, _eventId: str, callback: Callable, affinity: str) -> None:
         if _eventId not in self._events:
-            self._events[_eventId] = Event()
+            event = Event()
+            event.eventId = _eventId
+
+            if self._statsRecorder is not None:
+                event.recordDuration = self._statsRecorder.record
+
+            self._events[_eventId] = event
+
+        if affinity == ThreadAffinity.WORKER:
+            callback = functools.partial(self._callInWorker, callback)
+        elif affinity == ThreadAffinity.UI:
+            callback = functools.partial(self._callInUi, callback)
 
         self._events[_eventId].append(callback)
 
     def _dispatch(self, _eventId: str, *args) -> None:
         self._events[_eventId](*args)
+
+    def _callInWorker(self, callback: Callable, *args) -> None:
+        with self._workerCondition:
+            if len(self._workerQueue) == self._WORKER_QUEUE_SIZE:
+                self._droppedCount += 1
+
+            self._workerQueue.append(functools.partial(callback, *args))
+            self._workerCondition.notify()
+
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._processWorkerQueue, daemon=True)
+                self._worker.start()
+
+    def _processWorkerQueue(self) -> None:
+        while True:
+            with self._workerCondition:
+                while len(self._workerQueue) == 0:
+                    self._workerCondition.wait()
+
+                call = self._workerQueue.popleft()
+
+            statsRecorder = self._statsRecorder
+            start = time.perf_counter_ns()
+
+            try:
+                call()
+            except Exception as e:
+                # Worker thread must keep running, otherwise all later worker calls are never run
+                self._logger.log(
+                    f'{Logs.catEvents}EXCEPTION in worker thread subscriber:\n'
+                    f'{ExceptionHandler.formatExceptionLog(e)}'
+                )
+            finally:
+                if statsRecorder is not None:
+                    statsRecorder.record(
+                        self._ID_WORKER_QUEUE, call.func, time.perf_counter_ns() - start
+                    )
+
+    def _callInUi(self, callback: Callable, *args) -> None:
+        if self._uiExecutor is None:
+            callback(*args)
+
+            return
+
+        self._uiExecutor(functools.partial(callback, *args))
@@ -0,0 +1,126 @@
+import collections
+import functools
+import threading
+from collections.abc import Callable
+from typing import Final
+
+from src.Constant.Logs import Logs
+from src.Service.Logger import Logger
+from src.Service.Scheduler import Scheduler
+
+
+class EventStatsRecorder:
+    """
+    Records event dispatch counts and durations, per event id and per subscriber callback.
+    Only the last samples are kept for each of them, so percentiles show recent behavior.
+
+    Thread safe, events are dispatched from multiple threads.
+    """
+
+    _SAMPLE_COUNT: Final[int] = 256
+    """Last samples kept per event id or subscriber"""
+    _LOG_INTERVAL: Final[float] = 300
+    _PERCENTILES: Final[list[int]] = [50, 90, 99]
+
+    _logger: Logger
+
+    _samples: dict[tuple[str, str | None], collections.deque[int]]
+    """Durations in nanoseconds, by event id and subscriber name. None subscriber for whole dispatch"""
+    _counts: dict[tuple[str, str | None], int]
+    _lock: threading.Lock
+    _recordedSinceLog: bool
+
+    def __init__(self, logger: Logger):
+        self._logger = logger
+        self._samples = {}
+        self._counts = {}
+        self._lock = threading.Lock()
+        self._recordedSinceLog = False
+
+    def startPeriodicLog(self, scheduler: Scheduler) -> None:
+        scheduler.schedulePeriodic(self._LOG_INTERVAL, self._logReport)
+
+    def record(self, eventId: str, subscriber: Callable | None, durationNs: int) -> None:
+        """
+        :param subscriber: None to record the whole dispatch of an event
+        """
+
+        key = (eventId, None if subscriber is None else self.describeCallback(subscriber))
+
+        with self._lock:
+            if key not in self._samples:
+                self._samples[key] = collections.deque(maxlen=self._SAMPLE_COUNT)
+                self._counts[key] = 0
+
+            self._samples[key].append(durationNs)
+            self._counts[key] += 1
+            self._recordedSinceLog = True
+
+    def getReport(self) -> str:
+        with self._lock:
+            samples = {key: sorted(durations) for key, durations in self._samples.items()}
+            counts = dict(self._counts)
+
+        if len(samples) == 0:
+            return 'No events dispatched yet'
+
+        lines = []
+        lastEventId = None
+
+        for eventId, subscriber in sorted(samples, key=lambda key: (key[0], key[1] or '')):
+            key = (eventId, subscriber)
+
+            if subscriber is None:
+                lines.append(f'{eventId}: {self._formatStats(samples[key], counts[key])}')
+            else:
+                if eventId != lastEventId:
+                    # Worker queue calls have no whole dispatch to show on the event line
+                    lines.append(f'{eventId}:')
+
+                lines.append(f'  {subscriber}: {self._formatStats(samples[key], counts[key])}')
+
+            lastEventId = eventId
+
+        return '\n'.join(lines)
+
+    @staticmethod
+    def describeCallback(callback: Callable) -> str:
+        if isinstance(callback, functools.partial):
+            # Subscribers with thread affinity are wrapped in a partial of the function, which
+            # passes the call to another thread
+            arguments = ', '.join(
+                EventStatsRecorder.describeCallback(argument)
+                for argument in callback.args
+                if callable(argument)
+            )
+
+            return f'{EventStatsRecorder.describeCallback(callback.func)}({arguments})'
+
+        return getattr(callback, '__qualname__', None) or repr(callback)
+
+    def _logReport(self) -> None:
+        with self._lock:
+            if not self._recordedSinceLog:
+                return
+
+            self._recordedSinceLog = False
+
+        self._logger.log(f'{Logs.catEvents}Dispatch stats:\n{self.getReport()}')
+
+    def _formatStats(self, ordered: list[int], count: int) -> str:
+        percentiles = ', '.join(
+            f'p{percentile} {self._formatDuration(self._percentile(ordered, percentile))}'
+            for percentile in self._PERCENTILES
+        )
+
+        return f'{count} calls, {percentiles}, max {self._formatDuration(ordered[-1])}'
+
+    @staticmethod
+    def _percentile(ordered: list[int], percentile: int) -> int:
+        index = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+
+        return ordered[index]
+
+    @staticmethod
+    def _formatDuration(durationNs: int) -> str:
+        return f'{durationNs / 1_000_000:.3f} ms'
@@ -0,0 +1,142 @@
+import collections
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Final, TextIO
+
+from src.Constant.Logs import Logs
+from src.DTO.ServiceContainer import ServiceContainer
+from src.Service.ArgumentParser import ArgumentParser
+from src.Service.Conversion.Unit.Currency.ConversionRateUpdater import ConversionRateUpdater
+from src.Service.HeadlessApp import HeadlessApp
+from src.Service.Logger import Logger
+
+
+class FileConverter:
+    """
+    Converts a large file line by line, same as HeadlessApp, but in multiple processes.
+
+    File is split into chunks at line boundaries. Each worker process builds its own conversion
+    services once and then reads and converts chunks by their byte ranges, so input is never sent
+    between processes. Results are written in the input order.
+    """
+
+    _CHUNK_SIZE: Final[int] = 4 * 1024 * 1024
+    _PENDING_CHUNKS_PER_WORKER: Final[int] = 2
+    """Limits how many converted chunks can wait in memory for the earlier ones to finish"""
+
+    _headlessApp: HeadlessApp
+    _conversionRateUpdater: ConversionRateUpdater
+    _argumentParser: ArgumentParser
+    _logger: Logger
+
+    _workerHeadlessApp: HeadlessApp | None = None
+    """Services of the current worker process, built once by _initializeWorker"""
+
+    def __init__(
+        self,
+        headlessApp: HeadlessApp,
+        conversionRateUpdater: ConversionRateUpdater,
+        argumentParser: ArgumentParser,
+        logger: Logger,
+    ):
+        self._headlessApp = headlessApp
+        self._conversionRateUpdater = conversionRateUpdater
+        self._argumentParser = argumentParser
+        self._logger = logger
+
+    def convertFile(self, inputPath: str, outputStream: TextIO, workersCount: int | None) -> None:
+        """
+        :param workersCount: None to use all CPU cores
+        """
+
+        chunks = self._splitChunks(inputPath)
+        workersCount = min(workersCount or os.cpu_count() or 1, len(chunks))
+
+        self._logger.log(
+            f'{Logs.catHeadless}Converting file {inputPath}: {len(chunks)} chunks, '
+            f'{workersCount} workers'
+        )
+
+        # Rates are loaded once here and passed to each worker only when it starts
+        self._conversionRateUpdater.initializeRates()
+
+        if workersCount <= 1:
+            # Not worth starting processes for a small file
+            for start, end in chunks:
+                outputStream.write(self._convertChunkWith(self._headlessApp, inputPath, start, end))
+
+            outputStream.flush()
+
+            return
+
+        pending: collections.deque[Future[str]] = collections.deque()
+        maxPending = workersCount * self._PENDING_CHUNKS_PER_WORKER
+
+        with ProcessPoolExecutor(
+            workersCount,
+            initializer=FileConverter._initializeWorker,
+            initargs=(self._argumentParser, self._conversionRateUpdater.getCurrencies()),
+        ) as executor:
+            for start, end in chunks:
+                if len(pending) >= maxPending:
+                    outputStream.write(pending.popleft().result())
+
+                pending.append(executor.submit(FileConverter._convertChunk, inputPath, start, end))
+
+            while len(pending) > 0:
+                outputStream.write(pending.popleft().result())
+
+        outputStream.flush()
+
+    def _splitChunks(self, inputPath: str) -> list[tuple[int, int]]:
+        """
+        :return: (start, end) byte offsets of each chunk. Chunks end right after a newline,
+            except the last one
+        """
+
+        fileSize = os.path.getsize(inputPath)
+        chunks: list[tuple[int, int]] = []
+        start = 0
+
+        with open(inputPath, 'rb') as file:
+            while start < fileSize:
+                file.seek(min(start + self._CHUNK_SIZE, fileSize))
+                file.readline()
+                end = min(file.tell(), fileSize)
+                chunks.append((start, end))
+                start = end
+
+        return chunks
+
+    @staticmethod
+    def _convertChunkWith(headlessApp: HeadlessApp, inputPath: str, start: int, end: int) -> str:
+        with open(inputPath, 'rb') as file:
+            file.seek(start)
+            data = file.read(end - start)
+
+        lines = data.split(b'\n')
+
+        if lines[-1] == b'':
+            # Chunk ends with a newline, not with an empty line
+            lines.pop()
+
+        return headlessApp.convertLines(lines)
+
+    @staticmethod
+    def _initializeWorker(argumentParser: ArgumentParser, currencies: dict | None) -> None:
+        # Imported here, as ServiceBuilder depends on this module
+        from src.Service.ServiceBuilder import ServiceBuilder
+
+        services: ServiceContainer = ServiceBuilder().initializeWorkerServices(
+            argumentParser, currencies
+        )
+        FileConverter._workerHeadlessApp = services[HeadlessApp]
+
+    @staticmethod
+    def _convertChunk(inputPath: str, start: int, end: int) -> str:
+        if FileConverter._workerHeadlessApp is None:
+            raise Exception('FileConverter worker process is not initialized')
+
+        return FileConverter._convertChunkWith(
+            FileConverter._workerHeadlessApp, inputPath, start, end
+        )
@@ -0,0 +1,96 @@
+import io
+import json
+from typing import BinaryIO, Final, TextIO
+
+from src.Constant.Logs import Logs
+from src.DTO.ConvertResult import ConvertResult
+from src.Service.Conversion.ConversionManager import ConversionManager
+from src.Service.Conversion.Unit.Currency.ConversionRateUpdater import ConversionRateUpdater
+from src.Service.Logger import Logger
+
+
+class HeadlessApp:
+    """
+    Converts text streamed line by line, without statusbar, clipboard watch or GUI.
+    For each input line, a single JSON line is written: conversion result or null
+    """
+
+    _READ_CHUNK_SIZE: Final[int] = 64 * 1024
+
+    _conversionManager: ConversionManager
+    _conversionRateUpdater: ConversionRateUpdater
+    _logger: Logger
+
+    def __init__(
+        self,
+        conversionManager: ConversionManager,
+        conversionRateUpdater: ConversionRateUpdater,
+        logger: Logger,
+    ):
+        self._conversionManager = conversionManager
+        self._conversionRateUpdater = conversionRateUpdater
+        self._logger = logger
+
+    def run(self, inputStream: BinaryIO, outputStream: TextIO) -> None:
+        """
+        Input is read in chunks of whatever is already available, and output is flushed once per
+        chunk. So piped input is converted at full speed, while interactive input still gets an
+        answer for each line right away
+
+        :param inputStream: binary, UTF-8 encoded. E.g. sys.stdin.buffer. Streams which are not
+            buffered are read line by line
+        """
+
+        self._conversionRateUpdater.initializeRates()
+        self._logger.log(f'{Logs.catHeadless}Converting lines from input')
+
+        pending = b''
+        linesCount = 0
+        readChunk = (
+            (lambda: inputStream.read1(self._READ_CHUNK_SIZE))
+            if isinstance(inputStream, io.BufferedIOBase)
+            else inputStream.readline
+        )
+
+        while chunk := readChunk():
+            lines = (pending + chunk).split(b'\n')
+            pending = lines.pop()
+
+            outputStream.write(self.convertLines(lines))
+            outputStream.flush()
+            linesCount += len(lines)
+
+        if pending != b'':
+            outputStream.write(self.convertLines([pending]))
+            outputStream.flush()
+            linesCount += 1
+
+        self._logger.log(f'{Logs.catHeadless}Input ended after {linesCount} lines')
+
+    def convertLines(self, lines: list[bytes]) -> str:
+        """
+        :param lines: UTF-8 encoded, without line endings
+        :return: JSON line for each input line, each ending with a newline
+        """
+
+        return ''.join([self._convertLine(line) for line in lines])
+
+    def _convertLine(self, line: bytes) -> str:
+        text = line.decode('utf-8', errors='replace').strip()
+        result = self._conversionManager.convert(text) if text != '' else None
+
+        return self._formatResult(result) + '\n'
+
+    def _formatResult(self, result: ConvertResult | None) -> str:
+        if result is None:
+            return 'null'
+
+        return json.dumps(
+            {
+                'iconText': result.iconText,
+                'originalText': result.originalText,
+                'convertedText': result.convertedText,
+                'converterName': result.converterName,
+            },
+            ensure_ascii=False,
+        )
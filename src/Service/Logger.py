@@ -3,8 +3,9 @@ import os.path
 import random
 import string
 import subprocess
+import sys
 import time
-from typing import Final
+from typing import Final, TextIO
 
 from src.Service.FilesystemHelper import FilesystemHelper
 
@@ -16,14 +17,28 @@ class Logger:
     instance = None
 
     _logPath: str
+    _printStream: TextIO
     _isDebugEnabled: bool
     _instanceId: str
 
-    def __init__(self, filesystemHelper: FilesystemHelper):
+    def __init__(
+        self,
+        filesystemHelper: FilesystemHelper,
+        printStream: TextIO = sys.stdout,
+        truncateLogFile: bool = True,
+    ):
+        """
+        :param printStream: where logs are printed, besides the log file. Headless mode uses
+            stderr, to keep stdout for conversion results only
+        :param truncateLogFile: False for headless runs and worker processes, which only append to
+            the log file of the desktop app or of the main process
+        """
+
+        self._printStream = printStream
         self._isDebugEnabled = False
         logFileName = 'log.txt' if filesystemHelper.isPackagedApp() else 'log.dev.txt'
         self._logPath = f'{filesystemHelper.getUserDataDir()}/{logFileName}'
-        self._initializeLogFile()
+        self._initializeLogFile(truncateLogFile)
         self._instanceId = ''.join(random.choices(string.ascii_lowercase + string.digits, k=3))
         Logger.instance = self
 
@@ -35,7 +50,7 @@ class Logger:
         self.logRaw(message)
 
     def logRaw(self, content: str) -> None:
-        print(content, end='')
+        print(content, end='', file=self._printStream)
 
         with open(self._logPath, 'a') as file:
             file.write(str(content))
@@ -49,11 +64,11 @@ class Logger:
         # Logger before Debug (ant its many dependencies) are fully initialized
         self._isDebugEnabled = enabled
 
-    def _initializeLogFile(self) -> None:
+    def _initializeLogFile(self, truncate: bool) -> None:
         if os.path.isdir(self._logPath):
             raise Exception('Cannot create log file, path is a directory: ' + self._logPath)
 
-        if os.path.exists(self._logPath):
+        if truncate and os.path.exists(self._logPath):
             self._truncateLogFile()
 
     def _truncateLogFile(self) -> None:
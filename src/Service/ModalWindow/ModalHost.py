@@ -0,0 +1,64 @@
+import functools
+from multiprocessing.connection import Connection
+from typing import TYPE_CHECKING
+
+from src.Constant.ModalHostMessage import ModalHostMessage
+from src.Service.ArgumentParser import ArgumentParser
+from src.Service.ModalWindow.ModalHostConnection import ModalHostConnection
+from src.Service.ModalWindow.Modals.ModalWindowBuilderInterface import ModalWindowBuilderInterface
+
+if TYPE_CHECKING:
+    # Not imported at runtime, as this module is also loaded in the app process, which must not
+    # load dpg
+    from src.Service.ModalWindow.ModalWindowRenderer import ModalWindowRenderer
+
+
+class ModalHost:
+    """
+    Runs in a separate modal host process, started by ModalWindowManagerOutOfProcess. Shows a single
+    modal window and exits after it's closed
+    """
+
+    _connection: ModalHostConnection
+    _renderer: ModalWindowRenderer
+    _builders: dict[str, ModalWindowBuilderInterface]
+
+    def __init__(
+        self,
+        connection: ModalHostConnection,
+        renderer: ModalWindowRenderer,
+        builders: dict[str, ModalWindowBuilderInterface],
+    ):
+        self._connection = connection
+        self._renderer = renderer
+        self._builders = builders
+
+    @staticmethod
+    def run(connection: Connection, argumentParser: ArgumentParser) -> None:
+        """Entry point of the modal host process"""
+
+        from src.Service.ServiceBuilder import ServiceBuilder
+
+        services = ServiceBuilder().initializeModalHostServices(argumentParser, connection)
+        services[ModalHost].serve()
+
+    def serve(self) -> None:
+        messageType, _id, arguments = self._connection.receive()
+
+        if messageType != ModalHostMessage.OPEN:
+            raise Exception(f'Unexpected first message from the app: {messageType}')
+
+        if _id not in self._builders:
+            raise Exception('Tried opening modal by non-existing id: ' + _id)
+
+        if 'buttons' in arguments:
+            # Callbacks are called in the app process, by their id
+            arguments['buttons'] = {
+                text: None
+                if callbackId is None
+                else functools.partial(self._connection.send, ModalHostMessage.CALLBACK, callbackId)
+                for text, callbackId in arguments['buttons'].items()
+            }
+
+        self._renderer.render(self._builders[_id], arguments)
+        self._connection.send(ModalHostMessage.CLOSED)
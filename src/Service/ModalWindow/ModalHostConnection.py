@@ -0,0 +1,43 @@
+import threading
+from multiprocessing.connection import Connection
+from typing import Any
+
+from src.Constant.ModalHostMessage import ModalHostMessage
+
+
+class ModalHostConnection:
+    """
+    Modal host process side of the pipe to the app. See ModalHostMessage for the protocol.
+
+    Thread safe, dpg calls button callbacks from its own thread
+    """
+
+    _connection: Connection
+    _lock: threading.Lock
+
+    def __init__(self, connection: Connection):
+        self._connection = connection
+        self._lock = threading.Lock()
+
+    def receive(self) -> tuple:
+        return self._connection.recv()
+
+    def send(self, messageType: str, *arguments) -> None:
+        with self._lock:
+            self._connection.send((messageType, *arguments))
+
+    def request(self, messageType: str, *arguments) -> Any:
+        """
+        Sends a message and blocks until the app replies to it
+
+        :return: replied value
+        """
+
+        with self._lock:
+            self._connection.send((messageType, *arguments))
+            replyType, value = self._connection.recv()
+
+        if replyType != ModalHostMessage.RESULT:
+            raise Exception(f'Unexpected reply from the app to {messageType}: {replyType}')
+
+        return value
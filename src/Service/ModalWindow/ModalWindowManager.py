@@ -1,43 +1,23 @@
-import threading
+from abc import ABC, abstractmethod
 from typing import Any
 
-import dearpygui.dearpygui as dpg
-import dearpygui_ext.themes
-
-from src.Constant.AppConstant import AppConstant
 from src.Constant.Logs import Logs
 from src.Constant.ModalId import ModalId
-from src.Service.FilesystemHelper import FilesystemHelper
 from src.Service.Logger import Logger
-from src.Service.ModalWindow.Modals.ModalWindowBuilderInterface import ModalWindowBuilderInterface
-from src.Service.OSSwitch import OSSwitch
 from src.Type.Types import DialogButtonsDict
 
 
-class ModalWindowManager:
+class ModalWindowManager(ABC):
     """
-    Based on Dear PyGui
-
-    See docs at: https://dearpygui.readthedocs.io
+    Opens modal windows, one at a time. Windows are shown with Dear PyGui, either in the app
+    process or in a separate modal host process
     """
 
-    _builders: dict[str, ModalWindowBuilderInterface]
-    _filesystemHelper: FilesystemHelper
-    _osSwitch: OSSwitch
     _logger: Logger
 
     _isModalOpen: bool
 
-    def __init__(
-        self,
-        builders: dict[str, ModalWindowBuilderInterface],
-        filesystemHelper: FilesystemHelper,
-        osSwitch: OSSwitch,
-        logger: Logger,
-    ):
-        self._builders = builders
-        self._filesystemHelper = filesystemHelper
-        self._osSwitch = osSwitch
+    def __init__(self, logger: Logger):
         self._logger = logger
 
         self._isModalOpen = False
@@ -55,7 +35,7 @@ class ModalWindowManager:
         self._openModalInternal(ModalId.CUSTOMIZED_DIALOG, {'text': text, 'buttons': buttons})
 
     def _openModalInternal(self, _id: str, arguments: dict[str, Any]):
-        if _id not in self._builders:
+        if not self._hasModal(_id):
             raise Exception('Tried opening modal by non-existing id: ' + _id)
 
         if self._isModalOpen:
@@ -66,71 +46,18 @@ class ModalWindowManager:
             return
 
         self._isModalOpen = True
-        self._showWindow(self._builders[_id], arguments)
-
-    def _showWindow(self, builder: ModalWindowBuilderInterface, arguments: dict[str, Any]) -> None:
-        if self._osSwitch.isLinux():
-            # On Linux, dpg UI is blocking, so we start it in a thread to allow other events to still function.
-            # Thread must be non-daemon for that to work.
-            # Some functions can still crash the app. E.g. opening GTK popup when settings are open
-            threading.Thread(target=lambda: self._buildWindow(builder, arguments)).start()
-
-            return
-
-        # On macOS, dpg UI seems to be non-blocking. Copy events are processed even with dpg open directly from
-        # rumps thread. Opening in a separate thread does not work on macOS, crashes saying that it must run
-        # from the main thread
-        self._buildWindow(builder, arguments)
-
-    def _buildWindow(self, builder: ModalWindowBuilderInterface, arguments: dict[str, Any]) -> None:
-        parameters = builder.getParameters()
-        logCategory = Logs.catModalSub + parameters.logCategory + '] '
-        self._logger.logDebug(logCategory + 'Initialize')
-
-        viewportTitle = AppConstant.APP_NAME
-        if parameters.title is not None:
-            viewportTitle = parameters.title + ' - ' + viewportTitle
-
-        dpg.create_context()
-        # Viewport is OS-drawn window
-        dpg.create_viewport(
-            title=viewportTitle,
-            width=parameters.width,
-            height=parameters.height,
-            # To position window at the center, we assume standard 1920x1080 resolution.
-            # Getting actual resolution is too complicated for very little benefit.
-            # dpg will always place window within monitor bounds, even if given position exceeds resolution.
-            x_pos=int(1920 / 2 - parameters.width / 2),
-            y_pos=int(1080 / 2 - parameters.height / 2) - 200,
-            min_width=parameters.width,
-            max_width=parameters.width,
-            min_height=parameters.height,
-            max_height=parameters.height,
-            resizable=False,
-        )
-
-        with dpg.font_registry():
-            defaultFont = dpg.add_font(
-                self._filesystemHelper.getAssetsDir() + '/font_supreme_regular.otf', 18
-            )
-            dpg.bind_font(defaultFont)
-
-        builder.reinitializeState()
+        self._showWindow(_id, arguments)
 
-        # Build dpg-window - one that appears inside the viewport
-        builder.build(arguments)
-
-        dpg.bind_theme(dearpygui_ext.themes.create_theme_imgui_dark())
-        dpg.setup_dearpygui()
-        dpg.show_viewport()
-
-        if parameters.primaryWindowTag:
-            dpg.set_primary_window(parameters.primaryWindowTag, True)
-
-        self._logger.logDebug(logCategory + 'Start')
-        dpg.start_dearpygui()
+    def _onWindowClosed(self) -> None:
+        self._isModalOpen = False
 
-        dpg.destroy_context()
-        self._logger.logDebug(logCategory + 'Closed')
+    @abstractmethod
+    def _hasModal(self, _id: str) -> bool:
+        pass
 
-        self._isModalOpen = False
+    @abstractmethod
+    def _showWindow(self, _id: str, arguments: dict[str, Any]) -> None:
+        """
+        Must call _onWindowClosed when the window is closed
+        """
+        pass
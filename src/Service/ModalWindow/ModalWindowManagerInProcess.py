@@ -0,0 +1,83 @@
+import threading
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from src.Service.Logger import Logger
+from src.Service.ModalWindow.Modals.ModalWindowBuilderInterface import ModalWindowBuilderInterface
+from src.Service.ModalWindow.ModalWindowManager import ModalWindowManager
+from src.Service.OSSwitch import OSSwitch
+
+if TYPE_CHECKING:
+    # Not imported at runtime, as it loads dpg. Renderer is built only when the first window is
+    # opened
+    from src.Service.ModalWindow.ModalWindowRenderer import ModalWindowRenderer
+
+
+class ModalWindowManagerInProcess(ModalWindowManager):
+    """Shows modal windows in the app process"""
+
+    _buildersFactory: Callable[[], dict[str, ModalWindowBuilderInterface]]
+    _rendererFactory: Callable[[], ModalWindowRenderer]
+    _osSwitch: OSSwitch
+
+    _builders: dict[str, ModalWindowBuilderInterface] | None
+    _renderer: ModalWindowRenderer | None
+
+    def __init__(
+        self,
+        buildersFactory: Callable[[], dict[str, ModalWindowBuilderInterface]],
+        rendererFactory: Callable[[], ModalWindowRenderer],
+        osSwitch: OSSwitch,
+        logger: Logger,
+    ):
+        super().__init__(logger)
+
+        self._buildersFactory = buildersFactory
+        self._rendererFactory = rendererFactory
+        self._osSwitch = osSwitch
+
+        self._builders = None
+        self._renderer = None
+
+    def _hasModal(self, _id: str) -> bool:
+        return _id in self._getBuilders()
+
+    def _showWindow(self, _id: str, arguments: dict[str, Any]) -> None:
+        builder = self._getBuilders()[_id]
+        renderer = self._getRenderer()
+
+        if self._osSwitch.isLinux():
+            # On Linux, dpg UI is blocking, so we start it in a thread to allow other events to still function.
+            # Thread must be non-daemon for that to work.
+            # Some functions can still crash the app. E.g. opening GTK popup when settings are open
+            threading.Thread(
+                target=lambda: self._renderWindow(renderer, builder, arguments)
+            ).start()
+
+            return
+
+        # On macOS, dpg UI seems to be non-blocking. Copy events are processed even with dpg open directly from
+        # rumps thread. Opening in a separate thread does not work on macOS, crashes saying that it must run
+        # from the main thread
+        self._renderWindow(renderer, builder, arguments)
+
+    def _getBuilders(self) -> dict[str, ModalWindowBuilderInterface]:
+        if self._builders is None:
+            self._builders = self._buildersFactory()
+
+        return self._builders
+
+    def _getRenderer(self) -> ModalWindowRenderer:
+        if self._renderer is None:
+            self._renderer = self._rendererFactory()
+
+        return self._renderer
+
+    def _renderWindow(
+        self,
+        renderer: ModalWindowRenderer,
+        builder: ModalWindowBuilderInterface,
+        arguments: dict[str, Any],
+    ) -> None:
+        renderer.render(builder, arguments)
+        self._onWindowClosed()
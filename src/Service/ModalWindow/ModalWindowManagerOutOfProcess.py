@@ -0,0 +1,141 @@
+import multiprocessing
+import threading
+from collections.abc import Callable
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Any, Final
+
+from src.Constant.Logs import Logs
+from src.Constant.ModalHostMessage import ModalHostMessage
+from src.Service.ArgumentParser import ArgumentParser
+from src.Service.Configuration import Configuration
+from src.Service.Conversion.Unit.Currency.CurrencyConverter import CurrencyConverter
+from src.Service.ExceptionHandler import ExceptionHandler
+from src.Service.Logger import Logger
+from src.Service.ModalWindow.ModalHost import ModalHost
+from src.Service.ModalWindow.ModalWindowManager import ModalWindowManager
+
+
+class ModalWindowManagerOutOfProcess(ModalWindowManager):
+    """
+    Shows each modal window in a new modal host process, which exits after the window is closed.
+    So dpg native libraries and GPU context are never loaded into the app process.
+
+    Modal host reads and writes config, gets currency list and calls button callbacks through
+    a pipe, see ModalHostMessage. Messages are served in a separate thread, while the window is open
+    """
+
+    _REQUEST_MESSAGES: Final[tuple[str, ...]] = (
+        ModalHostMessage.CONFIG_GET,
+        ModalHostMessage.APP_VERSION,
+        ModalHostMessage.CURRENCIES,
+    )
+    """Messages, for which the host waits for RESULT reply"""
+
+    _config: Configuration
+    _currencyConverter: CurrencyConverter
+    _argumentParser: ArgumentParser
+
+    def __init__(
+        self,
+        config: Configuration,
+        currencyConverter: CurrencyConverter,
+        argumentParser: ArgumentParser,
+        logger: Logger,
+    ):
+        super().__init__(logger)
+
+        self._config = config
+        self._currencyConverter = currencyConverter
+        self._argumentParser = argumentParser
+
+    def _hasModal(self, _id: str) -> bool:
+        # Builders exist only in the modal host process, which checks the id
+        return True
+
+    def _showWindow(self, _id: str, arguments: dict[str, Any]) -> None:
+        callbacks: dict[int, Callable] = {}
+
+        if 'buttons' in arguments:
+            buttons: dict[str, int | None] = {}
+
+            for text, callback in arguments['buttons'].items():
+                if callback is None:
+                    buttons[text] = None
+                else:
+                    buttons[text] = len(callbacks)
+                    callbacks[len(callbacks)] = callback
+
+            arguments = arguments | {'buttons': buttons}
+
+        # Spawned, not forked, so the host doesn't inherit GUI state of the app process.
+        # Daemon, so the host is terminated together with the app
+        context = multiprocessing.get_context('spawn')
+        appConnection, hostConnection = context.Pipe()
+        process = context.Process(
+            target=ModalHost.run, args=(hostConnection, self._argumentParser), daemon=True
+        )
+        process.start()
+        hostConnection.close()
+
+        appConnection.send((ModalHostMessage.OPEN, _id, arguments))
+        threading.Thread(
+            target=self._serveHost, args=(appConnection, process, callbacks), daemon=True
+        ).start()
+
+    def _serveHost(
+        self, connection: Connection, process: BaseProcess, callbacks: dict[int, Callable]
+    ) -> None:
+        try:
+            while True:
+                try:
+                    messageType, *messageArguments = connection.recv()
+                except EOFError:
+                    # Host process exited without closing the window properly
+                    break
+
+                if messageType == ModalHostMessage.CLOSED:
+                    break
+
+                try:
+                    self._handleMessage(connection, messageType, messageArguments, callbacks)
+                except Exception as e:
+                    # Host must still be served, otherwise it's never closed and process.join()
+                    # below blocks forever
+                    self._logger.log(
+                        f'{Logs.catModal}EXCEPTION when serving modal host message {messageType}:\n'
+                        f'{ExceptionHandler.formatExceptionLog(e)}'
+                    )
+
+                    if messageType in self._REQUEST_MESSAGES:
+                        connection.send((ModalHostMessage.RESULT, None))
+        finally:
+            connection.close()
+            process.join()
+
+            if process.exitcode != 0:
+                self._logger.log(
+                    f'{Logs.catModal}Modal host process exited with code {process.exitcode}'
+                )
+
+            self._onWindowClosed()
+
+    def _handleMessage(
+        self,
+        connection: Connection,
+        messageType: str,
+        messageArguments: list,
+        callbacks: dict[int, Callable],
+    ) -> None:
+        if messageType == ModalHostMessage.CONFIG_GET:
+            connection.send((ModalHostMessage.RESULT, self._config.get(messageArguments[0])))
+        elif messageType == ModalHostMessage.CONFIG_SET:
+            self._config.set(messageArguments[0], messageArguments[1])
+        elif messageType == ModalHostMessage.APP_VERSION:
+            connection.send((ModalHostMessage.RESULT, self._config.getAppVersion()))
+        elif messageType == ModalHostMessage.CURRENCIES:
+            connection.send((ModalHostMessage.RESULT, self._currencyConverter.getUnitsDefinition()))
+        elif messageType == ModalHostMessage.CALLBACK:
+            callbacks[messageArguments[0]]()
+        else:
+            raise Exception(f'Unknown message from modal host: {messageType}')
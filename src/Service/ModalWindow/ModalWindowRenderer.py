@@ -0,0 +1,116 @@
+import time
+from typing import Any
+
+import dearpygui.dearpygui as dpg
+import dearpygui_ext.themes
+
+from src.Constant.AppConstant import AppConstant
+from src.Constant.Logs import Logs
+from src.Service.FilesystemHelper import FilesystemHelper
+from src.Service.Logger import Logger
+from src.Service.ModalWindow.Modals.ModalWindowBuilderInterface import ModalWindowBuilderInterface
+
+
+class ModalWindowRenderer:
+    """
+    Shows a modal window with Dear PyGui. Each window gets its own dpg context, which is destroyed
+    when the window is closed
+
+    See docs at: https://dearpygui.readthedocs.io
+    """
+
+    _filesystemHelper: FilesystemHelper
+    _logger: Logger
+
+    _openCounts: dict[str, int]
+    """How many times each modal was opened, by log category. To compare first and later opens"""
+
+    def __init__(self, filesystemHelper: FilesystemHelper, logger: Logger):
+        self._filesystemHelper = filesystemHelper
+        self._logger = logger
+        self._openCounts = {}
+
+    def render(self, builder: ModalWindowBuilderInterface, arguments: dict[str, Any]) -> None:
+        """Blocks until the window is closed"""
+
+        parameters = builder.getParameters()
+        logCategory = Logs.catModalSub + parameters.logCategory + '] '
+        self._logger.logDebug(logCategory + 'Initialize')
+        timings: dict[str, float] = {}
+        phaseStart = time.perf_counter()
+
+        viewportTitle = AppConstant.APP_NAME
+        if parameters.title is not None:
+            viewportTitle = parameters.title + ' - ' + viewportTitle
+
+        dpg.create_context()
+        # Viewport is OS-drawn window
+        dpg.create_viewport(
+            title=viewportTitle,
+            width=parameters.width,
+            height=parameters.height,
+            # To position window at the center, we assume standard 1920x1080 resolution.
+            # Getting actual resolution is too complicated for very little benefit.
+            # dpg will always place window within monitor bounds, even if given position exceeds resolution.
+            x_pos=int(1920 / 2 - parameters.width / 2),
+            y_pos=int(1080 / 2 - parameters.height / 2) - 200,
+            min_width=parameters.width,
+            max_width=parameters.width,
+            min_height=parameters.height,
+            max_height=parameters.height,
+            resizable=False,
+        )
+
+        with dpg.font_registry():
+            defaultFont = dpg.add_font(
+                self._filesystemHelper.getAssetsDir() + '/font_supreme_regular.otf', 18
+            )
+            dpg.bind_font(defaultFont)
+
+        phaseStart = self._recordTiming(timings, 'context', phaseStart)
+        builder.reinitializeState()
+
+        # Build dpg-window - one that appears inside the viewport
+        builder.build(arguments)
+
+        phaseStart = self._recordTiming(timings, 'build', phaseStart)
+        dpg.bind_theme(dearpygui_ext.themes.create_theme_imgui_dark())
+        dpg.setup_dearpygui()
+        dpg.show_viewport()
+
+        if parameters.primaryWindowTag:
+            dpg.set_primary_window(parameters.primaryWindowTag, True)
+
+        phaseStart = self._recordTiming(timings, 'viewport', phaseStart)
+        # First frame is rendered separately, as it includes building font atlas
+        dpg.render_dearpygui_frame()
+        self._recordTiming(timings, 'first frame', phaseStart)
+        self._logTimings(logCategory, timings)
+
+        self._logger.logDebug(logCategory + 'Start')
+        dpg.start_dearpygui()
+
+        dpg.destroy_context()
+        self._logger.logDebug(logCategory + 'Closed')
+
+    @staticmethod
+    def _recordTiming(timings: dict[str, float], phase: str, phaseStart: float) -> float:
+        """
+        :return: start time of the next phase
+        """
+
+        now = time.perf_counter()
+        timings[phase] = now - phaseStart
+
+        return now
+
+    def _logTimings(self, logCategory: str, timings: dict[str, float]) -> None:
+        openCount = self._openCounts.get(logCategory, 0) + 1
+        self._openCounts[logCategory] = openCount
+
+        phases = ', '.join(
+            f'{phase} {duration * 1000:.1f} ms' for phase, duration in timings.items()
+        )
+        self._logger.logDebug(
+            f'{logCategory}Open #{openCount} took {sum(timings.values()) * 1000:.1f} ms: {phases}'
+        )
@@ -0,0 +1,28 @@
+from typing import Any
+
+from src.Constant.ModalHostMessage import ModalHostMessage
+from src.DTO.ConfigParameter import ConfigParameter
+from src.Service.Configuration import Configuration
+from src.Service.ModalWindow.ModalHostConnection import ModalHostConnection
+
+
+class RemoteConfiguration(Configuration):
+    """
+    Configuration for the modal host process. Values are read and written through the app's
+    Configuration, so the app applies changes immediately, same as with in-process windows
+    """
+
+    _connection: ModalHostConnection
+
+    def __init__(self, connection: ModalHostConnection):
+        # Config files are not loaded in this process, so parent is not initialized
+        self._connection = connection
+
+    def getAppVersion(self) -> str:
+        return self._connection.request(ModalHostMessage.APP_VERSION)
+
+    def get(self, parameter: ConfigParameter) -> Any:
+        return self._connection.request(ModalHostMessage.CONFIG_GET, parameter)
+
+    def set(self, parameter: ConfigParameter, value: Any) -> None:
+        self._connection.send(ModalHostMessage.CONFIG_SET, parameter, value)
@@ -0,0 +1,21 @@
+from src.Constant.ModalHostMessage import ModalHostMessage
+from src.DTO.Converter.CurrencyUnit import CurrencyUnit
+from src.DTO.Converter.UnitDefinition import UnitDefinition
+from src.Service.Conversion.Unit.Currency.CurrencyConverter import CurrencyConverter
+from src.Service.ModalWindow.ModalHostConnection import ModalHostConnection
+
+
+class RemoteCurrencyConverter(CurrencyConverter):
+    """
+    Currency list for the modal host process, taken from the app's CurrencyConverter. Only
+    getUnitsDefinition is supported, conversion is never done in the modal host process
+    """
+
+    _connection: ModalHostConnection
+
+    def __init__(self, connection: ModalHostConnection):
+        # Rates are not loaded in this process, so parent is not initialized
+        self._connection = connection
+
+    def getUnitsDefinition(self) -> dict[str, UnitDefinition[CurrencyUnit]]:
+        return self._connection.request(ModalHostMessage.CURRENCIES)
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+
+class PollableClipboardInterface(ABC):
+    """Clipboard without change notifications, which must be polled"""
+
+    @abstractmethod
+    def getChangeCount(self) -> int:
+        """
+        :return: counter, changed on each clipboard change. Must be cheap to call
+        """
+        pass
+
+    @abstractmethod
+    def pollClipboard(self) -> None:
+        """Processes clipboard changes since the last poll, if there were any"""
+        pass
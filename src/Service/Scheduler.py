@@ -0,0 +1,146 @@
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Callable
+from typing import Final
+
+from src.Constant.Logs import Logs
+from src.DTO.ScheduledJob import ScheduledJob
+from src.Service.ExceptionHandler import ExceptionHandler
+from src.Service.Logger import Logger
+
+
+class Scheduler:
+    """
+    Timer queue, which runs jobs in a single thread, each at its own deadline. The thread sleeps
+    until the nearest deadline, instead of waking up at a fixed interval to check all jobs.
+
+    Jobs can be scheduled and cancelled from any thread.
+    """
+
+    _MAX_WAIT: Final[float] = 60
+    """
+    Deadlines are wall clock time, which keeps running while the computer is asleep, unlike the wait
+    timeout. So long waits are cut, to notice passed deadlines soon after wake up
+    """
+
+    _logger: Logger
+
+    _jobs: list[ScheduledJob]
+    """Heap, ordered by deadline"""
+    _condition: threading.Condition
+    _sequence: itertools.count
+
+    def __init__(self, logger: Logger):
+        self._logger = logger
+        self._jobs = []
+        self._condition = threading.Condition()
+        self._sequence = itertools.count()
+
+    def scheduleOnce(self, delay: float, callback: Callable[[], None]) -> ScheduledJob:
+        """
+        :param delay: seconds until the job runs
+        """
+
+        return self._schedule(
+            ScheduledJob(callback, time.time() + delay, None, next(self._sequence))
+        )
+
+    def schedulePeriodic(
+        self, interval: float, callback: Callable[[], None], initialDelay: float | None = None
+    ) -> ScheduledJob:
+        """
+        :param interval: seconds between runs
+        :param initialDelay: seconds until the first run. None to wait for the whole interval
+        """
+
+        delay = interval if initialDelay is None else initialDelay
+
+        return self._schedule(
+            ScheduledJob(callback, time.time() + delay, interval, next(self._sequence))
+        )
+
+    def cancel(self, job: ScheduledJob | None) -> None:
+        """
+        :param job: None is ignored, for convenience
+        """
+
+        if job is None:
+            return
+
+        with self._condition:
+            # Removed from the heap lazily, when its deadline comes
+            job.cancelled = True
+
+    def run(self) -> None:
+        """Blocks the calling thread and runs jobs forever"""
+
+        while True:
+            self.runDueJobs()
+
+            with self._condition:
+                # Deadline is read again under the lock, so a job scheduled after runDueJobs()
+                # returned is not missed. Wait is interrupted if a job with an earlier deadline
+                # is scheduled while waiting
+                timeout = self._getTimeUntilNextDeadline()
+
+                if timeout is None or timeout > 0:
+                    self._condition.wait(
+                        self._MAX_WAIT if timeout is None else min(timeout, self._MAX_WAIT)
+                    )
+
+    def runDueJobs(self) -> float | None:
+        """
+        :return: seconds until the next deadline. None if there are no jobs
+        """
+
+        while True:
+            with self._condition:
+                timeUntilDeadline = self._getTimeUntilNextDeadline()
+
+                if timeUntilDeadline is None or timeUntilDeadline > 0:
+                    return timeUntilDeadline
+
+                job = self._jobs[0]
+
+                if job.interval is None:
+                    heapq.heappop(self._jobs)
+                else:
+                    # Next run is counted from now, so missed runs, e.g. while asleep, are not repeated
+                    job.deadline = time.time() + job.interval
+                    heapq.heapreplace(self._jobs, job)
+
+            # Callback is called without the lock, so it can schedule more jobs
+            self._runJob(job)
+
+    def _getTimeUntilNextDeadline(self) -> float | None:
+        """
+        Must be called with the condition lock held
+
+        :return: seconds, zero or negative if the nearest job is due. None if there are no jobs
+        """
+
+        while len(self._jobs) > 0 and self._jobs[0].cancelled:
+            heapq.heappop(self._jobs)
+
+        if len(self._jobs) == 0:
+            return None
+
+        return self._jobs[0].deadline - time.time()
+
+    def _schedule(self, job: ScheduledJob) -> ScheduledJob:
+        with self._condition:
+            heapq.heappush(self._jobs, job)
+            self._condition.notify()
+
+        return job
+
+    def _runJob(self, job: ScheduledJob) -> None:
+        try:
+            job.callback()
+        except Exception as e:
+            self._logger.log(
+                f'{Logs.catScheduler}EXCEPTION in scheduled job:\n'
+                f'{ExceptionHandler.formatExceptionLog(e)}'
+            )
@@ -1,3 +1,8 @@
+import sys
+from collections.abc import Callable
+from typing import TYPE_CHECKING, TextIO, TypeVar
+
+from src.Constant.ConfigId import ConfigId
 from src.Constant.ModalId import ModalId
 from src.DTO.ServiceContainer import ServiceContainer
 from src.Service.AppLoop import AppLoop
@@ -7,8 +12,10 @@ from src.Service.ClipboardManager import ClipboardManager
 from src.Service.ConfigFileManager import ConfigFileManager
 from src.Service.Configuration import Configuration
 from src.Service.Conversion.ConversionManager import ConversionManager
+from src.Service.Conversion.ConversionResultCache import ConversionResultCache
 from src.Service.Conversion.ConverterInterface import ConverterInterface
 from src.Service.Conversion.Rounder import Rounder
+from src.Service.Conversion.TextLexer import TextLexer
 from src.Service.Conversion.Timestamp.TimestampConverter import TimestampConverter
 from src.Service.Conversion.Timestamp.TimestampTextFormatter import TimestampTextFormatter
 from src.Service.Conversion.Unit.Currency.ConversionRateUpdater import ConversionRateUpdater
@@ -20,58 +27,252 @@ from src.Service.Conversion.Unit.MetricImperial.WeightConverter import WeightCon
 from src.Service.Conversion.Unit.ThousandsDetector import ThousandsDetector
 from src.Service.Conversion.Unit.UnitConverter import UnitConverter
 from src.Service.Conversion.Unit.UnitConverterInterface import UnitConverterInterface
+from src.Service.Conversion.Unit.UnitExtractionConverter import UnitExtractionConverter
+from src.Service.Conversion.Unit.UnitExtractor import UnitExtractor
 from src.Service.Conversion.Unit.UnitParser import UnitParser
 from src.Service.Conversion.Unit.UnitToConverterMapper import UnitToConverterMapper
 from src.Service.Debug import Debug
 from src.Service.EventService import EventService
+from src.Service.EventStatsRecorder import EventStatsRecorder
 from src.Service.ExceptionHandler import ExceptionHandler
 from src.Service.FilesystemHelper import FilesystemHelper
 from src.Service.Logger import Logger
-from src.Service.ModalWindow.Modals.AboutBuilder import AboutBuilder
-from src.Service.ModalWindow.Modals.CustomizedDialogBuilder import CustomizedDialogBuilder
-from src.Service.ModalWindow.Modals.DemoBuilder import DemoBuilder
-from src.Service.ModalWindow.Modals.MissingXselBuilder import DialogMissingXselBuilder
-from src.Service.ModalWindow.Modals.ModalWindowBuilderInterface import ModalWindowBuilderInterface
-from src.Service.ModalWindow.Modals.SettingsBuilder import SettingsBuilder
-from src.Service.ModalWindow.ModalWindowManager import ModalWindowManager
 from src.Service.OSSwitch import OSSwitch
-from src.Service.StatusbarApp import StatusbarApp
+from src.Service.Scheduler import Scheduler
 from src.Service.UpdateManager import UpdateManager
 
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+
+    from src.Service.ModalWindow.Modals.ModalWindowBuilderInterface import (
+        ModalWindowBuilderInterface,
+    )
+    from src.Service.ModalWindow.ModalWindowManager import ModalWindowManager
+    from src.Service.ModalWindow.ModalWindowRenderer import ModalWindowRenderer
+    from src.Service.StartupProfiler import StartupProfiler
+    from src.Service.StatusbarApp import StatusbarApp
+
 # mypy: disable-error-code="type-abstract"
 
 
 class ServiceBuilder:
+    T = TypeVar('T')
+
+    _profiler: StartupProfiler | None
     _initialized: bool
 
-    def __init__(self):
+    def __init__(self, profiler: StartupProfiler | None = None):
+        self._profiler = profiler
         self._initialized = False
 
-    def initializeServices(self) -> ServiceContainer:
+    def initializeServices(self, argumentParser: ArgumentParser) -> ServiceContainer:
+        """
+        Core services are built right away. App and GUI services are built on the first access,
+        together with their deferred imports of GUI libraries
+        """
+
+        # GUI modules are imported only here, so headless mode doesn't load them
+        from src.Service.ModalWindow.ModalWindowManager import ModalWindowManager
+        from src.Service.StatusbarApp import StatusbarApp
+
+        _ = self._measure(
+            'Core services', lambda: self._initializeCoreServices(argumentParser, sys.stdout)
+        )
+
+        # GUI services
+        _.setFactory(
+            ModalWindowManager,
+            lambda: self._getModalWindowManager(
+                _[OSSwitch],
+                _[Configuration],
+                _[ConfigFileManager],
+                _[FilesystemHelper],
+                _[CurrencyConverter],
+                argumentParser,
+                _[Logger],
+            ),
+        )
+
+        # App services
+        _.setFactory(
+            UpdateManager,
+            lambda: UpdateManager(
+                _[FilesystemHelper],
+                _[EventService],
+                _[Scheduler],
+                _[Configuration],
+                _[Logger],
+                _[Debug],
+            ),
+        )
+        _.setFactory(
+            AutostartManager,
+            lambda: self._getAutostartManager(
+                _[OSSwitch], _[FilesystemHelper], _[Configuration], argumentParser, _[Logger]
+            ),
+        )
+        _.setFactory(
+            ClipboardManager,
+            lambda: self._getClipboardManager(
+                _[OSSwitch],
+                _[EventService],
+                _[Configuration],
+                _[Logger],
+                _[ModalWindowManager],
+                _[FilesystemHelper],
+            ),
+        )
+        _.setFactory(
+            StatusbarApp,
+            lambda: self._getStatusbarApp(
+                _[OSSwitch],
+                _[TimestampTextFormatter],
+                _[ClipboardManager],
+                _[ConversionManager],
+                _[EventService],
+                _[Configuration],
+                _[ConfigFileManager],
+                _[AutostartManager],
+                _[UpdateManager],
+                _[ModalWindowManager],
+                _[FilesystemHelper],
+                _[Logger],
+                _[Debug],
+            ),
+        )
+        _.setFactory(
+            AppLoop, lambda: self._getAppLoop(_[OSSwitch], _[Scheduler], _[ClipboardManager])
+        )
+
+        return _
+
+    def initializeHeadlessServices(self, argumentParser: ArgumentParser) -> ServiceContainer:
+        """Only conversion services, without statusbar, clipboard and GUI"""
+
+        from src.Service.FileConverter import FileConverter
+        from src.Service.HeadlessApp import HeadlessApp
+
+        # Log file is shared with the desktop app, which may be running
+        _ = self._initializeCoreServices(argumentParser, sys.stderr, truncateLogFile=False)
+        _[HeadlessApp] = headlessApp = HeadlessApp(
+            _[ConversionManager], _[ConversionRateUpdater], _[Logger]
+        )
+        _[FileConverter] = FileConverter(
+            headlessApp, _[ConversionRateUpdater], argumentParser, _[Logger]
+        )
+
+        return _
+
+    def initializeWorkerServices(
+        self, argumentParser: ArgumentParser, currencies: dict | None
+    ) -> ServiceContainer:
+        """
+        Conversion services for FileConverter worker processes
+
+        :param currencies: currency rates loaded by the main process
+        """
+
+        from src.Service.HeadlessApp import HeadlessApp
+
+        _ = self._initializeCoreServices(argumentParser, sys.stderr, True)
+        _[HeadlessApp] = HeadlessApp(_[ConversionManager], _[ConversionRateUpdater], _[Logger])
+
+        if currencies is not None:
+            _[CurrencyConverter].refreshUnits(currencies)
+
+        return _
+
+    def initializeModalHostServices(
+        self, argumentParser: ArgumentParser, connection: Connection
+    ) -> ServiceContainer:
+        """
+        Services for the modal host process. Config and currencies are taken from the app process
+        through the connection
+
+        :param connection: pipe to the app process
+        """
+
+        from src.Service.ModalWindow.ModalHost import ModalHost
+        from src.Service.ModalWindow.ModalHostConnection import ModalHostConnection
+        from src.Service.ModalWindow.RemoteConfiguration import RemoteConfiguration
+        from src.Service.ModalWindow.RemoteCurrencyConverter import RemoteCurrencyConverter
+
+        if self._initialized:
+            raise Exception('Services are already initialize, cannot initialize again')
+
+        self._initialized = True
+
+        _ = ServiceContainer(self._profiler)
+
+        _[OSSwitch] = osSwitch = OSSwitch()
+        _[FilesystemHelper] = filesystemHelper = self._getFilesystemHelper(osSwitch)
+        _[Logger] = logger = Logger(filesystemHelper, sys.stderr, False)
+        # Unhandled exception exits the host process, then the app sees the window as closed
+        ExceptionHandler.initialize()
+
+        _[ModalHostConnection] = hostConnection = ModalHostConnection(connection)
+        _[ConfigFileManager] = configFileManager = ConfigFileManager(filesystemHelper, logger)
+        _[Configuration] = config = RemoteConfiguration(hostConnection)
+        _[Debug] = debug = Debug(config, argumentParser)
+        logger.setDebugEnabled(debug.isDebugEnabled())
+
+        _[ModalHost] = ModalHost(
+            hostConnection,
+            self._getModalWindowRenderer(filesystemHelper, logger),
+            self._getModalWindowBuilders(
+                config,
+                configFileManager,
+                filesystemHelper,
+                RemoteCurrencyConverter(hostConnection),
+                logger,
+            ),
+        )
+
+        return _
+
+    def _initializeCoreServices(
+        self,
+        argumentParser: ArgumentParser,
+        logPrintStream: TextIO,
+        isWorkerProcess: bool = False,
+        truncateLogFile: bool = True,
+    ) -> ServiceContainer:
         if self._initialized:
             raise Exception('Services are already initialize, cannot initialize again')
 
         self._initialized = True
 
-        _ = ServiceContainer()
+        _ = ServiceContainer(self._profiler)
 
         # Core services
         _[OSSwitch] = osSwitch = OSSwitch()
         _[FilesystemHelper] = filesystemHelper = self._getFilesystemHelper(osSwitch)
-        _[Logger] = logger = Logger(filesystemHelper)
+        _[Logger] = logger = Logger(
+            filesystemHelper, logPrintStream, truncateLogFile and not isWorkerProcess
+        )
 
-        logger.logRaw(filesystemHelper.getInitializationLogs())
-        ExceptionHandler.initialize()
+        if not isWorkerProcess:
+            # Exceptions in worker processes are passed to the main process by the process pool
+            logger.logRaw(filesystemHelper.getInitializationLogs())
+            ExceptionHandler.initialize()
 
+        _[EventService] = events = EventService(logger)
+        _[Scheduler] = scheduler = Scheduler(logger)
         _[ConfigFileManager] = configFileManager = ConfigFileManager(filesystemHelper, logger)
-        _[Configuration] = config = Configuration(filesystemHelper, configFileManager, logger)
-        _[ArgumentParser] = argumentParser = ArgumentParser()
+        _[Configuration] = config = Configuration(
+            filesystemHelper, configFileManager, events, logger
+        )
+        _[ArgumentParser] = argumentParser
         _[Debug] = debug = Debug(config, argumentParser)
-        _[EventService] = events = EventService()
+
+        if debug.isDebugEnabled() and not isWorkerProcess:
+            _[EventStatsRecorder] = eventStatsRecorder = EventStatsRecorder(logger)
+            events.setStatsRecorder(eventStatsRecorder)
+            eventStatsRecorder.startPeriodicLog(scheduler)
 
         # Conversion services
         _[TimestampTextFormatter] = timestampTextFormatter = TimestampTextFormatter(config)
-        _[ConversionManager] = conversionManager = self.getConversionManager(
+        _[ConversionManager] = self.getConversionManager(
             _,
             filesystemHelper,
             timestampTextFormatter,
@@ -80,46 +281,17 @@ class ServiceBuilder:
             logger,
             osSwitch,
             events,
+            scheduler,
             debug,
         )
-        currencyConverter: CurrencyConverter = _[CurrencyConverter]
 
-        # GUI services
-        _[list[ModalWindowBuilderInterface]] = modalWindowBuilders = self._getModalWindowBuilders(
-            config, configFileManager, filesystemHelper, currencyConverter, logger
-        )
-        _[ModalWindowManager] = modalWindowManager = ModalWindowManager(
-            modalWindowBuilders, filesystemHelper, osSwitch, logger
-        )
+        return _
 
-        # App services
-        _[UpdateManager] = updateManager = UpdateManager(
-            filesystemHelper, events, config, logger, debug
-        )
-        _[AutostartManager] = autostartManager = self._getAutostartManager(
-            osSwitch, filesystemHelper, config, argumentParser, logger
-        )
-        _[ClipboardManager] = clipboardManager = self._getClipboardManager(
-            osSwitch, events, logger, modalWindowManager, filesystemHelper
-        )
-        _[StatusbarApp] = self._getStatusbarApp(
-            osSwitch,
-            timestampTextFormatter,
-            clipboardManager,
-            conversionManager,
-            events,
-            config,
-            configFileManager,
-            autostartManager,
-            updateManager,
-            modalWindowManager,
-            filesystemHelper,
-            logger,
-            debug,
-        )
-        _[AppLoop] = self._getAppLoop(osSwitch, events, clipboardManager)
+    def _measure(self, name: str, function: Callable[[], T]) -> T:
+        if self._profiler is None:
+            return function()
 
-        return _
+        return self._profiler.measureService(name, function)
 
     def _getFilesystemHelper(self, osSwitch: OSSwitch) -> FilesystemHelper:
         if osSwitch.isMacOS():
@@ -141,14 +313,27 @@ class ServiceBuilder:
         logger: Logger,
         osSwitch: OSSwitch,
         events: EventService,
+        scheduler: Scheduler,
         debug: Debug,
+        stages: ServiceContainer | None = None,
     ) -> ConversionManager:
+        """
+        :param stages: if given, each conversion stage is also added to it, e.g. for the per-stage
+            benchmark. App container doesn't need them
+        """
+
         rounder = Rounder()
         _[CurrencyConverter] = currencyConverter = CurrencyConverter(
             rounder, events, config, logger
         )
         _[ConversionRateUpdater] = ConversionRateUpdater(
-            currencyConverter, filesystemHelper, argumentParser, config, events, osSwitch, logger
+            currencyConverter,
+            filesystemHelper,
+            argumentParser,
+            config,
+            scheduler,
+            osSwitch,
+            logger,
         )
 
         unitBeforeConverters: list[UnitConverterInterface] = [
@@ -167,15 +352,70 @@ class ServiceBuilder:
             unitBeforeConverters, unitAfterConverters, events
         )
 
-        thousandsDetector = ThousandsDetector()
-        _[UnitParser] = unitParser = UnitParser(unitToConverterMapper, thousandsDetector)
+        _[TextLexer] = textLexer = TextLexer()
+        thousandsDetector = ThousandsDetector(config.get(ConfigId.Converter_AmbiguousSeparator))
+        _[UnitParser] = unitParser = UnitParser(textLexer, unitToConverterMapper, thousandsDetector)
+
+        _[UnitExtractor] = unitExtractor = UnitExtractor(
+            unitToConverterMapper, thousandsDetector, events
+        )
 
         converters: list[ConverterInterface] = [
             TimestampConverter(timestampTextFormatter, config, logger),
             UnitConverter(unitParser),
+            UnitExtractionConverter(unitExtractor, config),
         ]
 
-        return ConversionManager(converters, events, config, logger, debug)
+        _[ConversionResultCache] = conversionResultCache = ConversionResultCache(events)
+
+        if stages is not None:
+            stages[Rounder] = rounder
+            stages[list[UnitConverterInterface]] = unitAfterConverters
+            stages[UnitToConverterMapper] = unitToConverterMapper
+            stages[TextLexer] = textLexer
+            stages[ThousandsDetector] = thousandsDetector
+            stages[UnitParser] = unitParser
+            stages[list[ConverterInterface]] = converters
+
+        return ConversionManager(
+            converters, textLexer, conversionResultCache, events, scheduler, config, logger, debug
+        )
+
+    def _getModalWindowManager(
+        self,
+        osSwitch: OSSwitch,
+        config: Configuration,
+        configFileManager: ConfigFileManager,
+        filesystemHelper: FilesystemHelper,
+        currencyConverter: CurrencyConverter,
+        argumentParser: ArgumentParser,
+        logger: Logger,
+    ) -> ModalWindowManager:
+        if config.get(ConfigId.Modal_OutOfProcess):
+            from src.Service.ModalWindow.ModalWindowManagerOutOfProcess import (
+                ModalWindowManagerOutOfProcess,
+            )
+
+            return ModalWindowManagerOutOfProcess(config, currencyConverter, argumentParser, logger)
+
+        from src.Service.ModalWindow.ModalWindowManagerInProcess import ModalWindowManagerInProcess
+
+        # Builders and renderer import dpg, so they are built only when the first window is opened
+        return ModalWindowManagerInProcess(
+            lambda: self._getModalWindowBuilders(
+                config, configFileManager, filesystemHelper, currencyConverter, logger
+            ),
+            lambda: self._getModalWindowRenderer(filesystemHelper, logger),
+            osSwitch,
+            logger,
+        )
+
+    def _getModalWindowRenderer(
+        self, filesystemHelper: FilesystemHelper, logger: Logger
+    ) -> ModalWindowRenderer:
+        from src.Service.ModalWindow.ModalWindowRenderer import ModalWindowRenderer
+
+        return ModalWindowRenderer(filesystemHelper, logger)
 
     def _getModalWindowBuilders(
         self,
@@ -185,6 +425,12 @@ class ServiceBuilder:
         currencyConverter: CurrencyConverter,
         logger: Logger,
     ) -> dict[str, ModalWindowBuilderInterface]:
+        from src.Service.ModalWindow.Modals.AboutBuilder import AboutBuilder
+        from src.Service.ModalWindow.Modals.CustomizedDialogBuilder import CustomizedDialogBuilder
+        from src.Service.ModalWindow.Modals.DemoBuilder import DemoBuilder
+        from src.Service.ModalWindow.Modals.MissingXselBuilder import DialogMissingXselBuilder
+        from src.Service.ModalWindow.Modals.SettingsBuilder import SettingsBuilder
+
         customizedDialogBuilder = CustomizedDialogBuilder(filesystemHelper)
 
         return {
@@ -218,6 +464,7 @@ class ServiceBuilder:
         self,
         osSwitch: OSSwitch,
         eventService: EventService,
+        config: Configuration,
         logger: Logger,
         modalWindowManager: ModalWindowManager,
         filesystemHelper: FilesystemHelper,
@@ -225,11 +472,18 @@ class ServiceBuilder:
         if osSwitch.isMacOS():
             from src.Service.ClipboardManagerMacOs import ClipboardManagerMacOs
 
-            return ClipboardManagerMacOs(eventService, logger)
-        else:
-            from src.Service.ClipboardManagerLinux import ClipboardManagerLinux
+            return ClipboardManagerMacOs(eventService, config, logger)
+
+        from src.Service.ClipboardManagerWayland import ClipboardManagerWayland
 
-            return ClipboardManagerLinux(eventService, logger, modalWindowManager, filesystemHelper)
+        if ClipboardManagerWayland.isSupported():
+            return ClipboardManagerWayland(eventService, config, logger)
+
+        from src.Service.ClipboardManagerLinux import ClipboardManagerLinux
+
+        return ClipboardManagerLinux(
+            eventService, config, logger, modalWindowManager, filesystemHelper
+        )
 
     def _getStatusbarApp(
         self,
@@ -285,7 +539,7 @@ class ServiceBuilder:
             )
 
     def _getAppLoop(
-        self, osSwitch: OSSwitch, events: EventService, clipboardManager: ClipboardManager
+        self, osSwitch: OSSwitch, scheduler: Scheduler, clipboardManager: ClipboardManager
     ) -> AppLoop:
         if osSwitch.isMacOS():
             from src.Service.AppLoopMacOs import AppLoopMacOs
@@ -294,8 +548,8 @@ class ServiceBuilder:
             if not isinstance(clipboardManager, ClipboardManagerMacOs):
                 raise Exception('Invalid type: ClipboardManager must be macOS version')
 
-            return AppLoopMacOs(events, clipboardManager)
+            return AppLoopMacOs(scheduler, clipboardManager)
         else:
             from src.Service.AppLoopLinux import AppLoopLinux
 
-            return AppLoopLinux(events)
+            return AppLoopLinux(scheduler)
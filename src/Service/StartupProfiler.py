@@ -0,0 +1,201 @@
+import importlib.abc
+import importlib.machinery
+import resource
+import sys
+import threading
+import time
+from collections.abc import Callable, Sequence
+from types import ModuleType
+from typing import Any, Final, TypeVar
+
+from src.Service.OSSwitch import OSSwitch
+
+
+class StartupProfiler(importlib.abc.MetaPathFinder):
+    """
+    Measures app startup, enabled with --profile-startup. Records time spent importing each module
+    and building each service of the container.
+
+    Service import time is the time of imports done by its factory, e.g. deferred GUI and network
+    libraries. Construction time excludes it and nested services, which are reported separately.
+
+    Only the thread which started the profiler is measured, imports from other threads are not
+    attributed to the services being built.
+    """
+
+    T = TypeVar('T')
+
+    _REPORT_IMPORT_COUNT: Final[int] = 15
+    """Slowest modules listed in the report"""
+
+    _osSwitch: OSSwitch
+
+    _startedAt: int | None
+    _threadId: int | None
+    _frames: list[list[int]]
+    """
+    Stack of currently measured imports and services. Each frame has total time of its direct
+    child imports and child services, in nanoseconds. First frame is for imports outside services
+    """
+    _imports: dict[str, list[int]]
+    """Self and cumulative time by module name"""
+    _services: list[tuple[str, int, list[int]]]
+    """Name, nesting depth and import and construction time, in the build order"""
+    _serviceDepth: int
+
+    def __init__(self, osSwitch: OSSwitch):
+        self._osSwitch = osSwitch
+
+        self._startedAt = None
+        self._threadId = None
+        self._frames = [[0, 0]]
+        self._imports = {}
+        self._services = []
+        self._serviceDepth = 0
+
+    def start(self) -> None:
+        self._startedAt = time.perf_counter_ns()
+        self._threadId = threading.get_ident()
+        sys.meta_path.insert(0, self)
+
+    def stop(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def measureService(self, name: str, factory: Callable[[], T]) -> T:
+        if threading.get_ident() != self._threadId:
+            return factory()
+
+        record = (name, self._serviceDepth, [0, 0])
+        self._services.append(record)
+        self._serviceDepth += 1
+
+        try:
+            frame, totalNs, service = self._measure(factory)
+        finally:
+            self._serviceDepth -= 1
+
+        self._frames[-1][1] += totalNs
+        record[2][0] = frame[0]
+        record[2][1] = totalNs - frame[0] - frame[1]
+
+        return service
+
+    def measureImport(self, moduleName: str, function: Callable[[], T]) -> T:
+        if threading.get_ident() != self._threadId:
+            return function()
+
+        frame, totalNs, result = self._measure(function)
+        self._frames[-1][0] += totalNs
+
+        times = self._imports.setdefault(moduleName, [0, 0])
+        times[0] += totalNs - frame[0] - frame[1]
+        times[1] += totalNs
+
+        return result
+
+    def getReport(self) -> str:
+        if self._startedAt is None:
+            raise Exception('Startup profiler was not started')
+
+        lines = [
+            f'Startup profile, {self._formatDuration(time.perf_counter_ns() - self._startedAt)} '
+            f'since the profiler start, peak RSS {self._getPeakRss() / 1024 / 1024:.1f} MB',
+            f'Imports outside services: {self._formatDuration(self._frames[0][0])}',
+            'Services, import / construction time:',
+        ]
+
+        for name, depth, (importNs, constructionNs) in self._services:
+            lines.append(
+                f'{"  " * (depth + 1)}{name}: '
+                f'{self._formatDuration(importNs)} / {self._formatDuration(constructionNs)}'
+            )
+
+        lines.append('Slowest imports, self / cumulative time:')
+        slowest = sorted(self._imports.items(), key=lambda item: item[1][0], reverse=True)
+
+        for moduleName, (selfNs, cumulativeNs) in slowest[: self._REPORT_IMPORT_COUNT]:
+            lines.append(
+                f'  {moduleName}: '
+                f'{self._formatDuration(selfNs)} / {self._formatDuration(cumulativeNs)}'
+            )
+
+        return '\n'.join(lines)
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Sequence[str] | None,
+        target: ModuleType | None = None,
+    ) -> importlib.machinery.ModuleSpec | None:
+        """
+        Part of the import system API. Finds the spec with other finders and wraps its loader,
+        to measure module loading
+        """
+
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+
+            spec = finder.find_spec(fullname, path, target)
+
+            if spec is None:
+                continue
+
+            if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                spec.loader = _TimedLoader(spec.loader, self)
+
+            return spec
+
+        return None
+
+    def _measure(self, function: Callable[[], T]) -> tuple[list[int], int, T]:
+        frame = [0, 0]
+        self._frames.append(frame)
+        start = time.perf_counter_ns()
+
+        try:
+            result = function()
+        finally:
+            totalNs = time.perf_counter_ns() - start
+            self._frames.pop()
+
+        return frame, totalNs, result
+
+    def _getPeakRss(self) -> int:
+        """
+        :return: bytes
+        """
+
+        peakRss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        # Linux reports kilobytes, macOS reports bytes
+        return peakRss if self._osSwitch.isMacOS() else peakRss * 1024
+
+    @staticmethod
+    def _formatDuration(durationNs: int) -> str:
+        return f'{durationNs / 1_000_000:.1f} ms'
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Wraps a loader found by other finders, other loader attributes are passed to it as is"""
+
+    _loader: Any
+    _profiler: StartupProfiler
+
+    def __init__(self, loader: Any, profiler: StartupProfiler):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec: importlib.machinery.ModuleSpec) -> ModuleType | None:
+        if not hasattr(self._loader, 'create_module'):
+            return None
+
+        # Extension modules are loaded here
+        return self._profiler.measureImport(spec.name, lambda: self._loader.create_module(spec))
+
+    def exec_module(self, module: ModuleType) -> None:
+        self._profiler.measureImport(module.__name__, lambda: self._loader.exec_module(module))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
@@ -1,10 +1,13 @@
+import functools
 import webbrowser
 from abc import ABC, abstractmethod
 from typing import Final
 
 from src.Constant.AppConstant import AppConstant
 from src.Constant.ConfigId import ConfigId
+from src.Constant.Logs import Logs
 from src.Constant.ModalId import ModalId
+from src.DTO.ConvertResult import ConvertResult
 from src.DTO.MenuItem import MenuItem
 from src.DTO.Timestamp import Timestamp
 from src.Service.AutostartManager import AutostartManager
@@ -28,6 +31,8 @@ class StatusbarApp(ABC):
 
     _MENU_ID_LAST_CONVERSION_ORIGINAL_TEXT: Final[str] = 'last_conversion_original_text'
     _MENU_ID_LAST_CONVERSION_CONVERTED_TEXT: Final[str] = 'last_conversion_converted_text'
+    _MENU_ID_LAST_CONVERSION_OTHER_RESULT: Final[str] = 'last_conversion_other_result_'
+    _MENU_MAX_OTHER_RESULTS: Final[int] = 5
 
     _osSwitch: OSSwitch
     _formatter: TimestampTextFormatter
@@ -49,6 +54,9 @@ class StatusbarApp(ABC):
     _iconPathDefault: str
     _iconPathFlash: str
     _flashIconOnChange: bool
+    _extractionEnabled: bool
+    _otherResults: list[ConvertResult]
+    """Other results of the last conversion, shown in the menu"""
     _configFilePath: str
 
     def __init__(
@@ -92,6 +100,8 @@ class StatusbarApp(ABC):
             ConfigId.Converter_Timestamp_Menu_CurrentTimestamp
         )
         self._flashIconOnChange = config.get(ConfigId.FlashIconOnChange)
+        self._extractionEnabled = config.get(ConfigId.Converter_Extraction_Enabled)
+        self._otherResults = []
 
         self._events.subscribeUpdateCheckCompleted(self._showAppUpdateDialog)
 
@@ -125,6 +135,20 @@ class StatusbarApp(ABC):
                 ),
             }
         )
+
+        if self._extractionEnabled:
+            # Native menus are not rebuilt on each conversion, so a fixed count of items is
+            # created and the unused ones are hidden
+            for index in range(self._MENU_MAX_OTHER_RESULTS):
+                items.update(
+                    {
+                        f'{self._MENU_ID_LAST_CONVERSION_OTHER_RESULT}{index}': MenuItem(
+                            'Other result',
+                            callback=functools.partial(self._onMenuClickOtherResult, index),
+                        ),
+                    }
+                )
+
         items.update({'separator_last_conversion': MenuItem(isSeparator=True)})
 
         # Current timestamp
@@ -176,6 +200,9 @@ class StatusbarApp(ABC):
                     'separator_debug': MenuItem(isSeparator=True),
                     'label_debug': MenuItem('Debug tools', isDisabled=True),
                     'gui_demo': MenuItem('Open GUI demo', callback=self._onMenuClickOpenGUIDemo),
+                    'event_stats': MenuItem(
+                        'Show event stats', callback=self._onMenuClickShowEventStats
+                    ),
                 }
             )
 
@@ -187,6 +214,29 @@ class StatusbarApp(ABC):
     def _createOsNativeMenu(self, commonMenu: dict[str, MenuItem]):
         pass
 
+    @abstractmethod
+    def _setMenuItemLabel(self, menuItem: MenuItem, label: str) -> None:
+        pass
+
+    @abstractmethod
+    def _setMenuItemVisible(self, menuItem: MenuItem, visible: bool) -> None:
+        pass
+
+    def _updateOtherResultsMenu(self, otherResults: list[ConvertResult]) -> None:
+        if not self._extractionEnabled:
+            return
+
+        self._otherResults = otherResults[: self._MENU_MAX_OTHER_RESULTS]
+
+        for index in range(self._MENU_MAX_OTHER_RESULTS):
+            menuItem = self._menuItems[f'{self._MENU_ID_LAST_CONVERSION_OTHER_RESULT}{index}']
+
+            if index < len(self._otherResults):
+                self._setMenuItemLabel(menuItem, self._otherResults[index].iconText)
+                self._setMenuItemVisible(menuItem, True)
+            else:
+                self._setMenuItemVisible(menuItem, False)
+
     @abstractmethod
     def _showAppUpdateDialog(self, text: str, buttons: DialogButtonsDict) -> None:
         pass
@@ -199,6 +249,9 @@ class StatusbarApp(ABC):
     def _onMenuClickCurrentTimestamp(self, menuItem) -> None:
         pass
 
+    def _onMenuClickOtherResult(self, index: int, menuItem) -> None:
+        self._clipboard.setClipboardContent(self._otherResults[index].convertedText)
+
     def _onMenuClickClearStatusbar(self, menuItem) -> None:
         self._conversionManager.dispatchClear('manual, menu click')
 
@@ -215,6 +268,15 @@ class StatusbarApp(ABC):
     def _onMenuClickOpenGUIDemo(self, menuItem) -> None:
         self._modalWindowManager.openModal(ModalId.DEMO)
 
+    def _onMenuClickShowEventStats(self, menuItem) -> None:
+        statsRecorder = self._events.getStatsRecorder()
+        report = (
+            'Event stats are not recorded' if statsRecorder is None else statsRecorder.getReport()
+        )
+
+        self._logger.log(f'{Logs.catEvents}Dispatch stats:\n{report}')
+        self._showDialogDpg(report, {'Close': None})
+
     def _onMenuClickOpenWebsite(self, menuItem) -> None:
         webbrowser.open(AppConstant.WEBSITE)
 
@@ -1,7 +1,5 @@
 import signal
 import sys
-import threading
-import time
 from typing import Final
 
 import gi
@@ -10,6 +8,7 @@ from src.Constant.AppConstant import AppConstant
 from src.Constant.Logs import Logs
 from src.DTO.ConvertResult import ConvertResult
 from src.DTO.MenuItem import MenuItem
+from src.DTO.StatusbarUpdate import StatusbarUpdate
 from src.DTO.Timestamp import Timestamp
 from src.Service.AutostartManager import AutostartManager
 from src.Service.ClipboardManager import ClipboardManager
@@ -24,13 +23,14 @@ from src.Service.Logger import Logger
 from src.Service.ModalWindow.ModalWindowManager import ModalWindowManager
 from src.Service.OSSwitch import OSSwitch
 from src.Service.StatusbarApp import StatusbarApp
+from src.Service.StatusbarUpdateBatcher import StatusbarUpdateBatcher
 from src.Service.UpdateManager import UpdateManager
 from src.Type.Types import DialogButtonsDict
 
 gi.require_version('Gtk', '3.0')
 gi.require_version('AppIndicator3', '0.1')
 
-from gi.repository import AppIndicator3, Gtk  # type: ignore[attr-defined]  # noqa: E402
+from gi.repository import AppIndicator3, GLib, Gtk  # type: ignore[attr-defined]  # noqa: E402
 
 """
 AppIndicator tutorial 1: https://fosspost.org/custom-system-tray-icon-indicator-linux/
@@ -65,6 +65,9 @@ class StatusbarAppLinux(StatusbarApp):
     _CHECK: Final[str] = '✔  '
 
     _app: AppIndicator3.Indicator
+    _updateBatcher: StatusbarUpdateBatcher
+    _flashSourceId: int | None
+    """GLib timer, which ends the current icon flash. None if icon is not flashing"""
 
     def __init__(
         self,
@@ -100,23 +103,36 @@ class StatusbarAppLinux(StatusbarApp):
 
         self._iconPathDefault = self._filesystemHelper.getAssetsDir() + '/icon_linux.png'
         self._iconPathFlash = self._filesystemHelper.getAssetsDir() + '/icon_linux_flash.png'
+        self._flashSourceId = None
 
     def createApp(self) -> None:
-        self._events.subscribeConverted(self._onConverted)
-        self._events.subscribeStatusbarClear(self._onStatusbarClear)
+        # GTK is not thread safe, so UI is updated only from the main loop.
+        # idle_add runs the function once, as it returns None
+        self._events.setUiExecutor(GLib.idle_add)
+        # Batcher only stores the change and schedules it in the main loop, so it's called
+        # directly in the dispatching thread
+        self._updateBatcher = StatusbarUpdateBatcher(
+            GLib.timeout_add, self._applyIconUpdate, self._applyMenuUpdate
+        )
+        self._events.subscribeConverted(self._updateBatcher.showConverted)
+        self._events.subscribeStatusbarClear(self._updateBatcher.clear)
 
         # https://lazka.github.io/pgi-docs/#AyatanaAppIndicator3-0.1/classes/Indicator.html#AyatanaAppIndicator3.Indicator.new
         self._app = AppIndicator3.Indicator.new(
             AppConstant.APP_NAME,
             # Icons can be also used from `/usr/share/icons`, e.g. 'clock-app'
-            self._filesystemHelper.getAssetsDir() + '/icon_linux.png',
+            self._iconPathDefault,
             AppIndicator3.IndicatorCategory.APPLICATION_STATUS,
         )
 
+        # Flash icon is set once as the attention icon. Flashing then only switches indicator
+        # status, without loading icon files again
+        self._app.set_attention_icon_full(self._iconPathFlash, '')
         self._app.set_status(AppIndicator3.IndicatorStatus.ACTIVE)
         self._app.set_label('', '')
         menu = self._createOsNativeMenu(self._createCommonMenu())
         self._app.set_menu(menu)
+        self._updateOtherResultsMenu([])
 
         # Needed because without this the app exits with errors on app close
         signal.signal(signal.SIGINT, signal.SIG_DFL)
@@ -160,6 +176,12 @@ class StatusbarAppLinux(StatusbarApp):
 
         return menu
 
+    def _setMenuItemLabel(self, menuItem: MenuItem, label: str) -> None:
+        menuItem.nativeItem.set_label(label)
+
+    def _setMenuItemVisible(self, menuItem: MenuItem, visible: bool) -> None:
+        menuItem.nativeItem.set_visible(visible)
+
     def _showAppUpdateDialog(self, text: str, buttons: DialogButtonsDict) -> None:
         self._showDialogDpg(text, buttons)
 
@@ -188,33 +210,46 @@ class StatusbarAppLinux(StatusbarApp):
         Gtk.main_quit()
         sys.exit()
 
-    def _onConverted(self, result: ConvertResult) -> None:
-        # Icon flash must be first action. Otherwise, it's visible how text is
-        # updated first and icon later, and looks bad
-        if self._flashIconOnChange:
-            threading.Thread(target=self._flashIcon, daemon=True).start()
+    def _applyIconUpdate(self, update: StatusbarUpdate) -> None:
+        # Statusbar could be cleared before the conversion was shown, then there is nothing to flash
+        if update.iconText != '':
+            # Icon flash must be first action. Otherwise, it's visible how text is
+            # updated first and icon later, and looks bad
+            if self._flashIconOnChange:
+                self._flashIcon()
 
-        self._logger.logDebug(Logs.changingIconTextTo % result.iconText)
-        self._app.set_label(result.iconText, '')
-        self._menuItems[self._MENU_ID_LAST_CONVERSION_ORIGINAL_TEXT].nativeItem.set_label(
-            result.originalText
-        )
+            self._logger.logDebug(Logs.changingIconTextTo % update.iconText)
+
+        self._app.set_label(update.iconText, '')
 
-        # If menu items are changed too quickly, UI fails to actually update labels.
-        # So a small delay is needed
-        time.sleep(0.1)
+        if update.result is not None:
+            self._menuItems[self._MENU_ID_LAST_CONVERSION_ORIGINAL_TEXT].nativeItem.set_label(
+                update.result.originalText
+            )
 
+    def _applyMenuUpdate(self, result: ConvertResult) -> None:
         self._menuItems[self._MENU_ID_LAST_CONVERSION_CONVERTED_TEXT].nativeItem.set_label(
             result.convertedText
         )
+        self._updateOtherResultsMenu(result.otherResults)
 
     def _flashIcon(self) -> None:
-        self._app.set_icon(self._iconPathFlash)
-        time.sleep(StatusbarAppLinux._ICON_FLASH_DURATION)
-        self._app.set_icon(self._iconPathDefault)
+        if self._flashSourceId is None:
+            self._app.set_status(AppIndicator3.IndicatorStatus.ATTENTION)
+        else:
+            # Flash is restarted, so rapid conversions keep the icon flashing until the last one
+            GLib.source_remove(self._flashSourceId)
 
-    def _onStatusbarClear(self) -> None:
-        self._app.set_label('', '')
+        self._flashSourceId = GLib.timeout_add(
+            int(StatusbarAppLinux._ICON_FLASH_DURATION * 1000), self._endIconFlash
+        )
+
+    def _endIconFlash(self) -> bool:
+        self._flashSourceId = None
+        self._app.set_status(AppIndicator3.IndicatorStatus.ACTIVE)
+
+        # Don't repeat
+        return False
 
     def _showDialogLegacy(self, message: str, buttons: DialogButtonsDict) -> None:
         """
@@ -1,11 +1,11 @@
 import os
-import threading
-import time
 
 import rumps
+from PyObjCTools import AppHelper
 
 from src.Constant.AppConstant import AppConstant
 from src.Constant.Logs import Logs
+from src.Constant.ThreadAffinity import ThreadAffinity
 from src.DTO.ConvertResult import ConvertResult
 from src.DTO.MenuItem import MenuItem
 from src.DTO.Timestamp import Timestamp
@@ -28,6 +28,9 @@ from src.Type.Types import DialogButtonsDict
 
 class StatusbarAppMacOs(StatusbarApp):
     _app: rumps.App
+    _flashGeneration: int
+    """Increased on each flash start, so only the timer of the last flash ends it"""
+    _isFlashing: bool
 
     def __init__(
         self,
@@ -63,12 +66,17 @@ class StatusbarAppMacOs(StatusbarApp):
 
         self._iconPathDefault = self._filesystemHelper.getAssetsDir() + '/icon_macos.png'
         self._iconPathFlash = self._filesystemHelper.getAssetsDir() + '/icon_macos_flash.png'
+        self._flashGeneration = 0
+        self._isFlashing = False
 
     def createApp(self) -> None:
-        self._events.subscribeConverted(self._onConverted)
-        self._events.subscribeStatusbarClear(self._onStatusbarClear)
+        # AppKit objects must be used only from the main thread
+        self._events.setUiExecutor(AppHelper.callAfter)
+        self._events.subscribeConverted(self._onConverted, ThreadAffinity.UI)
+        self._events.subscribeStatusbarClear(self._onStatusbarClear, ThreadAffinity.UI)
 
         menu = self._createOsNativeMenu(self._createCommonMenu())
+        self._updateOtherResultsMenu([])
 
         self._app = rumps.App(
             AppConstant.APP_NAME,
@@ -105,6 +113,13 @@ class StatusbarAppMacOs(StatusbarApp):
 
         return menu
 
+    def _setMenuItemLabel(self, menuItem: MenuItem, label: str) -> None:
+        menuItem.nativeItem.title = label
+
+    def _setMenuItemVisible(self, menuItem: MenuItem, visible: bool) -> None:
+        # rumps has no API to hide items, so underlying NSMenuItem is used
+        menuItem.nativeItem._menuitem.setHidden_(not visible)
+
     def _showAppUpdateDialog(self, text: str, buttons: DialogButtonsDict) -> None:
         text = text.replace('\n', '\\n')
         self._showDialogLegacy(text, buttons)
@@ -133,7 +148,7 @@ class StatusbarAppMacOs(StatusbarApp):
 
     def _onConverted(self, result: ConvertResult) -> None:
         if self._flashIconOnChange:
-            threading.Thread(target=self._flashIcon, daemon=True).start()
+            self._flashIcon()
 
         self._logger.logDebug(Logs.changingIconTextTo % result.iconText)
         self._app.title = result.iconText
@@ -144,10 +159,26 @@ class StatusbarAppMacOs(StatusbarApp):
         self._menuItems[
             self._MENU_ID_LAST_CONVERSION_CONVERTED_TEXT
         ].nativeItem.title = result.convertedText
+        self._updateOtherResultsMenu(result.otherResults)
 
     def _flashIcon(self) -> None:
-        self._app.icon = self._iconPathFlash
-        time.sleep(StatusbarAppMacOs._ICON_FLASH_DURATION)
+        # Timers scheduled with callLater can't be cancelled. So the flash is restarted by
+        # ignoring earlier timers, and the icon is not set again if it's already flashing
+        self._flashGeneration += 1
+
+        if not self._isFlashing:
+            self._isFlashing = True
+            self._app.icon = self._iconPathFlash
+
+        AppHelper.callLater(
+            StatusbarAppMacOs._ICON_FLASH_DURATION, self._endIconFlash, self._flashGeneration
+        )
+
+    def _endIconFlash(self, generation: int) -> None:
+        if generation != self._flashGeneration:
+            return
+
+        self._isFlashing = False
         self._app.icon = self._iconPathDefault
 
     def _onStatusbarClear(self) -> None:
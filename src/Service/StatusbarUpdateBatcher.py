@@ -0,0 +1,121 @@
+import functools
+import threading
+from collections.abc import Callable
+from typing import Final
+
+from src.DTO.ConvertResult import ConvertResult
+from src.DTO.StatusbarUpdate import StatusbarUpdate
+
+
+class StatusbarUpdateBatcher:
+    """
+    Collects statusbar changes into a single pending update and applies it in the UI thread.
+    Callers never block: if changes come faster than they are applied, only the latest one is
+    applied after the current one.
+
+    An update is applied in two steps, first the icon text and then, after a delay, the menu.
+    If menu labels are changed too quickly, UI fails to actually update them.
+    """
+
+    _MENU_UPDATE_DELAY: Final[int] = 100
+    """Milliseconds"""
+
+    _scheduleInUi: Callable[[int, Callable[[], bool]], object]
+    _applyIcon: Callable[[StatusbarUpdate], None]
+    _applyMenu: Callable[[ConvertResult], None]
+
+    _pending: StatusbarUpdate | None
+    _applying: bool
+    """An update is being applied. The next one will be scheduled after it's done"""
+    _lock: threading.Lock
+
+    def __init__(
+        self,
+        scheduleInUi: Callable[[int, Callable[[], bool]], object],
+        applyIcon: Callable[[StatusbarUpdate], None],
+        applyMenu: Callable[[ConvertResult], None],
+    ):
+        """
+        :param scheduleInUi: runs the function in the UI thread after the delay in milliseconds,
+            e.g. GLib.timeout_add. Function returns False, so it's not repeated
+        :param applyIcon: sets icon text. Called in the UI thread
+        :param applyMenu: sets menu labels. Called in the UI thread
+        """
+
+        self._scheduleInUi = scheduleInUi
+        self._applyIcon = applyIcon
+        self._applyMenu = applyMenu
+        self._pending = None
+        self._applying = False
+        self._lock = threading.Lock()
+
+    def showConverted(self, result: ConvertResult) -> None:
+        """Can be called from any thread"""
+
+        self._submit(lambda pending: StatusbarUpdate(result.iconText, result))
+
+    def clear(self) -> None:
+        """
+        Clears icon text, but keeps not yet applied menu changes. Can be called from any thread
+        """
+
+        self._submit(
+            lambda pending: StatusbarUpdate('', None if pending is None else pending.result)
+        )
+
+    def _submit(self, merge: Callable[[StatusbarUpdate | None], StatusbarUpdate]) -> None:
+        """
+        :param merge: creates the new pending update from the current one
+        """
+
+        with self._lock:
+            self._pending = merge(self._pending)
+
+            if self._applying:
+                return
+
+            self._applying = True
+
+        self._scheduleInUi(0, self._applyIconStep)
+
+    def _applyIconStep(self) -> bool:
+        with self._lock:
+            update = self._pending
+            self._pending = None
+
+        menuScheduled = False
+
+        try:
+            if update is not None:
+                self._applyIcon(update)
+
+                if update.result is not None:
+                    self._scheduleInUi(
+                        self._MENU_UPDATE_DELAY,
+                        functools.partial(self._applyMenuStep, update.result),
+                    )
+                    menuScheduled = True
+        finally:
+            if not menuScheduled:
+                self._applyNextUpdate()
+
+        # Don't repeat
+        return False
+
+    def _applyMenuStep(self, result: ConvertResult) -> bool:
+        try:
+            self._applyMenu(result)
+        finally:
+            self._applyNextUpdate()
+
+        # Don't repeat
+        return False
+
+    def _applyNextUpdate(self) -> None:
+        with self._lock:
+            if self._pending is None:
+                self._applying = False
+
+                return
+
+        self._scheduleInUi(0, self._applyIconStep)
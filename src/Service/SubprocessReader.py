@@ -0,0 +1,25 @@
+import subprocess
+
+
+class SubprocessReader:
+    @staticmethod
+    def readOutput(command: list[str], maxBytes: int) -> bytes:
+        """
+        Reads at most maxBytes of the command output, then stops the command. So memory use
+        doesn't depend on how much the command would output
+
+        :return: output, cut at maxBytes
+        """
+
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+
+        try:
+            return process.stdout.read(maxBytes)  # type: ignore[union-attr]
+        finally:
+            process.stdout.close()  # type: ignore[union-attr]
+
+            if process.poll() is None:
+                # Usually it's already stopped by SIGPIPE, if output is longer
+                process.kill()
+
+            process.wait()
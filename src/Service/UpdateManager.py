@@ -1,22 +1,21 @@
 import json
 import platform
 import threading
-import time
 import webbrowser
 from typing import Final
 
-import requests
-
 from src.Constant.AppConstant import AppConstant
 from src.Constant.ConfigId import ConfigId
 from src.Constant.Logs import Logs
 from src.DTO.Exception.InvalidHTTPResponseException import InvalidHTTPResponseException
+from src.DTO.ScheduledJob import ScheduledJob
 from src.Service.Configuration import Configuration
 from src.Service.Debug import Debug
 from src.Service.EventService import EventService
 from src.Service.ExceptionHandler import ExceptionHandler
 from src.Service.FilesystemHelper import FilesystemHelper
 from src.Service.Logger import Logger
+from src.Service.Scheduler import Scheduler
 from src.Type.Types import DialogButtonsDict
 
 
@@ -28,41 +27,45 @@ class UpdateManager:
 
     _filesystemHelper: FilesystemHelper
     _events: EventService
+    _scheduler: Scheduler
     _config: Configuration
     _logger: Logger
     _debug: Debug
 
     _currentVersion: tuple[int, ...]
     _skippedVersion: tuple[int, ...] | None
-    _lastCheckAt: int | None
+    _checkJob: ScheduledJob | None
+    """Next automatic check"""
 
     def __init__(
         self,
         filesystemHelper: FilesystemHelper,
         events: EventService,
+        scheduler: Scheduler,
         config: Configuration,
         logger: Logger,
         debug: Debug,
     ):
         self._filesystemHelper = filesystemHelper
         self._events = events
+        self._scheduler = scheduler
         self._config = config
         self._logger = logger
         self._debug = debug
 
-        self._lastCheckAt = None
-        self._events.subscribeAppLoopIteration(self._updateCheckIteration)
+        # First check right after the app starts
+        self._checkJob = self._scheduler.scheduleOnce(0, self._automaticCheck)
 
     def checkForUpdatesAsync(self, manuallyTriggered: bool) -> None:
-        self._lastCheckAt = int(time.time())
+        # Manual check also postpones the next automatic one
+        self._scheduler.cancel(self._checkJob)
+        self._checkJob = self._scheduler.scheduleOnce(self._CHECK_INTERVAL, self._automaticCheck)
+
         threading.Thread(
             target=self._checkForUpdates, args=[manuallyTriggered], daemon=True
         ).start()
 
-    def _updateCheckIteration(self) -> None:
-        if self._lastCheckAt and (int(time.time()) - self._CHECK_INTERVAL) < self._lastCheckAt:
-            return
-
+    def _automaticCheck(self) -> None:
         self.checkForUpdatesAsync(False)
 
     def _checkForUpdates(self, manuallyTriggered: bool) -> None:
@@ -111,7 +114,6 @@ class UpdateManager:
             if manuallyTriggered and not newUpdateFound:
                 self._dispatchUpdateResultEvent(None)
 
-            self._lastCheckAt = int(time.time())
             self._logger.log(f'{Logs.catUpdateCheck}Completed')
         except Exception as e:
             self._logger.log(
@@ -166,6 +168,9 @@ class UpdateManager:
             ) as file:
                 return json.load(file)
 
+        # Imported only here, as it's slow to import and not needed until the first check
+        import requests
+
         response = requests.get(self._RELEASES_URL)
         statusCode = response.status_code
 
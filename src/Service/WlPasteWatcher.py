@@ -0,0 +1,118 @@
+import os
+import select
+import subprocess
+import time
+from typing import Final
+
+
+class WlPasteWatcher:
+    """
+    Watches Wayland clipboard with a single long-lived `wl-paste --watch` process. On each change,
+    wl-paste runs a short shell command, which writes the content, cut at the size limit and
+    followed by a NUL byte, into the same output stream. So both changes and their content are
+    read from one pipe, without starting any processes from the app.
+
+    Not thread safe, all methods must be called from the same thread.
+    """
+
+    _READ_CHUNK_SIZE: Final[int] = 65536
+    _SEPARATOR: Final[int] = 0
+    """NUL byte after each content. Text content never contains it"""
+
+    _process: subprocess.Popen
+    _buffer: bytearray
+    """Received output, starting from the first not yet taken content"""
+    _content: bytes
+
+    def __init__(self, maxBytes: int, primary: bool, wlPastePath: str = 'wl-paste'):
+        """
+        :param maxBytes: content is read only up to this many bytes
+        :param primary: watch primary selection instead of the clipboard
+        """
+
+        command = [wlPastePath, '--type', 'text']
+
+        if primary:
+            command.append('--primary')
+
+        command += ['--watch', 'sh', '-c', f"head -c {maxBytes}; printf '\\0'"]
+
+        self._process = subprocess.Popen(
+            command, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+        self._buffer = bytearray()
+        self._content = b''
+
+    def waitForChange(self, timeout: float | None = None) -> bool:
+        """
+        Blocks until clipboard changes. Multiple changes already received are reported as
+        a single one, with the last content
+
+        :param timeout: seconds. None to wait without timeout
+        :return: False if timeout passed without changes
+        :raises Exception: if wl-paste exited, e.g. if compositor does not support primary selection
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            # Changes, already written to the pipe, are taken together
+            while self._readAvailable(time.monotonic()):
+                pass
+
+            if self._takeLastContent():
+                return True
+
+            if not self._readAvailable(deadline):
+                return False
+
+    def getContent(self) -> str:
+        """
+        :return: content of the last change. Empty string if clipboard was cleared
+        """
+
+        return self._content.decode('utf-8', errors='replace')
+
+    def close(self) -> None:
+        self._process.kill()
+        self._process.wait()
+        self._process.stdout.close()  # type: ignore[union-attr]
+
+    def _readAvailable(self, deadline: float | None) -> bool:
+        """
+        :param deadline: time.monotonic() value, until which to wait for output. None to wait
+            without timeout
+        :return: False if no output was available until deadline
+        """
+
+        outputFd = self._process.stdout.fileno()  # type: ignore[union-attr]
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        readable, _, _ = select.select([outputFd], [], [], timeout)
+
+        if not readable:
+            return False
+
+        chunk = os.read(outputFd, self._READ_CHUNK_SIZE)
+
+        if chunk == b'':
+            raise Exception(f'wl-paste exited with code {self._process.wait()}')
+
+        self._buffer += chunk
+
+        return True
+
+    def _takeLastContent(self) -> bool:
+        """
+        :return: False if no complete content was received
+        """
+
+        end = self._buffer.rfind(self._SEPARATOR)
+
+        if end == -1:
+            return False
+
+        start = self._buffer.rfind(self._SEPARATOR, 0, end) + 1
+        self._content = bytes(self._buffer[start:end])
+        del self._buffer[: end + 1]
+
+        return True
@@ -0,0 +1,165 @@
+import ctypes
+import ctypes.util
+from typing import Final
+
+
+class XSelectionEvent(ctypes.Structure):
+    _fields_ = [
+        ('type', ctypes.c_int),
+        ('serial', ctypes.c_ulong),
+        ('send_event', ctypes.c_int),
+        ('display', ctypes.c_void_p),
+        ('requestor', ctypes.c_ulong),
+        ('selection', ctypes.c_ulong),
+        ('target', ctypes.c_ulong),
+        ('property', ctypes.c_ulong),
+        ('time', ctypes.c_ulong),
+    ]
+
+
+class XSelectionRequestEvent(ctypes.Structure):
+    _fields_ = [
+        ('type', ctypes.c_int),
+        ('serial', ctypes.c_ulong),
+        ('send_event', ctypes.c_int),
+        ('display', ctypes.c_void_p),
+        ('owner', ctypes.c_ulong),
+        ('requestor', ctypes.c_ulong),
+        ('selection', ctypes.c_ulong),
+        ('target', ctypes.c_ulong),
+        ('property', ctypes.c_ulong),
+        ('time', ctypes.c_ulong),
+    ]
+
+
+class XEvent(ctypes.Union):
+    _fields_ = [
+        ('type', ctypes.c_int),
+        ('xselection', XSelectionEvent),
+        ('xselectionrequest', XSelectionRequestEvent),
+        # Size of the whole XEvent union in Xlib
+        ('pad', ctypes.c_long * 24),
+    ]
+
+
+class X11Library:
+    """
+    ctypes bindings of libX11 and libXfixes, only the functions needed for selections.
+
+    Docs: https://www.x.org/releases/current/doc/libX11/libX11/libX11.html
+    XFixes: https://www.x.org/releases/current/doc/fixesproto/fixesproto.txt
+    """
+
+    CURRENT_TIME: Final[int] = 0
+    NONE: Final[int] = 0
+    ANY_PROPERTY_TYPE: Final[int] = 0
+    ATOM: Final[int] = 4
+    """Predefined XA_ATOM type"""
+    SUCCESS: Final[int] = 0
+    SELECTION_REQUEST: Final[int] = 30
+    SELECTION_NOTIFY: Final[int] = 31
+    PROP_MODE_REPLACE: Final[int] = 0
+    XFIXES_SELECTION_NOTIFY: Final[int] = 0
+    """Event type, relative to the XFixes event base"""
+    XFIXES_SET_SELECTION_OWNER_NOTIFY_MASK: Final[int] = 1
+
+    x11: ctypes.CDLL
+    xfixes: ctypes.CDLL
+
+    def __init__(self):
+        """
+        :raises Exception: if libX11 or libXfixes is not installed
+        """
+
+        self.x11 = self._load('X11')
+        self.xfixes = self._load('Xfixes')
+
+        display = ctypes.c_void_p
+        window = ctypes.c_ulong
+        atom = ctypes.c_ulong
+        eventPointer = ctypes.POINTER(XEvent)
+
+        self._declare(self.x11.XOpenDisplay, display, [ctypes.c_char_p])
+        self._declare(self.x11.XCloseDisplay, ctypes.c_int, [display])
+        self._declare(self.x11.XDefaultRootWindow, window, [display])
+        self._declare(self.x11.XConnectionNumber, ctypes.c_int, [display])
+        self._declare(
+            self.x11.XCreateSimpleWindow,
+            window,
+            [display, window] + [ctypes.c_int] * 2 + [ctypes.c_uint] * 3 + [ctypes.c_ulong] * 2,
+        )
+        self._declare(self.x11.XInternAtom, atom, [display, ctypes.c_char_p, ctypes.c_int])
+        self._declare(self.x11.XPending, ctypes.c_int, [display])
+        self._declare(self.x11.XNextEvent, ctypes.c_int, [display, eventPointer])
+        self._declare(self.x11.XFlush, ctypes.c_int, [display])
+        self._declare(
+            self.x11.XConvertSelection,
+            ctypes.c_int,
+            [display, atom, atom, atom, window, ctypes.c_ulong],
+        )
+        self._declare(
+            self.x11.XGetWindowProperty,
+            ctypes.c_int,
+            [
+                display,
+                window,
+                atom,
+                ctypes.c_long,
+                ctypes.c_long,
+                ctypes.c_int,
+                atom,
+                ctypes.POINTER(atom),
+                ctypes.POINTER(ctypes.c_int),
+                ctypes.POINTER(ctypes.c_ulong),
+                ctypes.POINTER(ctypes.c_ulong),
+                ctypes.POINTER(ctypes.POINTER(ctypes.c_ubyte)),
+            ],
+        )
+        self._declare(self.x11.XDeleteProperty, ctypes.c_int, [display, window, atom])
+        self._declare(self.x11.XFree, ctypes.c_int, [ctypes.c_void_p])
+        self._declare(
+            self.x11.XSetSelectionOwner, ctypes.c_int, [display, atom, window, ctypes.c_ulong]
+        )
+        self._declare(
+            self.x11.XChangeProperty,
+            ctypes.c_int,
+            [
+                display,
+                window,
+                atom,
+                atom,
+                ctypes.c_int,
+                ctypes.c_int,
+                ctypes.c_char_p,
+                ctypes.c_int,
+            ],
+        )
+        self._declare(
+            self.x11.XSendEvent,
+            ctypes.c_int,
+            [display, window, ctypes.c_int, ctypes.c_long, eventPointer],
+        )
+
+        self._declare(
+            self.xfixes.XFixesQueryExtension,
+            ctypes.c_int,
+            [display, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int)],
+        )
+        self._declare(
+            self.xfixes.XFixesSelectSelectionInput,
+            None,
+            [display, window, atom, ctypes.c_ulong],
+        )
+
+    def _load(self, name: str) -> ctypes.CDLL:
+        path = ctypes.util.find_library(name)
+
+        if path is None:
+            raise Exception(f'lib{name} is not installed')
+
+        return ctypes.CDLL(path)
+
+    def _declare(self, function, restype, argtypes: list) -> None:
+        # Without declared types, ctypes would truncate 64-bit pointers and XIDs to int
+        function.restype = restype
+        function.argtypes = argtypes
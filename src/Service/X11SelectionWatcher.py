@@ -0,0 +1,332 @@
+import ctypes
+import select
+import time
+from typing import Final
+
+from src.Service.X11Library import X11Library, XEvent
+
+
+class X11SelectionWatcher:
+    """
+    Watches selection changes over a single persistent X connection, using XFixes events, and reads
+    selection content in-process. So no processes are started on each change, unlike with
+    clipnotify and xsel.
+
+    Not thread safe, all methods must be called from the same thread.
+    """
+
+    _WATCHED_SELECTIONS: Final[list[bytes]] = [b'PRIMARY', b'CLIPBOARD']
+    """Same as watched by clipnotify"""
+    _READ_SELECTION: Final[bytes] = b'PRIMARY'
+    """Same as read by `xsel -o`"""
+    _READ_TIMEOUT: Final[float] = 1.0
+    """How long to wait for the selection owner to send its content"""
+    _MAX_TARGETS: Final[int] = 256
+
+    _library: X11Library
+    _display: int
+    _window: int
+    """Invisible window, into which the selection content is received"""
+    _connectionFd: int
+    _xfixesEventBase: int
+    _atomSelection: int
+    _atomProperty: int
+    _atomUtf8String: int
+    _atomTextPlainUtf8: int
+    _atomString: int
+    _atomIncr: int
+    _atomTargets: int
+
+    _readTargets: list[int]
+    """Text targets to request, in order of preference. Set by probeTextTarget"""
+
+    _event: XEvent
+    _changePending: bool
+    """Selection change was received while waiting for another event"""
+
+    def __init__(self, library: X11Library, displayName: str | None = None):
+        """
+        :param displayName: None to use DISPLAY environment variable
+        :raises Exception: if X display cannot be opened or XFixes extension is not available
+        """
+
+        self._library = library
+        x11 = library.x11
+
+        display = x11.XOpenDisplay(displayName.encode() if displayName is not None else None)
+
+        if not display:
+            raise Exception('Cannot open X display')
+
+        self._display = display
+        eventBase = ctypes.c_int()
+        errorBase = ctypes.c_int()
+
+        if not library.xfixes.XFixesQueryExtension(
+            display, ctypes.byref(eventBase), ctypes.byref(errorBase)
+        ):
+            x11.XCloseDisplay(display)
+
+            raise Exception('X server does not support XFixes extension')
+
+        self._xfixesEventBase = eventBase.value
+        self._connectionFd = x11.XConnectionNumber(display)
+
+        root = x11.XDefaultRootWindow(display)
+        self._window = x11.XCreateSimpleWindow(display, root, 0, 0, 1, 1, 0, 0, 0)
+
+        for selection in self._WATCHED_SELECTIONS:
+            library.xfixes.XFixesSelectSelectionInput(
+                display,
+                root,
+                x11.XInternAtom(display, selection, False),
+                X11Library.XFIXES_SET_SELECTION_OWNER_NOTIFY_MASK,
+            )
+
+        self._atomSelection = x11.XInternAtom(display, self._READ_SELECTION, False)
+        self._atomProperty = x11.XInternAtom(display, b'STATUSBAR_CONVERTER_SELECTION', False)
+        self._atomUtf8String = x11.XInternAtom(display, b'UTF8_STRING', False)
+        self._atomTextPlainUtf8 = x11.XInternAtom(display, b'text/plain;charset=utf-8', False)
+        self._atomString = x11.XInternAtom(display, b'STRING', False)
+        self._atomIncr = x11.XInternAtom(display, b'INCR', False)
+        self._atomTargets = x11.XInternAtom(display, b'TARGETS', False)
+        x11.XFlush(display)
+
+        # Some old applications don't support UTF8_STRING, same fallback as in xsel
+        self._readTargets = [self._atomUtf8String, self._atomString]
+
+        self._event = XEvent()
+        self._changePending = False
+
+    def waitForChange(self, timeout: float | None = None) -> bool:
+        """
+        Blocks until a watched selection changes. Multiple changes already received are reported
+        as a single one
+
+        :param timeout: seconds. None to wait without timeout
+        :return: False if timeout passed without changes
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while not self._changePending:
+            event = self._nextEvent(deadline)
+
+            if event is None:
+                return False
+
+            self._handleEvent(event)
+
+        while self._library.x11.XPending(self._display) > 0:
+            self._handleEvent(self._nextEvent(None))
+
+        self._changePending = False
+
+        return True
+
+    def probeTextTarget(self) -> bool:
+        """
+        Queries selection TARGETS, to find out if it can be read as text, without transferring
+        the content itself. Must be called before readSelection
+
+        :return: False if selection owner offers only non-text content, e.g. image or files.
+            True if it offers text, or does not support TARGETS
+        """
+
+        targets = self._readAtomsProperty() if self._requestSelection(self._atomTargets) else []
+
+        if len(targets) == 0:
+            # Owner does not support TARGETS or there is no selection, so text is tried anyway
+            self._readTargets = [self._atomUtf8String, self._atomString]
+
+            return True
+
+        self._readTargets = [
+            target
+            for target in [self._atomUtf8String, self._atomTextPlainUtf8, self._atomString]
+            if target in targets
+        ]
+
+        return len(self._readTargets) > 0
+
+    def readSelection(self, maxBytes: int) -> str | None:
+        """
+        :param maxBytes: content is read only up to at least this many bytes. So if content is
+            longer, returned text is cut, but still longer than maxBytes / 4 characters
+        :return: None if selection owner did not respond or content is too big to be sent at once.
+            Empty string if there is no selection
+        """
+
+        content: bytes | None = b''
+        target = self._atomUtf8String
+
+        for target in self._readTargets:
+            content = self._convertSelection(target, maxBytes)
+
+            if content != b'':
+                break
+
+        if content is None:
+            return None
+
+        if target == self._atomString:
+            return content.decode('latin-1')
+
+        return content.decode('utf-8', errors='replace')
+
+    def close(self) -> None:
+        self._library.x11.XCloseDisplay(self._display)
+
+    def _convertSelection(self, target: int, maxBytes: int) -> bytes | None:
+        converted = self._requestSelection(target)
+
+        if converted is None:
+            return None
+
+        if not converted:
+            return b''
+
+        return self._readProperty(maxBytes)
+
+    def _requestSelection(self, target: int) -> bool | None:
+        """
+        Asks selection owner to convert selection to target and waits until it's done
+
+        :return: None if selection owner did not respond. False if there is no owner, or it refused
+            to convert to this target. True if converted content is ready in the property
+        """
+
+        x11 = self._library.x11
+
+        x11.XConvertSelection(
+            self._display,
+            self._atomSelection,
+            target,
+            self._atomProperty,
+            self._window,
+            X11Library.CURRENT_TIME,
+        )
+        x11.XFlush(self._display)
+
+        deadline = time.monotonic() + self._READ_TIMEOUT
+
+        while True:
+            event = self._nextEvent(deadline)
+
+            if event is None:
+                return None
+
+            if (
+                event.type == X11Library.SELECTION_NOTIFY
+                and event.xselection.requestor == self._window
+            ):
+                return event.xselection.property != X11Library.NONE
+
+            self._handleEvent(event)
+
+    def _readAtomsProperty(self) -> list[int]:
+        x11 = self._library.x11
+        actualType = ctypes.c_ulong()
+        actualFormat = ctypes.c_int()
+        itemsCount = ctypes.c_ulong()
+        bytesAfter = ctypes.c_ulong()
+        data = ctypes.POINTER(ctypes.c_ubyte)()
+
+        status = x11.XGetWindowProperty(
+            self._display,
+            self._window,
+            self._atomProperty,
+            0,
+            self._MAX_TARGETS,
+            True,
+            X11Library.ANY_PROPERTY_TYPE,
+            ctypes.byref(actualType),
+            ctypes.byref(actualFormat),
+            ctypes.byref(itemsCount),
+            ctypes.byref(bytesAfter),
+            ctypes.byref(data),
+        )
+
+        if status != X11Library.SUCCESS:
+            return []
+
+        try:
+            if not data or actualFormat.value != 32:
+                return []
+
+            # Xlib returns 32-bit format items as C longs
+            atoms = ctypes.cast(data, ctypes.POINTER(ctypes.c_ulong))
+
+            return [atoms[index] for index in range(itemsCount.value)]
+        finally:
+            if data:
+                x11.XFree(data)
+
+    def _readProperty(self, maxBytes: int) -> bytes | None:
+        x11 = self._library.x11
+        actualType = ctypes.c_ulong()
+        actualFormat = ctypes.c_int()
+        itemsCount = ctypes.c_ulong()
+        bytesAfter = ctypes.c_ulong()
+        data = ctypes.POINTER(ctypes.c_ubyte)()
+
+        status = x11.XGetWindowProperty(
+            self._display,
+            self._window,
+            self._atomProperty,
+            0,
+            # Length is in 32-bit units
+            (maxBytes + 3) // 4,
+            True,
+            X11Library.ANY_PROPERTY_TYPE,
+            ctypes.byref(actualType),
+            ctypes.byref(actualFormat),
+            ctypes.byref(itemsCount),
+            ctypes.byref(bytesAfter),
+            ctypes.byref(data),
+        )
+
+        if status != X11Library.SUCCESS:
+            return None
+
+        try:
+            if actualType.value == self._atomIncr:
+                # Content is sent in parts only if it's much longer than any text worth converting
+                x11.XDeleteProperty(self._display, self._window, self._atomProperty)
+
+                return None
+
+            if not data or actualFormat.value != 8:
+                return b''
+
+            return ctypes.string_at(data, itemsCount.value)
+        finally:
+            if data:
+                x11.XFree(data)
+
+    def _nextEvent(self, deadline: float | None) -> XEvent | None:
+        """
+        :param deadline: time.monotonic() value. None to wait without timeout
+        :return: None if deadline passed
+        """
+
+        x11 = self._library.x11
+
+        while x11.XPending(self._display) == 0:
+            timeout = None if deadline is None else deadline - time.monotonic()
+
+            if timeout is not None and timeout <= 0:
+                return None
+
+            select.select([self._connectionFd], [], [], timeout)
+
+        x11.XNextEvent(self._display, ctypes.byref(self._event))
+
+        return self._event
+
+    def _handleEvent(self, event: XEvent | None) -> None:
+        if event is None:
+            return
+
+        if event.type == self._xfixesEventBase + X11Library.XFIXES_SELECTION_NOTIFY:
+            self._changePending = True
@@ -1,25 +1,50 @@
 # mypy: disable-error-code="type-abstract"
+import contextlib
+import multiprocessing
+import os
 import platform
 import sys
 import time
+from typing import TYPE_CHECKING
 
 from src.Constant.AppConstant import AppConstant
 from src.Constant.Logs import Logs
-from src.Service.AppLoop import AppLoop
 from src.Service.ArgumentParser import ArgumentParser
-from src.Service.AutostartManager import AutostartManager
-from src.Service.ClipboardManager import ClipboardManager
-from src.Service.Configuration import Configuration
-from src.Service.Conversion.Unit.Currency.ConversionRateUpdater import ConversionRateUpdater
-from src.Service.Debug import Debug
-from src.Service.Logger import Logger
 from src.Service.OSSwitch import OSSwitch
-from src.Service.ServiceBuilder import ServiceBuilder
-from src.Service.StatusbarApp import StatusbarApp
+
+if TYPE_CHECKING:
+    from src.Service.StartupProfiler import StartupProfiler
 
 
 def main() -> None:
-    services = ServiceBuilder().initializeServices()
+    argumentParser = ArgumentParser()
+
+    if argumentParser.isHeadless() or argumentParser.getConvertFile() is not None:
+        mainHeadless(argumentParser)
+
+        return
+
+    profiler: StartupProfiler | None = None
+
+    if argumentParser.isProfileStartupEnabled():
+        from src.Service.StartupProfiler import StartupProfiler
+
+        profiler = StartupProfiler(OSSwitch())
+        profiler.start()
+
+    # Services are imported only here, after the profiler is started. StatusbarApp also loads
+    # GUI libraries
+    from src.Service.AppLoop import AppLoop
+    from src.Service.AutostartManager import AutostartManager
+    from src.Service.ClipboardManager import ClipboardManager
+    from src.Service.Configuration import Configuration
+    from src.Service.Conversion.Unit.Currency.ConversionRateUpdater import ConversionRateUpdater
+    from src.Service.Debug import Debug
+    from src.Service.Logger import Logger
+    from src.Service.ServiceBuilder import ServiceBuilder
+    from src.Service.StatusbarApp import StatusbarApp
+
+    services = ServiceBuilder(profiler).initializeServices(argumentParser)
 
     logger = services[Logger]
     config = services[Configuration]
@@ -35,7 +60,7 @@ def main() -> None:
         f'Debug: {"enabled" if debug.isDebugEnabled() else "disabled"}\n\n',
     )
 
-    sleepTime = services[ArgumentParser].getSleep()
+    sleepTime = argumentParser.getSleep()
 
     if sleepTime is not None:
         logger.log(f'{Logs.catStart}Sleeping for {sleepTime} seconds...')
@@ -49,12 +74,57 @@ def main() -> None:
 
         return
 
+    # Built before clipboard watch is started, so it's already subscribed to events
+    statusbarApp = services[StatusbarApp]
     services[AutostartManager].setupAutostart()
     clipboardManager.initializeClipboardWatch()
     services[ConversionRateUpdater].initializeRatesAsync()
     services[AppLoop].startLoop()
-    services[StatusbarApp].createApp()
+
+    if profiler is not None:
+        profiler.stop()
+        logger.log(f'{Logs.catStart}{profiler.getReport()}')
+
+    statusbarApp.createApp()
+
+
+def mainHeadless(argumentParser: ArgumentParser) -> None:
+    from src.Service.Debug import Debug
+    from src.Service.FileConverter import FileConverter
+    from src.Service.HeadlessApp import HeadlessApp
+    from src.Service.Logger import Logger
+    from src.Service.ServiceBuilder import ServiceBuilder
+
+    services = ServiceBuilder().initializeHeadlessServices(argumentParser)
+    logger = services[Logger]
+
+    logger.setDebugEnabled(services[Debug].isDebugEnabled())
+
+    convertFilePath = argumentParser.getConvertFile()
+    outputPath = argumentParser.getOutput()
+
+    try:
+        with contextlib.ExitStack() as stack:
+            outputStream = (
+                sys.stdout
+                if outputPath is None
+                else stack.enter_context(open(outputPath, 'w', encoding='utf-8'))
+            )
+
+            if convertFilePath is not None:
+                services[FileConverter].convertFile(
+                    convertFilePath, outputStream, argumentParser.getWorkers()
+                )
+            else:
+                services[HeadlessApp].run(sys.stdin.buffer, outputStream)
+    except BrokenPipeError:
+        # Output was closed early, e.g. piped to `head`. Redirect the rest of stdout to devnull,
+        # so Python doesn't fail again when flushing it on exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        logger.log(f'{Logs.catHeadless}Output closed, stopping')
 
 
 if __name__ == '__main__':
+    # Needed for worker processes of FileConverter in the packaged app
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,112 @@
+import random
+from typing import Final
+
+
+class BenchmarkCorpus:
+    """
+    Generates a deterministic corpus of realistic clipboard texts: timestamps, metric/imperial
+    values, currencies and garbage that should not be converted.
+    """
+
+    _METRIC_IMPERIAL_UNITS: Final[list[str]] = [
+        'mm', 'cm', 'm', 'km', 'in', 'inches', '"', 'ft', 'feet', "'", 'yd', 'mi', 'miles',
+        'ml', 'l', 'liters', 'm3', 'tsp', 'tbsp', 'cups', 'fl oz', 'pt', 'qt', 'gal',
+        'mg', 'g', 'kg', 'kgs', 'oz', 'lb', 'lbs', 'st', 'tons',
+        '°C', 'C', 'celsius', '°F', 'F', 'fahrenheit',
+    ]  # fmt: skip
+
+    _CURRENCIES_BEFORE: Final[list[str]] = ['$', '€', '£', '¥', '₿', 'S/']
+    _CURRENCIES_AFTER: Final[list[str]] = [
+        'usd', 'USD', 'eur', 'EUR', '€', '$', 'gbp', 'CAD', 'zł', 'лв.', '₾', 'btc', 'ETH',
+    ]  # fmt: skip
+
+    _GARBAGE: Final[list[str]] = [
+        'Random text', 'hello world', 'TODO', 'def main():', 'https://github.com', 'a', '-',
+        '123 asd', '5ab', '3 3', '1.2.3', '11.22.33', '1,234.567,890m', 'm3m', 'v2.3.0',
+        '2024-12-01', '12:45:00', '#ff00aa', 'user@example.com', '¯\\_(ツ)_/¯', '42', '-15',
+        '3.14159', '0x1F', 'SELECT * FROM t', '{"a": 1}', 'None', 'null',
+    ]  # fmt: skip
+
+    _rng: random.Random
+
+    def __init__(self, seed: int):
+        self._rng = random.Random(seed)
+
+    def generate(self, size: int) -> list[str]:
+        generators = [
+            (0.2, self._timestamp),
+            (0.35, self._metricImperial),
+            (0.2, self._currency),
+            (0.25, self._garbage),
+        ]
+        weights = [weight for weight, _ in generators]
+        callbacks = [callback for _, callback in generators]
+
+        corpus = []
+
+        for _ in range(size):
+            callback = self._rng.choices(callbacks, weights)[0]
+            corpus.append(callback().strip())
+
+        return corpus
+
+    def generateNumbers(self, size: int) -> list[str]:
+        """
+        Numbers with separators, as they would be passed to ThousandsDetector
+        """
+
+        numbers = []
+
+        while len(numbers) < size:
+            number = self._number()
+
+            if ',' in number or '.' in number:
+                numbers.append(number)
+
+        return numbers
+
+    def _timestamp(self) -> str:
+        seconds = self._rng.randint(100_000_000, 2_000_000_000)
+
+        if self._rng.random() < 0.3:
+            return f'{seconds}{self._rng.randint(0, 999):03d}'
+
+        return str(seconds)
+
+    def _metricImperial(self) -> str:
+        unit = self._rng.choice(self._METRIC_IMPERIAL_UNITS)
+
+        if self._rng.random() < 0.2:
+            unit = unit.upper()
+
+        return f'{self._number()}{self._space()}{unit}'
+
+    def _currency(self) -> str:
+        if self._rng.random() < 0.4:
+            return f'{self._rng.choice(self._CURRENCIES_BEFORE)}{self._space()}{self._number()}'
+
+        return f'{self._number()}{self._space()}{self._rng.choice(self._CURRENCIES_AFTER)}'
+
+    def _garbage(self) -> str:
+        return self._rng.choice(self._GARBAGE)
+
+    def _number(self) -> str:
+        kind = self._rng.random()
+        sign = '-' if self._rng.random() < 0.1 else ''
+
+        if kind < 0.4:
+            return f'{sign}{self._rng.randint(0, 999)}'
+
+        if kind < 0.7:
+            return f'{sign}{self._rng.uniform(0, 1000):.{self._rng.randint(1, 4)}f}'
+
+        if kind < 0.85:
+            return f'{sign}{self._rng.randint(1000, 9_999_999):,}'
+
+        # Dot thousands separator, comma decimal separator
+        number = f'{self._rng.uniform(1000, 999_999):,.2f}'
+
+        return sign + number.replace(',', '#').replace('.', ',').replace('#', '.')
+
+    def _space(self) -> str:
+        return ' ' if self._rng.random() < 0.6 else ''
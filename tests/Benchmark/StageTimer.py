@@ -0,0 +1,62 @@
+import time
+from collections.abc import Callable
+from typing import Any
+
+
+class StageTimer:
+    """
+    Records call durations of individual service methods (conversion stages).
+
+    Methods are wrapped on the service instance, so only calls through that instance are recorded.
+    Recorded time is inclusive: e.g. UnitParser.parseText time includes ThousandsDetector time.
+    """
+
+    _samples: dict[str, list[int]]
+
+    def __init__(self):
+        self._samples = {}
+
+    def instrument(self, stageName: str, instance: object, methodName: str) -> None:
+        original: Callable = getattr(instance, methodName)
+        samples = self._samples.setdefault(stageName, [])
+
+        def timed(*args, **kwargs) -> Any:
+            start = time.perf_counter_ns()
+
+            try:
+                return original(*args, **kwargs)
+            finally:
+                samples.append(time.perf_counter_ns() - start)
+
+        setattr(instance, methodName, timed)
+
+    def getSamples(self) -> dict[str, list[int]]:
+        return {stage: samples for stage, samples in self._samples.items() if len(samples) > 0}
+
+    @staticmethod
+    def summarize(samples: list[int], totalTimeNs: int | None = None) -> dict[str, float | int]:
+        """
+        :param samples: durations in nanoseconds
+        :param totalTimeNs: wall time of the whole run. If not given, ops/sec is calculated from
+            the sum of samples
+        """
+
+        ordered = sorted(samples)
+        count = len(ordered)
+
+        if totalTimeNs is None:
+            totalTimeNs = sum(ordered)
+
+        return {
+            'count': count,
+            'p50Us': round(StageTimer._percentile(ordered, 50) / 1000, 3),
+            'p99Us': round(StageTimer._percentile(ordered, 99) / 1000, 3),
+            'meanUs': round(sum(ordered) / count / 1000, 3),
+            'opsPerSecond': round(count / (totalTimeNs / 1_000_000_000)),
+        }
+
+    @staticmethod
+    def _percentile(ordered: list[int], percentile: int) -> float:
+        index = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+
+        return ordered[index]
@@ -0,0 +1,67 @@
+"""
+Batch conversion benchmark: UnitConverterInterface.tryConvertBatch vs a tryConvert loop, for one unit.
+
+Needs NumPy, install it with `pip install -r requirements_optional.txt`.
+
+Usage:
+    python -m tests.Benchmark.benchmarkBatchConversion [--count 1000000]
+"""
+
+import argparse
+import random
+import time
+
+from src.Constant.ConfigId import ConfigId
+from src.Service.CLIArgsCreator import CLIArgsCreator
+from src.Service.Conversion.Rounder import Rounder
+from src.Service.Conversion.Unit.MetricImperial.DistanceConverter import DistanceConverter
+from tests.TestUtil.MockLibrary import MockLibrary
+
+
+class BatchConversionBenchmark:
+    _arguments: argparse.Namespace
+
+    def __init__(self):
+        parser = argparse.ArgumentParser(description='Batch conversion benchmark')
+        argsCreator = CLIArgsCreator(parser)
+
+        argsCreator.addOptionInt('--count', 'Number of values to convert')
+        argsCreator.addOptionInt('--seed', 'Values generator seed')
+
+        self._arguments = parser.parse_args()
+
+    def run(self) -> None:
+        count = self._arguments.count or 1_000_000
+        seed = self._arguments.seed if self._arguments.seed is not None else 42
+
+        generator = random.Random(seed)
+        numbers = [10 ** generator.uniform(-3, 9) for _ in range(count)]
+        converter = DistanceConverter(
+            Rounder(),
+            MockLibrary.getConfig(
+                [
+                    (ConfigId.Converter_Distance_Enabled, True),
+                    (ConfigId.Converter_Distance_PrimaryUnit_Metric, True),
+                ]
+            ),
+        )
+
+        print(f'{count} values, ft to metric, seed {seed}\n')
+
+        start = time.perf_counter()
+
+        for number in numbers:
+            converter.tryConvert(number, 'ft')
+
+        loopSeconds = time.perf_counter() - start
+        start = time.perf_counter()
+        converter.tryConvertBatch(numbers, 'ft')
+        batchSeconds = time.perf_counter() - start
+
+        print(f'tryConvert loop: {loopSeconds:.2f} s')
+        print(f'Batch (NumPy):   {batchSeconds:.2f} s')
+        print(f'\nSpeedup: {loopSeconds / batchSeconds:.1f}x')
+
+
+if __name__ == '__main__':
+    BatchConversionBenchmark().run()
@@ -0,0 +1,328 @@
+"""
+Linux clipboard watch benchmark: native X11 watcher vs clipnotify and xsel processes.
+
+Starts a stub X server (Xvfb), in which a selection owner in this process changes PRIMARY
+selection and waits until the watcher reads the new content, before changing it again.
+Reports changes/sec and per-change latency, from the selection ownership change until
+the content is read.
+
+Requires Xvfb. Subprocess path also requires xsel and clipnotify binary in binaries/clipnotify,
+and is skipped without them.
+
+Usage:
+    python -m tests.Benchmark.benchmarkClipboardX11 [--changes 1000] [--display :99]
+"""
+
+import argparse
+import ctypes
+import os
+import select
+import shutil
+import subprocess
+import threading
+import time
+from collections.abc import Callable
+from typing import Final
+
+from src.Service.CLIArgsCreator import CLIArgsCreator
+from src.Service.X11Library import X11Library, XEvent
+from src.Service.X11SelectionWatcher import X11SelectionWatcher
+from tests.Benchmark.StageTimer import StageTimer
+from tests.TestUtil.TestsFilesystemHelper import TestsFilesystemHelper
+
+
+class SelectionOwnerStub:
+    """
+    Owns PRIMARY selection in its own X connection and serves its content as UTF8_STRING,
+    and TARGETS
+    """
+
+    _library: X11Library
+    _display: int
+    _windows: list[int]
+    """Ownership is alternated between 2 windows, so each change is a real owner change"""
+    _ownerIndex: int
+    _connectionFd: int
+    _atomPrimary: int
+    _atomUtf8String: int
+    _atomTargets: int
+
+    _content: bytes
+    _changedAt: int
+    """time.perf_counter_ns() of the last change"""
+
+    def __init__(self, library: X11Library, displayName: str):
+        x11 = library.x11
+
+        self._library = library
+        self._display = x11.XOpenDisplay(displayName.encode())
+
+        if not self._display:
+            raise Exception(f'Cannot open X display {displayName}')
+
+        root = x11.XDefaultRootWindow(self._display)
+        self._windows = [
+            x11.XCreateSimpleWindow(self._display, root, 0, 0, 1, 1, 0, 0, 0) for _ in range(2)
+        ]
+        self._connectionFd = x11.XConnectionNumber(self._display)
+        self._atomPrimary = x11.XInternAtom(self._display, b'PRIMARY', False)
+        self._atomUtf8String = x11.XInternAtom(self._display, b'UTF8_STRING', False)
+        self._atomTargets = x11.XInternAtom(self._display, b'TARGETS', False)
+        self._ownerIndex = 0
+        self._content = b''
+        self._changedAt = 0
+
+    def getChangedAt(self) -> int:
+        return self._changedAt
+
+    def change(self, index: int) -> None:
+        self._content = f'{index} ft'.encode()
+        self._changedAt = time.perf_counter_ns()
+        self._setOwner()
+
+    def reassertOwnership(self) -> None:
+        """
+        Changes owner without changing content. For watchers that may miss a change, e.g. if it
+        happens while clipnotify is not running yet
+        """
+
+        self._setOwner()
+
+    def serveUntil(self, isDone: Callable[[], bool], timeout: float) -> bool:
+        """
+        :return: False if timeout passed before isDone
+        """
+
+        x11 = self._library.x11
+        event = XEvent()
+        deadline = time.monotonic() + timeout
+
+        while not isDone():
+            if x11.XPending(self._display) == 0:
+                if time.monotonic() > deadline:
+                    return False
+
+                select.select([self._connectionFd], [], [], 0.001)
+
+                continue
+
+            x11.XNextEvent(self._display, ctypes.byref(event))
+
+            if event.type == X11Library.SELECTION_REQUEST:
+                self._serveRequest(event)
+
+        return True
+
+    def close(self) -> None:
+        self._library.x11.XCloseDisplay(self._display)
+
+    def _setOwner(self) -> None:
+        self._ownerIndex = (self._ownerIndex + 1) % len(self._windows)
+
+        x11 = self._library.x11
+        x11.XSetSelectionOwner(
+            self._display,
+            self._atomPrimary,
+            self._windows[self._ownerIndex],
+            X11Library.CURRENT_TIME,
+        )
+        x11.XFlush(self._display)
+
+    def _serveRequest(self, event: XEvent) -> None:
+        x11 = self._library.x11
+        request = event.xselectionrequest
+        notify = XEvent()
+        notify.xselection.type = X11Library.SELECTION_NOTIFY
+        notify.xselection.display = request.display
+        notify.xselection.requestor = request.requestor
+        notify.xselection.selection = request.selection
+        notify.xselection.target = request.target
+        notify.xselection.time = request.time
+        notify.xselection.property = X11Library.NONE
+
+        if request.target == self._atomUtf8String:
+            x11.XChangeProperty(
+                self._display,
+                request.requestor,
+                request.property,
+                self._atomUtf8String,
+                8,
+                X11Library.PROP_MODE_REPLACE,
+                self._content,
+                len(self._content),
+            )
+            notify.xselection.property = request.property
+        elif request.target == self._atomTargets:
+            # Format 32 items are passed as C longs
+            targets = (ctypes.c_ulong * 2)(self._atomTargets, self._atomUtf8String)
+            x11.XChangeProperty(
+                self._display,
+                request.requestor,
+                request.property,
+                X11Library.ATOM,
+                32,
+                X11Library.PROP_MODE_REPLACE,
+                bytes(targets),
+                len(targets),
+            )
+            notify.xselection.property = request.property
+
+        x11.XSendEvent(self._display, request.requestor, False, 0, ctypes.byref(notify))
+        x11.XFlush(self._display)
+
+
+class ClipboardX11Benchmark:
+    _XVFB_START_TIMEOUT: Final[float] = 5.0
+    _MISSED_CHANGE_TIMEOUT: Final[float] = 0.5
+
+    _arguments: argparse.Namespace
+    _library: X11Library
+
+    def __init__(self):
+        parser = argparse.ArgumentParser(description='Linux clipboard watch benchmark')
+        argsCreator = CLIArgsCreator(parser)
+
+        argsCreator.addOptionInt('--changes', 'Number of selection changes per watcher')
+        argsCreator.addOptionString(
+            '--display', 'Already running X display to use, instead of starting Xvfb'
+        )
+
+        self._arguments = parser.parse_args()
+        self._library = X11Library()
+
+    def run(self) -> None:
+        changes = self._arguments.changes or 1000
+        displayName = self._arguments.display
+        xvfb: subprocess.Popen | None = None
+
+        if displayName is None:
+            displayName = ':97'
+            xvfb = self._startXvfb(displayName)
+
+        try:
+            print(f'Display {displayName}, {changes} changes per watcher\n')
+            print(f'{"Watcher":<22} {"p50 µs":>9} {"p99 µs":>9} {"changes/sec":>12}')
+
+            native = self._benchmarkNative(displayName, changes)
+            self._printSummary('Native X11', native)
+
+            subprocessSummary = self._benchmarkSubprocess(displayName, changes)
+
+            if subprocessSummary is not None:
+                self._printSummary('clipnotify + xsel', subprocessSummary)
+                print(
+                    f'\nSpeedup (changes/sec): '
+                    f'{native["opsPerSecond"] / subprocessSummary["opsPerSecond"]:.2f}x'
+                )
+        finally:
+            if xvfb is not None:
+                xvfb.terminate()
+                xvfb.wait()
+
+    def _benchmarkNative(self, displayName: str, changes: int) -> dict:
+        watcher = X11SelectionWatcher(self._library, displayName)
+
+        def read() -> str | None:
+            watcher.waitForChange()
+
+            if not watcher.probeTextTarget():
+                return None
+
+            return watcher.readSelection(1024)
+
+        try:
+            return self._benchmark(displayName, changes, read)
+        finally:
+            watcher.close()
+
+    def _benchmarkSubprocess(self, displayName: str, changes: int) -> dict | None:
+        clipnotifyPath = TestsFilesystemHelper().getProjectDir() + '/binaries/clipnotify/clipnotify'
+
+        if shutil.which('xsel') is None or not os.path.isfile(clipnotifyPath):
+            print('clipnotify + xsel: skipped, xsel or clipnotify binary not found')
+
+            return None
+
+        environment = dict(os.environ, DISPLAY=displayName)
+
+        def read() -> str | None:
+            # Same commands as in ClipboardManagerLinux._watchClipboardSubprocess
+            subprocess.call([clipnotifyPath], env=environment)
+
+            return subprocess.run(
+                ['xsel', '-o'], env=environment, capture_output=True, text=True
+            ).stdout
+
+        return self._benchmark(displayName, changes, read)
+
+    def _benchmark(self, displayName: str, changes: int, read: Callable[[], str | None]) -> dict:
+        owner = SelectionOwnerStub(self._library, displayName)
+        samples: list[int] = []
+        readDone = threading.Event()
+        missedChanges = 0
+        staleReads = 0
+
+        def runOwner() -> None:
+            nonlocal missedChanges
+
+            for index in range(changes):
+                readDone.clear()
+                owner.change(index)
+
+                while not owner.serveUntil(readDone.is_set, self._MISSED_CHANGE_TIMEOUT):
+                    missedChanges += 1
+                    owner.reassertOwnership()
+
+        ownerThread = threading.Thread(target=runOwner, daemon=True)
+        startedAt = time.perf_counter_ns()
+        ownerThread.start()
+
+        try:
+            for index in range(changes):
+                # Latency is measured from the first change of the content, so it includes the
+                # time while a watcher missed the change, if it did
+                while read() != f'{index} ft':
+                    staleReads += 1
+
+                samples.append(time.perf_counter_ns() - owner.getChangedAt())
+                readDone.set()
+
+            totalTimeNs = time.perf_counter_ns() - startedAt
+            ownerThread.join()
+        finally:
+            owner.close()
+
+        if missedChanges > 0 or staleReads > 0:
+            print(f'  {missedChanges} missed changes, {staleReads} stale reads')
+
+        return StageTimer.summarize(samples, totalTimeNs)
+
+    def _startXvfb(self, displayName: str) -> subprocess.Popen:
+        if shutil.which('Xvfb') is None:
+            raise Exception('Xvfb is not installed. Install it or pass --display')
+
+        xvfb = subprocess.Popen(['Xvfb', displayName, '-nolisten', 'tcp'])
+        deadline = time.monotonic() + self._XVFB_START_TIMEOUT
+
+        while time.monotonic() < deadline:
+            display = self._library.x11.XOpenDisplay(displayName.encode())
+
+            if display:
+                self._library.x11.XCloseDisplay(display)
+
+                return xvfb
+
+            time.sleep(0.05)
+
+        xvfb.terminate()
+
+        raise Exception(f'Xvfb did not start on display {displayName}')
+
+    def _printSummary(self, name: str, summary: dict) -> None:
+        print(
+            f'{name:<22} {summary["p50Us"]:>9} {summary["p99Us"]:>9} {summary["opsPerSecond"]:>12}'
+        )
+
+
+if __name__ == '__main__':
+    ClipboardX11Benchmark().run()
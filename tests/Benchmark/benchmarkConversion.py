@@ -0,0 +1,226 @@
+"""
+Conversion hot-path benchmark.
+
+Drives ConversionManager.onClipboardChange with a generated corpus of clipboard texts and reports
+p50/p99 latency and ops/sec, end to end and per conversion stage. Results are saved as JSON, so
+runs can be compared to catch regressions.
+
+Usage:
+    python -m tests.Benchmark.benchmarkConversion [--compare var/benchmark/previous.json]
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import time
+from typing import Any, Final
+from unittest.mock import Mock
+
+from src.DTO.ConvertResult import ConvertResult
+from src.DTO.ServiceContainer import ServiceContainer
+from src.Service.CLIArgsCreator import CLIArgsCreator
+from src.Service.Conversion.ConversionManager import ConversionManager
+from src.Service.Conversion.ConverterInterface import ConverterInterface
+from src.Service.Conversion.Rounder import Rounder
+from src.Service.Conversion.TextLexer import TextLexer
+from src.Service.Conversion.Unit.ThousandsDetector import ThousandsDetector
+from src.Service.Conversion.Unit.UnitConverterInterface import UnitConverterInterface
+from src.Service.Conversion.Unit.UnitParser import UnitParser
+from src.Service.Conversion.Unit.UnitToConverterMapper import UnitToConverterMapper
+from src.Service.EventService import EventService
+from src.Service.Logger import Logger
+from tests.Benchmark.BenchmarkCorpus import BenchmarkCorpus
+from tests.Benchmark.StageTimer import StageTimer
+from tests.TestUtil.ConversionServicesBuilder import ConversionServicesBuilder
+from tests.TestUtil.TestsFilesystemHelper import TestsFilesystemHelper
+
+
+class ConversionBenchmark:
+    _STAGE_END_TO_END: Final[str] = 'ConversionManager.onClipboardChange'
+
+    _arguments: argparse.Namespace
+    _projectDir: str
+
+    def __init__(self):
+        parser = argparse.ArgumentParser(description='Conversion hot-path benchmark')
+        argsCreator = CLIArgsCreator(parser)
+
+        argsCreator.addOptionInt('--corpus-size', 'Number of generated clipboard texts')
+        argsCreator.addOptionInt('--iterations', 'How many times to run the whole corpus')
+        argsCreator.addOptionInt('--seed', 'Corpus generator seed')
+        argsCreator.addOptionString('--output', 'Path to save JSON results to')
+        argsCreator.addOptionString('--compare', 'Path to JSON results of a previous run')
+        argsCreator.addOptionInt(
+            '--max-regression',
+            'Fail if p50 of any stage is slower by more than this percent than in --compare run',
+        )
+
+        self._arguments = parser.parse_args()
+        self._projectDir = TestsFilesystemHelper().getProjectDir()
+
+    def run(self) -> None:
+        corpusSize = self._arguments.corpus_size or 20_000
+        iterations = self._arguments.iterations or 3
+        seed = self._arguments.seed if self._arguments.seed is not None else 42
+
+        corpus = BenchmarkCorpus(seed).generate(corpusSize)
+
+        print(f'Corpus: {corpusSize} texts, {iterations} iterations, seed {seed}\n')
+
+        results: dict[str, Any] = {
+            'createdAt': datetime.datetime.now().isoformat(timespec='seconds'),
+            'appVersion': self._getAppVersion(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'corpusSize': corpusSize,
+            'iterations': iterations,
+            'seed': seed,
+            'endToEnd': self._benchmarkEndToEnd(corpus, iterations),
+            'stages': self._benchmarkStages(corpus, iterations),
+        }
+
+        self._printResults(results)
+        outputPath = self._saveResults(results)
+        print(f'\nResults saved to: {outputPath}')
+
+        if self._arguments.compare is not None and not self._compare(results):
+            sys.exit(1)
+
+    def _benchmarkEndToEnd(self, corpus: list[str], iterations: int) -> dict:
+        conversionManager = self._buildServices()[ConversionManager]
+        samples: list[int] = []
+
+        # Warm-up
+        for text in corpus:
+            conversionManager.onClipboardChange(text)
+
+        runStart = time.perf_counter_ns()
+
+        for _ in range(iterations):
+            for text in corpus:
+                start = time.perf_counter_ns()
+                conversionManager.onClipboardChange(text)
+                samples.append(time.perf_counter_ns() - start)
+
+        return StageTimer.summarize(samples, time.perf_counter_ns() - runStart)
+
+    def _benchmarkStages(self, corpus: list[str], iterations: int) -> dict:
+        # Stages are measured on separate services, so instrumentation overhead does not affect
+        # end-to-end results
+        services = self._buildServices(True)
+        timer = StageTimer()
+
+        timer.instrument('TextLexer.tokenize', services[TextLexer], 'tokenize')
+        timer.instrument('UnitParser.parseToken', services[UnitParser], 'parseToken')
+        timer.instrument(
+            'ThousandsDetector.parseNumber', services[ThousandsDetector], 'parseNumber'
+        )
+        timer.instrument(
+            'UnitToConverterMapper.getConverter', services[UnitToConverterMapper], 'getConverter'
+        )
+
+        for converter in services[list[ConverterInterface]]:  # type: ignore[misc]
+            timer.instrument(f'Converter.{converter.getName()}.tryConvert', converter, 'tryConvert')
+
+        for unitConverter in services[list[UnitConverterInterface]]:  # type: ignore[misc]
+            timer.instrument(
+                f'UnitConverter.{unitConverter.getName()}.tryConvert', unitConverter, 'tryConvert'
+            )
+
+        rounder = services[Rounder]
+        timer.instrument('Rounder.round', rounder, 'round')
+        timer.instrument('Rounder.roundCurrency', rounder, 'roundCurrency')
+
+        conversionManager = services[ConversionManager]
+
+        for _ in range(iterations):
+            for text in corpus:
+                conversionManager.onClipboardChange(text)
+
+        return {
+            stage: StageTimer.summarize(samples) for stage, samples in timer.getSamples().items()
+        }
+
+    def _buildServices(self, withStages: bool = False) -> ServiceContainer:
+        def onConverted(result: ConvertResult) -> None:
+            pass
+
+        events = EventService(Mock(Logger))
+        events.subscribeConverted(onConverted)
+
+        if withStages:
+            return ConversionServicesBuilder.buildStages(events)
+
+        return ConversionServicesBuilder.build(events)
+
+    def _printResults(self, results: dict) -> None:
+        header = f'{"Stage":<42} {"Count":>9} {"p50 µs":>9} {"p99 µs":>9} {"ops/sec":>11}'
+        print(header)
+        print('-' * len(header))
+
+        rows = {self._STAGE_END_TO_END: results['endToEnd']} | results['stages']
+
+        for stage, summary in rows.items():
+            print(
+                f'{stage:<42} {summary["count"]:>9} {summary["p50Us"]:>9} '
+                f'{summary["p99Us"]:>9} {summary["opsPerSecond"]:>11}'
+            )
+
+    def _saveResults(self, results: dict) -> str:
+        outputPath = self._arguments.output
+
+        if outputPath is None:
+            outputDir = self._projectDir + '/var/benchmark'
+            os.makedirs(outputDir, exist_ok=True)
+            outputPath = f'{outputDir}/conversion-{time.strftime("%Y%m%d-%H%M%S")}.json'
+
+        with open(outputPath, 'w') as file:
+            json.dump(results, file, indent=4)
+
+        return outputPath
+
+    def _compare(self, results: dict) -> bool:
+        """
+        :return: False if regression limit was exceeded
+        """
+
+        with open(self._arguments.compare, 'r') as file:
+            previous = json.load(file)
+
+        maxRegression = self._arguments.max_regression
+        currentRows = {self._STAGE_END_TO_END: results['endToEnd']} | results['stages']
+        previousRows = {self._STAGE_END_TO_END: previous['endToEnd']} | previous['stages']
+        regressions = []
+
+        print(f'\nComparison with {self._arguments.compare} (p50):')
+
+        for stage, summary in currentRows.items():
+            if stage not in previousRows:
+                continue
+
+            before = previousRows[stage]['p50Us']
+            after = summary['p50Us']
+            changePercent = (after - before) / before * 100 if before > 0 else 0.0
+
+            print(f'{stage:<42} {before:>9} => {after:>9}  ({changePercent:+.1f}%)')
+
+            if maxRegression is not None and changePercent > maxRegression:
+                regressions.append(stage)
+
+        if len(regressions) > 0:
+            print(f'\nREGRESSION over {maxRegression}% in: {", ".join(regressions)}')
+
+            return False
+
+        return True
+
+    def _getAppVersion(self) -> str:
+        with open(self._projectDir + '/version', 'r') as versionFile:
+            return versionFile.read().strip()
+
+
+if __name__ == '__main__':
+    ConversionBenchmark().run()
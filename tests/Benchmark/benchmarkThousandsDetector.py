@@ -0,0 +1,132 @@
+"""
+ThousandsDetector benchmark: single-scan parser vs the original regex implementation.
+
+Times both implementations on generated numbers and checks that they give identical results
+for all strings up to --differential-length characters from a small alphabet.
+
+Usage:
+    python -m tests.Benchmark.benchmarkThousandsDetector [--differential-length 8]
+"""
+
+import argparse
+import itertools
+import sys
+import time
+from collections.abc import Callable
+from typing import Final
+
+from src.Service.CLIArgsCreator import CLIArgsCreator
+from src.Service.Conversion.Unit.ThousandsDetector import ThousandsDetector
+from tests.Benchmark.BenchmarkCorpus import BenchmarkCorpus
+from tests.Benchmark.StageTimer import StageTimer
+from tests.TestUtil.LegacyThousandsDetector import LegacyThousandsDetector
+
+
+class ThousandsDetectorBenchmark:
+    _DIFFERENTIAL_ALPHABET: Final[str] = '015.,-'
+
+    _arguments: argparse.Namespace
+
+    def __init__(self):
+        parser = argparse.ArgumentParser(description='ThousandsDetector benchmark')
+        argsCreator = CLIArgsCreator(parser)
+
+        argsCreator.addOptionInt('--corpus-size', 'Number of generated numbers')
+        argsCreator.addOptionInt('--iterations', 'How many times to run the whole corpus')
+        argsCreator.addOptionInt('--seed', 'Corpus generator seed')
+        argsCreator.addOptionInt(
+            '--differential-length',
+            'Compare implementations on all strings up to this length. 0 to skip',
+        )
+
+        self._arguments = parser.parse_args()
+
+    def run(self) -> None:
+        corpusSize = self._arguments.corpus_size or 20_000
+        iterations = self._arguments.iterations or 5
+        seed = self._arguments.seed if self._arguments.seed is not None else 42
+        differentialLength = self._arguments.differential_length
+
+        if differentialLength is None:
+            differentialLength = 8
+
+        numbers = BenchmarkCorpus(seed).generateNumbers(corpusSize)
+        detector = ThousandsDetector()
+        legacyDetector = LegacyThousandsDetector()
+
+        print(f'Corpus: {corpusSize} numbers, {iterations} iterations, seed {seed}\n')
+        print(f'{"Implementation":<16} {"p50 µs":>9} {"p99 µs":>9} {"ops/sec":>11}')
+
+        legacy = self._time(legacyDetector.parseNumber, numbers, iterations)
+        current = self._time(detector.parseNumber, numbers, iterations)
+
+        for name, summary in [('Regex (legacy)', legacy), ('Single-scan', current)]:
+            print(
+                f'{name:<16} {summary["p50Us"]:>9} {summary["p99Us"]:>9} '
+                f'{summary["opsPerSecond"]:>11}'
+            )
+
+        print(f'\nSpeedup (ops/sec): {current["opsPerSecond"] / legacy["opsPerSecond"]:.2f}x')
+
+        if differentialLength > 0 and not self._compare(
+            detector, legacyDetector, differentialLength
+        ):
+            sys.exit(1)
+
+    def _time(
+        self, parse: Callable[[str], float | None], numbers: list[str], iterations: int
+    ) -> dict:
+        samples: list[int] = []
+
+        # Warm-up
+        for number in numbers:
+            parse(number)
+
+        runStart = time.perf_counter_ns()
+
+        for _ in range(iterations):
+            for number in numbers:
+                start = time.perf_counter_ns()
+                parse(number)
+                samples.append(time.perf_counter_ns() - start)
+
+        return StageTimer.summarize(samples, time.perf_counter_ns() - runStart)
+
+    def _compare(
+        self,
+        detector: ThousandsDetector,
+        legacyDetector: LegacyThousandsDetector,
+        maxLength: int,
+    ) -> bool:
+        """
+        :return: False if implementations gave different results
+        """
+
+        count = 0
+        mismatches = 0
+        start = time.perf_counter()
+
+        for length in range(maxLength + 1):
+            for characters in itertools.product(self._DIFFERENTIAL_ALPHABET, repeat=length):
+                number = ''.join(characters)
+                expected = repr(legacyDetector.parseNumber(number))
+                actual = repr(detector.parseNumber(number))
+                count += 1
+
+                if expected != actual:
+                    mismatches += 1
+
+                    if mismatches <= 20:
+                        print(f'MISMATCH {number!r}: expected {expected}, got {actual}')
+
+        print(
+            f'\nDifferential: {count} inputs up to {maxLength} characters from '
+            f'"{self._DIFFERENTIAL_ALPHABET}", {mismatches} mismatches, '
+            f'{time.perf_counter() - start:.1f} s'
+        )
+
+        return mismatches == 0
+
+
+if __name__ == '__main__':
+    ThousandsDetectorBenchmark().run()
@@ -0,0 +1,68 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from src.DTO.ServiceContainer import ServiceContainer
+from src.Service.Conversion.Rounder import Rounder
+from src.Service.EventService import EventService
+from src.Service.Logger import Logger
+from src.Service.Scheduler import Scheduler
+from src.Service.StartupProfiler import StartupProfiler
+
+
+class TestServiceContainer(TestCase):
+    def testFactoryIsCalledOnceOnFirstAccess(self) -> None:
+        container = ServiceContainer()
+        container[Logger] = logger = Mock(Logger)
+        factory = Mock(side_effect=lambda: Scheduler(container[Logger]))
+
+        container.setFactory(Scheduler, factory)
+        factory.assert_not_called()
+
+        scheduler = container[Scheduler]
+
+        self.assertIs(scheduler, container[Scheduler])
+        self.assertIs(logger, scheduler._logger)
+        factory.assert_called_once_with()
+
+    def testFailedFactoryCanBeRetried(self) -> None:
+        container = ServiceContainer()
+        scheduler = Mock(Scheduler)
+        factory = Mock(side_effect=[Exception('Build failed'), scheduler])
+        container.setFactory(Scheduler, factory)
+
+        with self.assertRaisesRegex(Exception, 'Build failed'):
+            container[Scheduler]
+
+        self.assertIs(scheduler, container[Scheduler])
+        self.assertEqual(2, factory.call_count)
+
+    def testCircularDependencyRaises(self) -> None:
+        container = ServiceContainer()
+        container.setFactory(Scheduler, lambda: Scheduler(container[Scheduler]))
+
+        with self.assertRaisesRegex(Exception, 'depends on itself'):
+            container[Scheduler]
+
+    def testExistingServiceCannotBeReplaced(self) -> None:
+        container = ServiceContainer()
+        container[EventService] = EventService(Mock(Logger))
+        container.setFactory(Scheduler, Mock())
+
+        with self.assertRaisesRegex(Exception, 'already exists'):
+            container.setFactory(EventService, EventService)
+
+        with self.assertRaisesRegex(Exception, 'already exists'):
+            container[Scheduler] = Mock(Scheduler)
+
+    def testMissingServiceRaises(self) -> None:
+        with self.assertRaisesRegex(Exception, 'not found'):
+            ServiceContainer()[Scheduler]
+
+    def testFactoryIsMeasuredByProfiler(self) -> None:
+        profiler = Mock(StartupProfiler)
+        profiler.measureService.side_effect = lambda name, factory: factory()
+        container = ServiceContainer(profiler)
+        container.setFactory(Rounder, Rounder)
+
+        self.assertIsInstance(container[Rounder], Rounder)
+        profiler.measureService.assert_called_once_with('Rounder', Rounder)
@@ -1,21 +1,12 @@
-import json
 from unittest import TestCase
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock
 
-from src.Constant.ConfigId import ConfigId
 from src.DTO.ConvertResult import ConvertResult
 from src.DTO.ServiceContainer import ServiceContainer
-from src.Service.ArgumentParser import ArgumentParser
 from src.Service.Conversion.ConversionManager import ConversionManager
-from src.Service.Conversion.Timestamp.TimestampTextFormatter import TimestampTextFormatter
-from src.Service.Conversion.Unit.Currency.CurrencyConverter import CurrencyConverter
-from src.Service.Debug import Debug
 from src.Service.EventService import EventService
 from src.Service.Logger import Logger
-from src.Service.OSSwitch import OSSwitch
-from src.Service.ServiceBuilder import ServiceBuilder
-from tests.TestUtil.MockLibrary import MockLibrary
-from tests.TestUtil.TestsFilesystemHelper import TestsFilesystemHelper
+from tests.TestUtil.ConversionServicesBuilder import ConversionServicesBuilder
 from tests.TestUtil.Types import ConfigurationsList
 
 
@@ -35,7 +26,7 @@ class AbstractConversionManagerTest(TestCase):
 
         self._convertedWasDispatched = False
         self._convertResult = None
-        self._events = EventService()
+        self._events = EventService(Mock(Logger))
         self._events.subscribeConverted(onConverted)
 
     def runConverterTest(
@@ -69,62 +60,4 @@ class AbstractConversionManagerTest(TestCase):
             self.assertEqual(expectTo, self._convertResult.convertedText)  # type: ignore[union-attr]
 
     def setupServices(self, configOverrides: ConfigurationsList | None = None) -> ServiceContainer:
-        configDefault = [
-            (ConfigId.ClearOnChange, False),
-            (ConfigId.ClearAfterTime, 0),
-            (ConfigId.Debug, False),
-            (ConfigId.Converter_Currency_Enabled, True),
-            (ConfigId.Converter_Currency_PrimaryCurrency, 'eur'),
-            (ConfigId.Converter_Currency_RatesUrl, ''),
-            (ConfigId.Converter_Distance_Enabled, True),
-            (ConfigId.Converter_Distance_PrimaryUnit_Metric, True),
-            (ConfigId.Converter_Temperature_Enabled, True),
-            (ConfigId.Converter_Temperature_PrimaryUnit_Celsius, True),
-            (ConfigId.Converter_Timestamp_Enabled, True),
-            (ConfigId.Converter_Timestamp_IconFormat, {'default': ''}),
-            (ConfigId.Converter_Timestamp_Menu_LastConversion_OriginalText, '{ts_ms_sep}'),
-            (ConfigId.Converter_Timestamp_Menu_LastConversion_ConvertedText, '{ts_ms_sep}'),
-            (ConfigId.Converter_Volume_Enabled, True),
-            (ConfigId.Converter_Volume_PrimaryUnit_Metric, True),
-            (ConfigId.Converter_Weight_Enabled, True),
-            (ConfigId.Converter_Weight_PrimaryUnit_Metric, True),
-        ]
-
-        argParserMock = MagicMock(ArgumentParser)
-        argParserMock.isDebugEnabled.return_value = False
-        argParserMock.getMockUpdate.return_value = None
-        argParserMock.getCurrencyRatesUrl.return_value = None
-
-        configMock = MockLibrary.getConfig(configDefault, configOverrides)
-        loggerMock = Mock(Logger)
-        debugMock = Debug(configMock, argParserMock)
-        filesystemHelperMock = MockLibrary.getFilesystemHelper()
-        osSwitch = OSSwitch()
-        timestampTextFormatter = TimestampTextFormatter(configMock)
-
-        container = ServiceContainer()
-
-        container[ConversionManager] = ServiceBuilder().getConversionManager(
-            container,
-            filesystemHelperMock,
-            timestampTextFormatter,
-            argParserMock,
-            configMock,
-            loggerMock,
-            osSwitch,
-            self._events,
-            debugMock,
-        )
-
-        currencyConverter: CurrencyConverter = container[CurrencyConverter]  # type: ignore[assignment]
-        testsFilesystemHelper = TestsFilesystemHelper()
-
-        with open(
-            testsFilesystemHelper.getProjectDir() + '/assets_dev/rates_response_mock.json', 'r'
-        ) as ratesFile:
-            ratesText = ratesFile.read()
-
-        ratesData = json.loads(ratesText)
-        currencyConverter.refreshUnits(ratesData['currencies'])
-
-        return container
+        return ConversionServicesBuilder.build(self._events, configOverrides)
@@ -1,6 +1,11 @@
+from unittest import skipUnless
+
 from parameterized import parameterized
 
 from src.Constant.ConfigId import ConfigId
+from src.Service.Conversion.Rounder import Rounder
+from src.Service.Conversion.Unit.Currency.CurrencyConverter import CurrencyConverter
+from src.Service.Conversion.Unit.UnitConverterInterface import UnitConverterInterface
 from tests.Service.Conversion.AbstractConversionManagerTest import AbstractConversionManagerTest
 
 
@@ -42,3 +47,42 @@ class TestCurrencyConverter(AbstractConversionManagerTest):
         ]
 
         self.runConverterTest(text, expectSuccess, expectFrom, expectTo, configOverrides)
+
+    @parameterized.expand(
+        [
+            ('From usd', 'eur', 'usd'),
+            ('From btc', 'usd', '₿'),
+            ('From krw', 'eur', 'krw'),
+        ]
+    )
+    @skipUnless(UnitConverterInterface.isBatchAvailable(), 'NumPy is not installed')
+    def testTryConvertBatch(self, _: str, primaryCurrency: str, unitId: str) -> None:
+        configOverrides = [
+            (ConfigId.Converter_Currency_PrimaryCurrency, primaryCurrency),
+        ]
+        services = self.setupServices(configOverrides)
+        converter = services[CurrencyConverter]
+        rounder = Rounder()
+        numbers = [0, 1, -1, 0.0001, 45.454545, 500_500, 1e12]
+
+        success, result = converter.tryConvertBatch(numbers, unitId)
+
+        self.assertTrue(success)
+
+        for index, number in enumerate(numbers):
+            _, expectResult = converter.tryConvert(number, unitId)
+            numberTo = result.numbersTo[index]  # type: ignore[union-attr]
+            unitTo = result.unitsTo[index]  # type: ignore[union-attr]
+
+            self.assertTrue(result.converted[index])  # type: ignore[union-attr]
+            self.assertEqual(
+                expectResult.convertedText,  # type: ignore[union-attr]
+                f'{rounder.roundCurrency(numberTo)} {unitTo}',
+            )
+
+    @skipUnless(UnitConverterInterface.isBatchAvailable(), 'NumPy is not installed')
+    def testTryConvertBatchPrimaryCurrency(self) -> None:
+        configOverrides = [(ConfigId.Converter_Currency_PrimaryCurrency, 'eur')]
+        converter = self.setupServices(configOverrides)[CurrencyConverter]
+
+        self.assertEqual((False, None), converter.tryConvertBatch([1, 2], 'eur'))
@@ -0,0 +1,174 @@
+import math
+import random
+from unittest import TestCase, skipUnless
+
+from parameterized import parameterized
+
+from src.Constant.ConfigId import ConfigId
+from src.DTO.Converter.MetricImperialUnit import MetricImperialUnit
+from src.DTO.Converter.UnitDefinition import UnitDefinition
+from src.Service.Configuration import Configuration
+from src.Service.Conversion.Rounder import Rounder
+from src.Service.Conversion.Unit.MetricImperial.AbstractMetricImperialConverter import (
+    AbstractMetricImperialConverter,
+)
+from src.Service.Conversion.Unit.MetricImperial.DistanceConverter import DistanceConverter
+from src.Service.Conversion.Unit.MetricImperial.VolumeConverter import VolumeConverter
+from src.Service.Conversion.Unit.MetricImperial.WeightConverter import WeightConverter
+from src.Service.Conversion.Unit.UnitConverterInterface import UnitConverterInterface
+from tests.TestUtil.MockLibrary import MockLibrary
+
+
+class TestAbstractMetricImperialConverter(TestCase):
+    @parameterized.expand(
+        [
+            ('Distance metric', DistanceConverter, True),
+            ('Distance imperial', DistanceConverter, False),
+            ('Volume metric', VolumeConverter, True),
+            ('Volume imperial', VolumeConverter, False),
+            ('Weight metric', WeightConverter, True),
+            ('Weight imperial', WeightConverter, False),
+        ]
+    )
+    def testSelectUnitToMatchesLinearScan(
+        self,
+        _: str,
+        converterClass: type[AbstractMetricImperialConverter],
+        primaryUnitMetric: bool,
+    ) -> None:
+        converter = converterClass(Rounder(), self._getConfig(primaryUnitMetric))
+        values = [0.0, 1e-9, 1.0, 1e30]
+
+        # Values right around each threshold, where rounding of the precomputed table matters
+        for threshold in converter._unitsToThresholds:
+            value = threshold
+
+            for _ in range(8):
+                value = math.nextafter(value, 0)
+
+            for _ in range(16):
+                values.append(value)
+                value = math.nextafter(value, math.inf)
+
+        generator = random.Random(42)
+        values += [10 ** generator.uniform(-6, 16) for _ in range(20_000)]
+
+        for value in values:
+            for meters in (value, -value):
+                unitTo, numberTo = converter._selectUnitTo(meters, abs(meters))
+
+                self.assertEqual(
+                    self._selectUnitToLinear(converter, meters), (unitTo, numberTo), meters
+                )
+
+    @parameterized.expand(
+        [
+            ('Distance to metric', DistanceConverter, True, 'ft'),
+            ('Distance to imperial', DistanceConverter, False, 'km'),
+            ('Volume to metric', VolumeConverter, True, 'gal'),
+            ('Volume to imperial', VolumeConverter, False, 'ml'),
+            ('Weight to metric', WeightConverter, True, 'oz'),
+            ('Weight to imperial', WeightConverter, False, 'kg'),
+        ]
+    )
+    @skipUnless(UnitConverterInterface.isBatchAvailable(), 'NumPy is not installed')
+    def testTryConvertBatch(
+        self,
+        _: str,
+        converterClass: type[AbstractMetricImperialConverter],
+        primaryUnitMetric: bool,
+        unitId: str,
+    ) -> None:
+        rounder = Rounder()
+        converter = converterClass(rounder, self._getConfig(primaryUnitMetric))
+        generator = random.Random(42)
+        numbers = [0.0, 1.0, -4.5, 1e-12, 1e15, math.nan, math.inf]
+        numbers += [10 ** generator.uniform(-8, 12) for _ in range(2_000)]
+
+        success, result = converter.tryConvertBatch(numbers, unitId)
+
+        self.assertTrue(success)
+
+        for index, number in enumerate(numbers):
+            expectSuccess, expectResult = converter.tryConvert(number, unitId)
+
+            self.assertEqual(expectSuccess, result.converted[index], number)  # type: ignore[union-attr]
+
+            if expectSuccess:
+                numberTo = result.numbersTo[index]  # type: ignore[union-attr]
+                unitTo = result.unitsTo[index]  # type: ignore[union-attr]
+
+                self.assertEqual(
+                    expectResult.convertedText,  # type: ignore[union-attr]
+                    f'{rounder.round(numberTo)} {unitTo}',
+                )
+            else:
+                self.assertEqual('', result.unitsTo[index])  # type: ignore[union-attr]
+
+    @skipUnless(UnitConverterInterface.isBatchAvailable(), 'NumPy is not installed')
+    def testTryConvertBatchPrimaryUnit(self) -> None:
+        converter = DistanceConverter(Rounder(), self._getConfig(True))
+
+        self.assertEqual((False, None), converter.tryConvertBatch([1, 2], 'km'))
+
+    def testUnitsOrderValidation(self) -> None:
+        class UnorderedConverter(DistanceConverter):
+            def _getUnitsDefinition(self) -> dict[str, UnitDefinition[MetricImperialUnit]]:
+                definition = super()._getUnitsDefinition()
+
+                return {key: definition[key] for key in reversed(definition)}
+
+        with self.assertRaisesRegex(Exception, 'increasing order'):
+            UnorderedConverter(Rounder(), self._getConfig(True))
+
+    def testUnitsTooCloseValidation(self) -> None:
+        class CloseUnitsConverter(DistanceConverter):
+            def _getUnitsDefinition(self) -> dict[str, UnitDefinition[MetricImperialUnit]]:
+                definition = super()._getUnitsDefinition()
+                mm = definition['mm'].unit
+                # Limit right above the mm limit, in cm
+                limit = math.nextafter(
+                    mm.limitToShowUnit * mm.multiplierToBaseUnit / 0.01, math.inf
+                )
+                closeUnit = MetricImperialUnit('cm2', 'cm2', True, True, limit, 0.01)
+
+                return {'mm': definition['mm'], 'cm2': UnitDefinition([], closeUnit)} | {
+                    key: unitDefinition
+                    for key, unitDefinition in definition.items()
+                    if key not in ('mm', 'cm')
+                }
+
+        with self.assertRaisesRegex(Exception, 'too close limits'):
+            CloseUnitsConverter(Rounder(), self._getConfig(True))
+
+    def _selectUnitToLinear(
+        self, converter: AbstractMetricImperialConverter, meters: float
+    ) -> tuple[MetricImperialUnit | None, float]:
+        """Unit selection as it was done before the precomputed table"""
+
+        for unitDef in converter._unitsDefinition.values():
+            unit = unitDef.unit
+
+            if unit.isMetric != converter._primaryUnitMetric or not unit.convertToThis:
+                continue
+
+            numberTo = meters / unit.multiplierToBaseUnit
+
+            if abs(numberTo) >= unit.limitToShowUnit:
+                continue
+
+            return unit, numberTo
+
+        return None, -1
+
+    def _getConfig(self, primaryUnitMetric: bool) -> Configuration:
+        return MockLibrary.getConfig(
+            [
+                (ConfigId.Converter_Distance_Enabled, True),
+                (ConfigId.Converter_Distance_PrimaryUnit_Metric, primaryUnitMetric),
+                (ConfigId.Converter_Volume_Enabled, True),
+                (ConfigId.Converter_Volume_PrimaryUnit_Metric, primaryUnitMetric),
+                (ConfigId.Converter_Weight_Enabled, True),
+                (ConfigId.Converter_Weight_PrimaryUnit_Metric, primaryUnitMetric),
+            ]
+        )
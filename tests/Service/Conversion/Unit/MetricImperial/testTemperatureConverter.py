@@ -1,7 +1,12 @@
+from unittest import skipUnless
+
 from parameterized import parameterized
 
 from src.Constant.ConfigId import ConfigId
+from src.Service.Conversion.Unit.MetricImperial.TemperatureConverter import TemperatureConverter
+from src.Service.Conversion.Unit.UnitConverterInterface import UnitConverterInterface
 from tests.Service.Conversion.AbstractConversionManagerTest import AbstractConversionManagerTest
+from tests.TestUtil.MockLibrary import MockLibrary
 
 
 class TestTemperatureConverter(AbstractConversionManagerTest):
@@ -38,3 +43,45 @@ class TestTemperatureConverter(AbstractConversionManagerTest):
         ]
 
         self.runConverterTest(text, expectSuccess, expectFrom, expectTo, configOverrides)
+
+    @parameterized.expand(
+        [
+            ('C->F', 'f', 'c'),
+            ('F->C', 'c', 'f'),
+        ]
+    )
+    @skipUnless(UnitConverterInterface.isBatchAvailable(), 'NumPy is not installed')
+    def testTryConvertBatch(self, _: str, primaryUnitId: str, unitId: str) -> None:
+        converter = self._getConverter(primaryUnitId == 'c')
+        numbers = [0, 5.7, -100, 212, 999_999, 1_000_000, -1_000_000, 1e300]
+
+        success, result = converter.tryConvertBatch(numbers, unitId)
+
+        self.assertTrue(success)
+
+        for index, number in enumerate(numbers):
+            expectSuccess, expectResult = converter.tryConvert(number, unitId)
+
+            self.assertEqual(expectSuccess, result.converted[index])  # type: ignore[union-attr]
+
+            if expectSuccess:
+                self.assertEqual(
+                    expectResult.convertedText,  # type: ignore[union-attr]
+                    f'{round(result.numbersTo[index])} {result.unitsTo[index]}',  # type: ignore[union-attr]
+                )
+
+    @skipUnless(UnitConverterInterface.isBatchAvailable(), 'NumPy is not installed')
+    def testTryConvertBatchPrimaryUnit(self) -> None:
+        converter = self._getConverter(True)
+
+        self.assertEqual((False, None), converter.tryConvertBatch([1, 2], 'c'))
+
+    def _getConverter(self, primaryUnitCelsius: bool) -> TemperatureConverter:
+        return TemperatureConverter(
+            MockLibrary.getConfig(
+                [
+                    (ConfigId.Converter_Temperature_Enabled, True),
+                    (ConfigId.Converter_Temperature_PrimaryUnit_Celsius, primaryUnitCelsius),
+                ]
+            )
+        )
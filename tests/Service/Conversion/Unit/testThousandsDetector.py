@@ -1,6 +1,12 @@
+import itertools
+import random
 from unittest import TestCase
 
+from parameterized import parameterized
+
+from src.Constant.AmbiguousSeparator import AmbiguousSeparator
 from src.Service.Conversion.Unit.ThousandsDetector import ThousandsDetector
+from tests.TestUtil.LegacyThousandsDetector import LegacyThousandsDetector
 
 
 class TestThousandsDetector(TestCase):
@@ -29,6 +35,18 @@ class TestThousandsDetector(TestCase):
             ('-001', -1, False),
             ('1..5', None),
             ('1.,5', None),
+            ('0.000', 0, False),
+            ('.5', 0.5),
+            ('5.', 5),
+            ('.', None, False),
+            ('-', None, False),
+            ('1e5', None, False),
+            ('١٢٣', 123, False),
+            (' 12.5 ', 12.5, False),
+            # Whitespace is stripped only around the number, zeros are stripped after it
+            ('0 123', None, False),
+            ('00\t1,5', None, False),
+            (' 0 1', None, False),
         ]
         cases = self._generateTestCases(casesInitial)
 
@@ -51,6 +69,72 @@ class TestThousandsDetector(TestCase):
 
         self.assertEqual(casesCount, correctResults, output)
 
+    @parameterized.expand(
+        [
+            (AmbiguousSeparator.THOUSANDS, '100.000', 100000),
+            (AmbiguousSeparator.THOUSANDS, '100,000', 100000),
+            (AmbiguousSeparator.DECIMAL_DOT, '100.000', 100),
+            (AmbiguousSeparator.DECIMAL_DOT, '-1,500', -1500),
+            (AmbiguousSeparator.DECIMAL_DOT, '1.500', 1.5),
+            (AmbiguousSeparator.DECIMAL_COMMA, '100.000', 100000),
+            (AmbiguousSeparator.DECIMAL_COMMA, '-1,500', -1.5),
+            (AmbiguousSeparator.DECIMAL_COMMA, '1,234.5', 1234.5),
+            (AmbiguousSeparator.DECIMAL_COMMA, '1.234,5', 1234.5),
+        ]
+    )
+    def testAmbiguousSeparatorPreference(
+        self, ambiguousSeparator: str, number: str, expected: float
+    ) -> None:
+        self.assertEqual(expected, ThousandsDetector(ambiguousSeparator).parseNumber(number))
+
+    @parameterized.expand(
+        [
+            ('Separators in front', '1.2,345', 1.2345),
+            ('Separators in front, no digit between', '1.,234', 1.234),
+            ('Repeated comma', '1,,234', 1234),
+            ('Repeated dot with sign', '+1..234', 1234),
+            ('Separator first', '.5,000', 0.5),
+            ('Separator first with sign', '-.1.234', -1234),
+            ('Non-ASCII digit', '1٢.345', 12345),
+            ('Zero before separators', '0,1.234', None),
+            ('Separators first', '..1,234', None),
+            ('Separators in front, both kinds', '-1,2.345', None),
+        ]
+    )
+    def testParseAmbiguousLegacyInputs(self, _: str, number: str, expected: float | None) -> None:
+        self.assertEqual(expected, ThousandsDetector().parseNumber(number))
+        self.assertEqual(expected, LegacyThousandsDetector().parseNumber(number))
+
+    def testMatchesLegacyImplementation(self) -> None:
+        """
+        Differential test against the original regex implementation: all strings up to 7
+        characters from a small alphabet, plus random longer strings with more characters
+        """
+
+        detector = ThousandsDetector()
+        legacyDetector = LegacyThousandsDetector()
+
+        def generateExhaustive():
+            for length in range(8):
+                for characters in itertools.product('015.,-', repeat=length):
+                    yield ''.join(characters)
+
+        def generateRandom():
+            rng = random.Random(42)
+
+            for _ in range(100_000):
+                number = ''.join(rng.choices('0123456789..,,+-١', k=rng.randint(1, 16)))
+
+                yield f' {number}\n' if rng.random() < 0.1 else number
+
+        for number in itertools.chain(generateExhaustive(), generateRandom()):
+            # Compared with repr() to also catch -0.0 != 0.0
+            self.assertEqual(
+                repr(legacyDetector.parseNumber(number)),
+                repr(detector.parseNumber(number)),
+                f'Input: {number!r}',
+            )
+
     def _generateTestCases(self, cases: list[_testCaseType]) -> list[_testCaseType]:
         """
         Generate more test cases by swapping , and . in original test cases,
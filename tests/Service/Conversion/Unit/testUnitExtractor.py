@@ -0,0 +1,130 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from parameterized import parameterized
+
+from src.Constant.ConfigId import ConfigId
+from src.DTO.Converter.UnitParseResult import UnitParseResult
+from src.DTO.ConvertResult import ConvertResult
+from src.Service.Configuration import Configuration
+from src.Service.Conversion.ConversionManager import ConversionManager
+from src.Service.Conversion.TextLexer import TextLexer
+from src.Service.Conversion.Unit.AhoCorasickAutomaton import AhoCorasickAutomaton
+from src.Service.Conversion.Unit.UnitConverterInterface import UnitConverterInterface
+from src.Service.Conversion.Unit.UnitExtractionConverter import UnitExtractionConverter
+from src.Service.Conversion.Unit.UnitExtractor import UnitExtractor
+from tests.Service.Conversion.AbstractConversionManagerTest import AbstractConversionManagerTest
+
+
+class TestUnitExtractor(AbstractConversionManagerTest):
+    @parameterized.expand(
+        [
+            (
+                'Sentence',
+                'The box is 40 cm by 2 ft and costs $30',
+                [(40, 'cm'), (2, 'ft'), (30, '$')],
+            ),
+            ('Unit with whitespace', 'Add 10 fl oz of water', [(10, 'floz')]),
+            ('Separators and sign', 'From -5,5 °F to 1,234.5 lb.', [(-5.5, '°f'), (1234.5, 'lb')]),
+            ('Unit with number', 'Pour 3 m3 or 2 ft', [(3, 'm3'), (2, 'ft')]),
+            ('Symbol unit before number with whitespace', 'Costs $ 5', [(5, '$')]),
+            ('Multiline', '5 ft\n10 kg', [(5, 'ft'), (10, 'kg')]),
+            ('Number used once', '$30 usd', [(30, '$')]),
+            # Should not be matched
+            ('Unit is a part of a word', 'Run 5 miles5 or 5 mx', []),
+            ('Number is a part of a word', 'Model x5 m', []),
+            ('Word unit before number with whitespace', 'All 5 boxes', []),
+            ('Unit before number is a part of a word', 'z$5 or $5x', []),
+            ('No units', '123 456 and some text', []),
+        ]
+    )
+    def testExtract(self, _: str, text: str, expected: list[tuple[float, str]]) -> None:
+        extractor = self.setupServices()[UnitExtractor]
+
+        result = extractor.extract(text)
+
+        self.assertEqual(expected, [(parsed.number, parsed.unit) for parsed in result])
+
+    @parameterized.expand(
+        [
+            (
+                'Multiple quantities',
+                'The box is 40 cm by 2 ft and costs $30',
+                '2 ft  =  61 cm',
+                ['30 USD  =  25.88 €'],
+            ),
+            ('Single quantity in a sentence', 'The rope is 5 miles long', '5 mi  =  8.05 km', []),
+            ('Nothing convertible', 'The box is 40 cm', None, []),
+        ]
+    )
+    def testConvertWithExtraction(
+        self, _: str, text: str, expectIconText: str | None, expectOther: list[str]
+    ) -> None:
+        conversionManager = self.setupServices([(ConfigId.Converter_Extraction_Enabled, True)])[
+            ConversionManager
+        ]
+
+        result = conversionManager.convert(text)
+
+        if expectIconText is None:
+            self.assertIsNone(result)
+
+            return
+
+        self.assertEqual(expectIconText, result.iconText)  # type: ignore[union-attr]
+        self.assertEqual(expectOther, [other.iconText for other in result.otherResults])  # type: ignore[union-attr]
+
+    def testExtractionDisabled(self) -> None:
+        conversionManager = self.setupServices()[ConversionManager]
+
+        self.assertIsNone(conversionManager.convert('The rope is 5 miles long'))
+
+    def testExtractionConverterKeepsUnitResults(self) -> None:
+        shared = ConvertResult('5 ft  =  1.52 m', '5 ft', '1.52 m', 'Distance')
+        failed = ConvertResult('10 kg', '10 kg', '', 'Weight')
+        converter = Mock(UnitConverterInterface)
+        converter.tryConvert.side_effect = lambda number, unit: (
+            (True, shared) if unit == 'ft' else (False, failed)
+        )
+        extractor = Mock(UnitExtractor)
+        extractor.extract.return_value = [
+            UnitParseResult(10, 'kg', converter),
+            UnitParseResult(5, 'ft', converter),
+            UnitParseResult(5, 'ft', converter),
+        ]
+        config = Mock(Configuration)
+        config.get.return_value = True
+        extraction = UnitExtractionConverter(extractor, config)
+
+        success, result = extraction.tryConvert(TextLexer().tokenize('10 kg, 5 ft and 5 ft'))
+
+        self.assertTrue(success)
+        self.assertEqual('Extraction.Distance', result.converterName)  # type: ignore[union-attr]
+        self.assertEqual(
+            ['Extraction.Distance'],
+            [other.converterName for other in result.otherResults],  # type: ignore[union-attr]
+        )
+        self.assertEqual('Distance', shared.converterName)
+        self.assertEqual([], shared.otherResults)
+
+
+class TestAhoCorasickAutomaton(TestCase):
+    @parameterized.expand(
+        [
+            (
+                'Overlapping',
+                ['he', 'she', 'his', 'hers'],
+                'ushers',
+                [(4, ('she', 'he')), (6, ('hers',))],
+            ),
+            ('Fallback to shorter', ['abcd', 'bc'], 'abcx', [(3, ('bc',))]),
+            ('Repeated', ['aa'], 'aaaa', [(2, ('aa',)), (3, ('aa',)), (4, ('aa',))]),
+            ('No words', [], 'text', []),
+        ]
+    )
+    def testFindAll(
+        self, _: str, words: list[str], text: str, expected: list[tuple[int, tuple[str, ...]]]
+    ) -> None:
+        automaton = AhoCorasickAutomaton(words)
+
+        self.assertEqual(expected, list(automaton.findAll(text)))
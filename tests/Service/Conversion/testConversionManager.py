@@ -1,8 +1,18 @@
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from parameterized import parameterized
 
+from src.Constant.ConfigId import ConfigId
+from src.Constant.InputShape import InputShape
+from src.Service.Conversion.ConversionManager import ConversionManager
+from src.Service.Conversion.ConversionResultCache import ConversionResultCache
+from src.Service.Conversion.ConverterInterface import ConverterInterface
+from src.Service.Conversion.TextLexer import TextLexer
+from src.Service.Debug import Debug
+from src.Service.Logger import Logger
+from src.Service.Scheduler import Scheduler
 from tests.Service.Conversion.AbstractConversionManagerTest import AbstractConversionManagerTest
+from tests.TestUtil.MockLibrary import MockLibrary
 
 
 class TestConversionManager(AbstractConversionManagerTest):
@@ -37,3 +47,77 @@ class TestConversionManager(AbstractConversionManagerTest):
         timeMock,
     ) -> None:
         self.runConverterTest(text, expectSuccess, expectFrom, expectTo)
+
+    @parameterized.expand(
+        [
+            ('Pure digits', '1555522011', ['Digits', 'Any']),
+            ('Unit suffix', '15 ft', ['Units', 'Any']),
+            ('Unit prefix', '$15', ['Units', 'Any']),
+            ('Other', 'Random text', ['Any']),
+            ('Number with separator', '15.5', ['Any']),
+        ]
+    )
+    def testRouting(self, _: str, text: str, expectCalled: list[str]) -> None:
+        converters = [
+            self._getConverterMock('Digits', [InputShape.PURE_DIGITS]),
+            self._getConverterMock(
+                'Units', [InputShape.NUMBER_UNIT_SUFFIX, InputShape.UNIT_PREFIX_NUMBER]
+            ),
+            self._getConverterMock('Any', InputShape.ALL),
+        ]
+
+        configMock = MockLibrary.getConfig(
+            [(ConfigId.ClearOnChange, False), (ConfigId.ClearAfterTime, 0)]
+        )
+        conversionManager = ConversionManager(
+            converters,
+            TextLexer(),
+            ConversionResultCache(self._events),
+            self._events,
+            Mock(Scheduler),
+            configMock,
+            Mock(Logger),
+            Mock(Debug),
+        )
+        conversionManager.onClipboardChange(text)
+
+        called = [c.getName() for c in converters if c.tryConvert.called]  # type: ignore[attr-defined]
+
+        self.assertEqual(expectCalled, called)
+        self.assertConvertResult(False)
+
+    @patch('time.time', return_value=1733022011.42)
+    def testClearAfterTime(self, timeMock) -> None:
+        container = self.setupServices([(ConfigId.ClearAfterTime, 300)])
+        scheduler = container[Scheduler]
+        cleared: list[bool] = []
+        self._events.subscribeStatusbarClear(lambda: cleared.append(True))
+
+        container[ConversionManager].onClipboardChange('15 ft')
+        timeMock.return_value += 299
+
+        self.assertAlmostEqual(1, scheduler.runDueJobs())  # type: ignore[arg-type]
+        self.assertEqual([], cleared)
+
+        timeMock.return_value += 1
+
+        self.assertIsNone(scheduler.runDueJobs())
+        self.assertEqual([True], cleared)
+
+    def testConvertDoesNotDispatchEvents(self) -> None:
+        conversionManager = self.setupServices()[ConversionManager]
+
+        result = conversionManager.convert('15 ft')
+
+        self.assertEqual('4.57 m', result.convertedText)  # type: ignore[union-attr]
+        self.assertIsNone(conversionManager.convert('Random text'))
+        self.assertConvertResult(False)
+
+    def _getConverterMock(self, name: str, shapes: list[str]) -> ConverterInterface:
+        converter = Mock(ConverterInterface)
+        converter.isEnabled.return_value = True
+        converter.getName.return_value = name
+        converter.getAcceptedShapes.return_value = shapes
+        converter.tryConvert.return_value = (False, None)
+
+        return converter
@@ -0,0 +1,143 @@
+import threading
+from collections import OrderedDict
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from src.Constant.ConfigId import ConfigId
+from src.DTO.ConvertResult import ConvertResult
+from src.Service.Conversion.ConversionManager import ConversionManager
+from src.Service.Conversion.ConversionResultCache import ConversionResultCache
+from src.Service.Conversion.ConverterInterface import ConverterInterface
+from src.Service.Conversion.Unit.Currency.CurrencyConverter import CurrencyConverter
+from src.Service.Conversion.Unit.UnitConverterInterface import UnitConverterInterface
+from src.Service.EventService import EventService
+from src.Service.Logger import Logger
+from tests.TestUtil.ConversionServicesBuilder import ConversionServicesBuilder
+
+
+class TestConversionResultCache(TestCase):
+    _events: EventService
+
+    def setUp(self) -> None:
+        self._events = EventService(Mock(Logger))
+
+    def testLeastRecentlyUsedIsEvicted(self) -> None:
+        cache = ConversionResultCache(self._events)
+        entry = (Mock(ConverterInterface), ConvertResult('1 ft  =  30 cm', '1 ft', '30 cm', 'Test'))
+
+        with patch.object(ConversionResultCache, '_MAX_SIZE', 2):
+            cache.set(cache.getGeneration(), 'a', entry)
+            cache.set(cache.getGeneration(), 'b', None)
+            cache.get('a')
+            cache.set(cache.getGeneration(), 'c', entry)
+
+        for text in ['a', 'c']:
+            isCached, cached = cache.get(text)
+
+            self.assertTrue(isCached)
+            self.assertIs(entry[0], cached[0])  # type: ignore[index]
+            self.assertEqual('1 ft  =  30 cm', cached[1].iconText)  # type: ignore[index]
+
+        self.assertEqual((False, None), cache.get('b'))
+        self.assertEqual('3 hits, 1 misses, 2 entries', cache.getStatsLog())
+
+    def testInvalidatedOnEvents(self) -> None:
+        cache = ConversionResultCache(self._events)
+
+        cache.set(cache.getGeneration(), 'a', None)
+        self._events.dispatchDelayedConverterInitialized(Mock(UnitConverterInterface))
+        self.assertEqual((False, None), cache.get('a'))
+
+        cache.set(cache.getGeneration(), 'a', None)
+        self._events.dispatchConfigurationChanged()
+        self.assertEqual((False, None), cache.get('a'))
+
+    def testInvalidateWaitsForGet(self) -> None:
+        cache = ConversionResultCache(self._events)
+        cache.set(cache.getGeneration(), 'a', None)
+        invalidators: list[threading.Thread] = []
+
+        class InterruptedEntries(OrderedDict):
+            def __contains__(self, key: object) -> bool:
+                # Invalidate from another thread, between the lookup and reading the entry
+                invalidator = threading.Thread(target=cache.invalidate)
+                invalidator.start()
+                invalidator.join(0.1)
+                invalidators.append(invalidator)
+
+                return super().__contains__(key)
+
+        cache._entries = InterruptedEntries(cache._entries)
+
+        self.assertEqual((True, None), cache.get('a'))
+
+        invalidators[0].join()
+
+        self.assertEqual((False, None), cache.get('a'))
+
+    def testStaleGenerationIsNotStored(self) -> None:
+        cache = ConversionResultCache(self._events)
+
+        generation = cache.getGeneration()
+        cache.invalidate()
+        cache.set(generation, 'a', None)
+
+        self.assertEqual((False, None), cache.get('a'))
+
+    def testCachedResultReturned(self) -> None:
+        container = ConversionServicesBuilder.build(self._events)
+        conversionManager: ConversionManager = container[ConversionManager]  # type: ignore[assignment]
+        cache: ConversionResultCache = container[ConversionResultCache]  # type: ignore[assignment]
+
+        first = conversionManager.convert('15 ft')
+        second = conversionManager.convert(' 15 ft\n')
+
+        self.assertEqual(first.iconText, second.iconText)  # type: ignore[union-attr]
+        self.assertIsNone(conversionManager.convert('Random text'))
+        self.assertIsNone(conversionManager.convert('\tRandom text '))
+        self.assertEqual('2 hits, 2 misses, 2 entries', cache.getStatsLog())
+
+    def testCachedResultCopied(self) -> None:
+        container = ConversionServicesBuilder.build(
+            self._events, [(ConfigId.Converter_Extraction_Enabled, True)]
+        )
+        conversionManager: ConversionManager = container[ConversionManager]  # type: ignore[assignment]
+
+        first = conversionManager.convert('The box is 40 cm by 2 ft and costs $30')
+        first.iconText = 'Changed'  # type: ignore[union-attr]
+        first.otherResults[0].iconText = 'Changed'  # type: ignore[union-attr]
+        second = conversionManager.convert('The box is 40 cm by 2 ft and costs $30')
+        second.otherResults.clear()  # type: ignore[union-attr]
+        third = conversionManager.convert('The box is 40 cm by 2 ft and costs $30')
+
+        self.assertIsNot(first, second)
+        self.assertEqual('2 ft  =  61 cm', third.iconText)  # type: ignore[union-attr]
+        self.assertEqual(['30 USD  =  25.88 €'], [other.iconText for other in third.otherResults])  # type: ignore[union-attr]
+
+    def testCurrencyRefreshInvalidates(self) -> None:
+        container = ConversionServicesBuilder.build(self._events)
+        conversionManager: ConversionManager = container[ConversionManager]  # type: ignore[assignment]
+        currencyConverter: CurrencyConverter = container[CurrencyConverter]  # type: ignore[assignment]
+
+        first = conversionManager.convert('15 USD')
+        currencyConverter.refreshUnits(ConversionServicesBuilder.loadMockCurrencies())
+        second = conversionManager.convert('15 USD')
+
+        self.assertIsNot(first, second)
+        self.assertEqual(first.convertedText, second.convertedText)  # type: ignore[union-attr]
+
+    def testTimestampRelativeTimeRefreshed(self) -> None:
+        container = ConversionServicesBuilder.build(
+            self._events,
+            [(ConfigId.Converter_Timestamp_Menu_LastConversion_ConvertedText, '{r_int}')],
+        )
+        conversionManager: ConversionManager = container[ConversionManager]  # type: ignore[assignment]
+
+        with patch('time.time', return_value=1733022011 + 3600 * 5):
+            first = conversionManager.convert('1733022011')
+
+        with patch('time.time', return_value=1733022011 + 3600 * 7):
+            second = conversionManager.convert('1733022011')
+
+        self.assertEqual('5 h ago', first.convertedText)  # type: ignore[union-attr]
+        self.assertEqual('7 h ago', second.convertedText)  # type: ignore[union-attr]
@@ -0,0 +1,92 @@
+import re
+import time
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from src.Service.ClipboardManager import ClipboardManager
+from src.Service.Conversion.TextLexer import TextLexer
+
+
+class TestTextLexer(TestCase):
+    _MAX_TOKENIZE_TIME: float = 0.05
+    """Seconds. Quadratic backtracking took ~0.5 s on these texts"""
+
+    # Pattern used by UnitParser before TextLexer was introduced. Lexer must split text the same way
+    _LEGACY_PATTERN = re.compile(r'^([^\d\s-]+)?(-?[\d,.]*\d[\d,.]*)([^\d\s]+3?)?')
+
+    @parameterized.expand(
+        [
+            ('Timestamp', '1555522011', None, '1555522011', None, False, 10, False, True),
+            ('Unit after', '5 FT', None, '5', 'ft', False, 1, False, False),
+            ('Unit before', '$ -1,234.5', '$', '-1,234.5', None, True, 5, True, False),
+            ('Unit with number', '3m3', None, '3', 'm3', False, 1, False, False),
+            ('Whitespace inside', '1 2 3 4 , 1m', None, '1234,1', 'm', False, 5, True, False),
+            ('Leading separator', 'a.5', 'a.', '5', None, False, 1, False, False),
+            ('Both units', 'm3m', 'm', '3', 'm', False, 1, False, False),
+            ('Compound', '18′5″', None, '18', '′', False, 2, False, False),
+            ('No number', 'Random text', None, None, None, False, 0, False, False),
+            ('Minus only', '-', None, None, None, False, 0, False, False),
+            ('Empty', '', None, None, None, False, 0, False, False),
+        ]
+    )
+    def testTokenize(
+        self,
+        _: str,
+        text: str,
+        expectUnitBefore: str | None,
+        expectNumber: str | None,
+        expectUnitAfter: str | None,
+        expectNegative: bool,
+        expectDigitCount: int,
+        expectSeparators: bool,
+        expectDigitsOnly: bool,
+    ) -> None:
+        token = TextLexer().tokenize(text)
+
+        self.assertEqual(text, token.text)
+        self.assertEqual(expectUnitBefore, token.unitBefore)
+        self.assertEqual(expectNumber, token.number)
+        self.assertEqual(expectUnitAfter, token.unitAfter)
+        self.assertEqual(expectNegative, token.isNegative)
+        self.assertEqual(expectDigitCount, token.digitCount)
+        self.assertEqual(expectSeparators, token.hasSeparators)
+        self.assertEqual(expectDigitsOnly, token.isDigitsOnly)
+
+    def testTokenizeMatchesLegacyPattern(self) -> None:
+        texts = [
+            '5ft', '₿0.155', '1.234.567m', '1,234.567,890m', '-5 °C', '$-5', '-$5', '--5', 'a.-5',
+            '.5m', '5.', ',,5,,', 'ab.', '5ab', '12:45:00', '#ff00aa', 'v2.3.0', 'S/ 5', '5 fl oz',
+            '١٢٣ m', '²5', '5²', '5 m 3', 'm 3 m 3', '  5  ', 'x' * 50 + '-', '$,.,5', 'a,,', ',.-5',
+        ]  # fmt: skip
+        lexer = TextLexer()
+
+        for text in texts:
+            compact = ''.join(text.split()).lower()
+            legacy = self._LEGACY_PATTERN.match(compact)
+            token = lexer.tokenize(text.strip())
+
+            expected = (None, None, None) if legacy is None else legacy.groups()
+
+            self.assertEqual(expected, (token.unitBefore, token.number, token.unitAfter), text)
+
+    @parameterized.expand(
+        [
+            ('Commas', ','),
+            ('Dots', '.'),
+            ('Mixed separators', ',.'),
+            ('Unit before separators', '$,'),
+            ('Letters', 'a'),
+            ('Minus and separator', '-,'),
+        ]
+    )
+    def testTokenizeIsLinear(self, _: str, repeated: str) -> None:
+        text = (repeated * ClipboardManager._MAX_CONTENT_LENGTH_EXTRACTION)[
+            : ClipboardManager._MAX_CONTENT_LENGTH_EXTRACTION
+        ]
+        lexer = TextLexer()
+
+        start = time.perf_counter()
+        lexer.tokenize(text)
+
+        self.assertLess(time.perf_counter() - start, self._MAX_TOKENIZE_TIME)
@@ -0,0 +1,110 @@
+import multiprocessing
+import threading
+from multiprocessing.process import BaseProcess
+from unittest import TestCase
+from unittest.mock import Mock
+
+from src.Constant.ConfigId import ConfigId
+from src.Constant.ModalHostMessage import ModalHostMessage
+from src.Service.ArgumentParser import ArgumentParser
+from src.Service.Conversion.Unit.Currency.CurrencyConverter import CurrencyConverter
+from src.Service.Logger import Logger
+from src.Service.ModalWindow.ModalHostConnection import ModalHostConnection
+from src.Service.ModalWindow.ModalWindowManagerOutOfProcess import (
+    ModalWindowManagerOutOfProcess,
+)
+from src.Service.ModalWindow.RemoteConfiguration import RemoteConfiguration
+from src.Service.ModalWindow.RemoteCurrencyConverter import RemoteCurrencyConverter
+from tests.TestUtil.MockLibrary import MockLibrary
+
+
+class TestModalWindowManagerOutOfProcess(TestCase):
+    def testHostRequestsAreServed(self) -> None:
+        config = MockLibrary.getConfig([(ConfigId.Debug, True)])
+        config.getAppVersion.return_value = '1.2.3'
+        currencyConverter = Mock(CurrencyConverter)
+        currencyConverter.getUnitsDefinition.return_value = {'EUR': ['€']}
+        callback = Mock()
+        process = Mock(BaseProcess)
+        process.exitcode = 0
+
+        manager = ModalWindowManagerOutOfProcess(
+            config, currencyConverter, Mock(ArgumentParser), Mock(Logger)
+        )
+        appConnection, hostConnection = multiprocessing.Pipe()
+        hostResults: dict = {}
+
+        def runHost() -> None:
+            connection = ModalHostConnection(hostConnection)
+            remoteConfig = RemoteConfiguration(connection)
+            hostResults['debug'] = remoteConfig.get(ConfigId.Debug)
+            hostResults['version'] = remoteConfig.getAppVersion()
+            hostResults['currencies'] = RemoteCurrencyConverter(connection).getUnitsDefinition()
+            remoteConfig.set(ConfigId.Debug, False)
+            connection.send(ModalHostMessage.CALLBACK, 0)
+            connection.send(ModalHostMessage.CLOSED)
+
+        host = threading.Thread(target=runHost)
+        host.start()
+        manager._serveHost(appConnection, process, {0: callback})
+        host.join()
+
+        self.assertEqual(
+            {'debug': True, 'version': '1.2.3', 'currencies': {'EUR': ['€']}}, hostResults
+        )
+        # Config parameters are pickled, so only their keys are equal
+        config.set.assert_called_once()
+        self.assertEqual(ConfigId.Debug.key, config.set.call_args.args[0].key)
+        self.assertFalse(config.set.call_args.args[1])
+        callback.assert_called_once_with()
+        process.join.assert_called_once_with()
+        self.assertFalse(manager._isModalOpen)
+
+    def testHostIsServedAfterException(self) -> None:
+        config = MockLibrary.getConfig([(ConfigId.Debug, True)])
+        config.getAppVersion.side_effect = Exception('Version failed')
+        callback = Mock(side_effect=Exception('Callback failed'))
+        process = Mock(BaseProcess)
+        process.exitcode = 0
+        logger = Mock(Logger)
+
+        manager = ModalWindowManagerOutOfProcess(
+            config, Mock(CurrencyConverter), Mock(ArgumentParser), logger
+        )
+        appConnection, hostConnection = multiprocessing.Pipe()
+        hostResults: dict = {}
+
+        def runHost() -> None:
+            connection = ModalHostConnection(hostConnection)
+            remoteConfig = RemoteConfiguration(connection)
+            connection.send(ModalHostMessage.CALLBACK, 0)
+            hostResults['version'] = remoteConfig.getAppVersion()
+            hostResults['debug'] = remoteConfig.get(ConfigId.Debug)
+            connection.send(ModalHostMessage.CLOSED)
+
+        host = threading.Thread(target=runHost)
+        host.start()
+        manager._serveHost(appConnection, process, {0: callback})
+        host.join()
+
+        self.assertEqual({'version': None, 'debug': True}, hostResults)
+        self.assertEqual(2, logger.log.call_count)
+        process.join.assert_called_once_with()
+        self.assertFalse(manager._isModalOpen)
+
+    def testWindowIsClosedWhenHostExits(self) -> None:
+        process = Mock(BaseProcess)
+        process.exitcode = 1
+        logger = Mock(Logger)
+
+        manager = ModalWindowManagerOutOfProcess(
+            Mock(), Mock(CurrencyConverter), Mock(ArgumentParser), logger
+        )
+        manager._isModalOpen = True
+        appConnection, hostConnection = multiprocessing.Pipe()
+        hostConnection.close()
+
+        manager._serveHost(appConnection, process, {})
+
+        self.assertFalse(manager._isModalOpen)
+        logger.log.assert_called_once()
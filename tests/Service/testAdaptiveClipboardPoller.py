@@ -0,0 +1,63 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from src.Service.AdaptiveClipboardPoller import AdaptiveClipboardPoller
+from src.Service.PollableClipboardInterface import PollableClipboardInterface
+from src.Service.Scheduler import Scheduler
+
+
+class FakeClipboard(PollableClipboardInterface):
+    changeCount: int
+    polls: int
+
+    def __init__(self):
+        self.changeCount = 0
+        self.polls = 0
+
+    def getChangeCount(self) -> int:
+        return self.changeCount
+
+    def pollClipboard(self) -> None:
+        self.polls += 1
+
+
+class TestAdaptiveClipboardPoller(TestCase):
+    _clipboard: FakeClipboard
+    _poller: AdaptiveClipboardPoller
+
+    def setUp(self) -> None:
+        self._clipboard = FakeClipboard()
+        self._poller = AdaptiveClipboardPoller(Mock(Scheduler), self._clipboard)
+
+    def testIntervalBacksOffWhileIdle(self) -> None:
+        intervals = []
+
+        for _ in range(7):
+            self._poller.poll()
+            intervals.append(round(self._poller.getInterval(), 3))
+
+        self.assertEqual([0.33, 0.495, 0.742, 1.114, 1.5, 1.5, 1.5], intervals)
+        self.assertEqual(7, self._clipboard.polls)
+
+    def testIntervalResetsAfterChange(self) -> None:
+        for _ in range(10):
+            self._poller.poll()
+
+        self._clipboard.changeCount += 1
+        self._poller.poll()
+
+        self.assertEqual(0.33, self._poller.getInterval())
+
+        self._poller.poll()
+
+        self.assertAlmostEqual(0.495, self._poller.getInterval())
+
+    def testPollingContinuesAfterFailure(self) -> None:
+        scheduler = Scheduler(Mock())
+        clipboard = Mock(PollableClipboardInterface)
+        clipboard.pollClipboard.side_effect = Exception('Pasteboard failed')
+        AdaptiveClipboardPoller(scheduler, clipboard).start()
+
+        scheduler.runDueJobs()
+
+        self.assertGreater(scheduler.runDueJobs(), 0)  # type: ignore[arg-type]
@@ -0,0 +1,125 @@
+import threading
+from unittest import TestCase
+from unittest.mock import Mock
+
+from parameterized import parameterized
+
+from src.Constant.ConfigId import ConfigId
+from src.Service.ClipboardManager import ClipboardManager
+from src.Service.EventService import EventService
+from src.Service.Logger import Logger
+from tests.TestUtil.MockLibrary import MockLibrary
+
+
+class ClipboardManagerStub(ClipboardManager):
+    def validateSystem(self) -> bool:
+        return True
+
+    def initializeClipboardWatch(self) -> None:
+        pass
+
+    def _writeClipboardContent(self, content: str) -> None:
+        pass
+
+    def waitForSettledChange(self, changesInBurst: int) -> list[float | None]:
+        """
+        :param changesInBurst: how many changes happen one after another, each sooner than
+            the debounce time
+        :return: timeouts, with which the change was waited for
+        """
+
+        timeouts: list[float | None] = []
+        changesLeft = changesInBurst
+
+        def waitForChange(timeout: float | None) -> bool:
+            nonlocal changesLeft
+
+            timeouts.append(timeout)
+            changesLeft -= 1
+
+            return changesLeft >= 0
+
+        self._waitForSettledChange(waitForChange)
+
+        return timeouts
+
+    def handleChangedClipboard(self, text: str) -> None:
+        self._handleChangedClipboard(text)
+
+
+class TestClipboardManager(TestCase):
+    _events: EventService
+    _logger: Logger
+    _dispatched: list[str | None]
+
+    def setUp(self) -> None:
+        self._events = EventService(Mock(Logger))
+        self._logger = Mock(Logger)
+        self._dispatched = []
+        self._events.subscribeClipboardChanged(self._dispatched.append)
+
+    @parameterized.expand(
+        [
+            (150, 1, [None, 0.15]),
+            (150, 4, [None, 0.15, 0.15, 0.15, 0.15]),
+            (0, 4, [None]),
+        ]
+    )
+    def testBurstIsDebounced(
+        self, debounceTime: int, changesInBurst: int, expectedTimeouts: list[float | None]
+    ) -> None:
+        clipboard = self._createClipboardManager(debounceTime)
+
+        self.assertEqual(expectedTimeouts, clipboard.waitForSettledChange(changesInBurst))
+
+    def testDroppedChangesAreLogged(self) -> None:
+        clipboard = self._createClipboardManager(150)
+
+        clipboard.waitForSettledChange(4)
+        clipboard.handleChangedClipboard('5 ft')
+
+        self.assertEqual(['5 ft'], self._dispatched)
+        self._logger.logDebug.assert_any_call('[Clipboard] Dropped 3 changes before this one')
+
+    def testSameContentIsSkipped(self) -> None:
+        clipboard = self._createClipboardManager(150)
+
+        clipboard.handleChangedClipboard('5 ft')
+        clipboard.handleChangedClipboard('5 ft')
+        clipboard.handleChangedClipboard(' ')
+        clipboard.handleChangedClipboard(' ')
+        clipboard.handleChangedClipboard('5 ft')
+
+        self.assertEqual(['5 ft', None, '5 ft'], self._dispatched)
+        self._logger.logDebug.assert_any_call('[Clipboard] Dropped 1 changes before this one')
+
+    def testSameContentIsProcessedAfterStatusbarClear(self) -> None:
+        clipboard = self._createClipboardManager(150)
+        self._events.subscribeStatusbarClear(lambda: None)
+
+        clipboard.handleChangedClipboard('5 ft')
+        self._events.dispatchStatusbarClear()
+        clipboard.handleChangedClipboard('5 ft')
+
+        self.assertEqual(['5 ft', '5 ft'], self._dispatched)
+
+    def testOwnContentIsSkipped(self) -> None:
+        clipboard = self._createClipboardManager(150)
+        written = threading.Event()
+
+        clipboard.handleChangedClipboard('5 ft')
+        clipboard.setClipboardContent('1.52 m', lambda succeeded: written.set())
+        self.assertTrue(written.wait(5))
+        clipboard.handleChangedClipboard('1.52 m')
+
+        self.assertEqual(['5 ft'], self._dispatched)
+
+    def _createClipboardManager(self, debounceTime: int) -> ClipboardManagerStub:
+        config = MockLibrary.getConfig(
+            [
+                (ConfigId.Converter_Extraction_Enabled, False),
+                (ConfigId.Clipboard_DebounceTime, debounceTime),
+            ]
+        )
+
+        return ClipboardManagerStub(self._events, config, self._logger)
@@ -0,0 +1,145 @@
+import os
+import stat
+import sys
+import tempfile
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import Mock
+
+from src.Constant.ConfigId import ConfigId
+from src.Service.ClipboardManagerWayland import ClipboardManagerWayland
+from src.Service.EventService import EventService
+from src.Service.Logger import Logger
+from src.Service.WlPasteWatcher import WlPasteWatcher
+from tests.TestUtil.MockLibrary import MockLibrary
+
+
+class TestClipboardManagerWayland(TestCase):
+    _STUB_WL_PASTE: str = (
+        '#!{python}\n'
+        'import subprocess, sys, time\n'
+        'if {primaryUnsupported} and "--primary" in sys.argv:\n'
+        '    sys.exit(1)\n'
+        'command = sys.argv[sys.argv.index("--watch") + 1:]\n'
+        'for delay, content in {changes}:\n'
+        '    time.sleep(delay)\n'
+        '    subprocess.run(command, input=content.encode())\n'
+        'time.sleep(10)\n'
+    )
+    _TIMEOUT: float = 5
+
+    _directory: tempfile.TemporaryDirectory
+
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def testWatcherReadsChanges(self) -> None:
+        stub = self._createStubWlPaste([(0, '5 ft'), (0.2, 'multi\nline'), (0.2, '')])
+        watcher = WlPasteWatcher(100, True, stub)
+
+        try:
+            contents = []
+
+            for _ in range(3):
+                self.assertTrue(watcher.waitForChange(self._TIMEOUT))
+                contents.append(watcher.getContent())
+
+            self.assertFalse(watcher.waitForChange(0.1))
+        finally:
+            watcher.close()
+
+        self.assertEqual(['5 ft', 'multi\nline', ''], contents)
+
+    def testWatcherCutsLongContent(self) -> None:
+        stub = self._createStubWlPaste([(0, 'a' * 1000)])
+        watcher = WlPasteWatcher(11, False, stub)
+
+        try:
+            self.assertTrue(watcher.waitForChange(self._TIMEOUT))
+        finally:
+            watcher.close()
+
+        self.assertEqual('a' * 11, watcher.getContent())
+
+    def testWatcherRaisesIfWlPasteExited(self) -> None:
+        stub = self._createStubWlPaste([], primaryUnsupported=True)
+        watcher = WlPasteWatcher(100, True, stub)
+
+        try:
+            with self.assertRaisesRegex(Exception, 'wl-paste exited with code 1'):
+                watcher.waitForChange(self._TIMEOUT)
+        finally:
+            watcher.close()
+
+    def testBurstIsConvertedOnce(self) -> None:
+        stub = self._createStubWlPaste(
+            [
+                (0, '1 ft'),
+                (0.01, '2 ft'),
+                (0.01, '3 ft'),
+                (0.5, '4 ft'),
+                (0.5, '4 ft'),
+                (0.5, '5 ft'),
+            ]
+        )
+
+        self.assertEqual(['3 ft', '4 ft', '5 ft'], self._watchClipboard(stub, 3))
+
+    def testClipboardIsWatchedIfPrimaryIsUnsupported(self) -> None:
+        stub = self._createStubWlPaste([(0, '5 ft')], primaryUnsupported=True)
+
+        self.assertEqual(['5 ft'], self._watchClipboard(stub, 1))
+
+    def _watchClipboard(self, stubWlPaste: str, expectedChanges: int) -> list[str | None]:
+        events = EventService(Mock(Logger))
+        config = MockLibrary.getConfig(
+            [
+                (ConfigId.Converter_Extraction_Enabled, False),
+                (ConfigId.Clipboard_DebounceTime, 200),
+            ]
+        )
+        dispatched: list[str | None] = []
+        changed = threading.Event()
+
+        def onClipboardChanged(content: str | None) -> None:
+            dispatched.append(content)
+
+            if len(dispatched) == expectedChanges:
+                changed.set()
+
+        events.subscribeClipboardChanged(onClipboardChanged)
+        ClipboardManagerWayland(
+            events, config, Mock(Logger), stubWlPaste
+        ).initializeClipboardWatch()
+
+        self.assertTrue(changed.wait(self._TIMEOUT))
+        # Wait for more changes, which should not come
+        time.sleep(0.3)
+
+        return dispatched
+
+    def _createStubWlPaste(
+        self, changes: list[tuple[float, str]], primaryUnsupported: bool = False
+    ) -> str:
+        """
+        :param changes: delay in seconds before the change, and content
+        """
+
+        path = os.path.join(self._directory.name, 'wl-paste')
+
+        with open(path, 'w') as file:
+            file.write(
+                self._STUB_WL_PASTE.format(
+                    python=sys.executable,
+                    primaryUnsupported=primaryUnsupported,
+                    changes=repr(changes),
+                )
+            )
+
+        os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+
+        return path
@@ -0,0 +1,52 @@
+import threading
+from unittest import TestCase
+from unittest.mock import Mock
+
+from src.Service.ClipboardWriter import ClipboardWriter
+from src.Service.Logger import Logger
+
+
+class TestClipboardWriter(TestCase):
+    _TIMEOUT: float = 5
+
+    def testWriteDoesNotBlock(self) -> None:
+        unblocked = threading.Event()
+        written: list[str] = []
+        completed: list[bool] = []
+        allCompleted = threading.Event()
+
+        def writeContent(content: str) -> None:
+            unblocked.wait(self._TIMEOUT)
+            written.append(content)
+
+        def onCompleted(succeeded: bool) -> None:
+            completed.append(succeeded)
+
+            if len(completed) == 2:
+                allCompleted.set()
+
+        writer = ClipboardWriter(writeContent, Mock(Logger))
+        writer.write('first', onCompleted)
+        writer.write('second', onCompleted)
+
+        self.assertEqual([], written)
+
+        unblocked.set()
+
+        self.assertTrue(allCompleted.wait(self._TIMEOUT))
+        self.assertEqual(['first', 'second'], written)
+        self.assertEqual([True, True], completed)
+
+    def testFailedWriteIsReported(self) -> None:
+        logger = Mock(Logger)
+        completed: list[bool] = []
+
+        def writeContent(content: str) -> None:
+            raise Exception('xsel exited with code 1')
+
+        ClipboardWriter(writeContent, logger).writeNow('content', completed.append)
+
+        self.assertEqual([False], completed)
+        logger.log.assert_called_once_with(
+            '[Clipboard] Could not set clipboard content: xsel exited with code 1'
+        )
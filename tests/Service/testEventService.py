@@ -0,0 +1,120 @@
+import threading
+from collections.abc import Callable
+from unittest import TestCase
+from unittest.mock import Mock
+
+from src.Constant.ThreadAffinity import ThreadAffinity
+from src.Service.EventService import EventService
+from src.Service.Logger import Logger
+
+
+class TestEventService(TestCase):
+    _TIMEOUT: float = 5
+
+    _logger: Logger
+    _events: EventService
+
+    def setUp(self) -> None:
+        self._logger = Mock(Logger)
+        self._events = EventService(self._logger)
+
+    def testDispatcherAffinityIsSynchronous(self) -> None:
+        threads: list[threading.Thread] = []
+        self._events.subscribeStatusbarClear(lambda: threads.append(threading.current_thread()))
+
+        self._events.dispatchStatusbarClear()
+
+        self.assertEqual([threading.current_thread()], threads)
+
+    def testWorkerDoesNotBlockDispatcher(self) -> None:
+        unblocked = threading.Event()
+        received: list[str | None] = []
+        allReceived = threading.Event()
+
+        def onClipboardChanged(content: str | None) -> None:
+            unblocked.wait(self._TIMEOUT)
+            received.append(content)
+
+            if len(received) == 2:
+                allReceived.set()
+
+        self._events.subscribeClipboardChanged(onClipboardChanged, ThreadAffinity.WORKER)
+        self._events.dispatchClipboardChanged('5 ft')
+        self._events.dispatchClipboardChanged('6 ft')
+
+        self.assertEqual([], received)
+
+        unblocked.set()
+
+        self.assertTrue(allReceived.wait(self._TIMEOUT))
+        self.assertEqual(['5 ft', '6 ft'], received)
+        self.assertEqual(0, self._events.getDroppedCount())
+
+    def testWorkerDropsOldestCallsWhenQueueIsFull(self) -> None:
+        started = threading.Event()
+        unblocked = threading.Event()
+        received: list[str | None] = []
+        lastReceived = threading.Event()
+
+        def onClipboardChanged(content: str | None) -> None:
+            started.set()
+            unblocked.wait(self._TIMEOUT)
+            received.append(content)
+
+            if content == 'last':
+                lastReceived.set()
+
+        self._events.subscribeClipboardChanged(onClipboardChanged, ThreadAffinity.WORKER)
+        self._events.dispatchClipboardChanged('first')
+        self.assertTrue(started.wait(self._TIMEOUT))
+
+        for index in range(EventService._WORKER_QUEUE_SIZE + 10):
+            self._events.dispatchClipboardChanged(str(index))
+
+        self._events.dispatchClipboardChanged('last')
+        unblocked.set()
+
+        self.assertTrue(lastReceived.wait(self._TIMEOUT))
+        self.assertEqual(11, self._events.getDroppedCount())
+        self.assertEqual(['first', '11'], received[:2])
+        self.assertEqual(EventService._WORKER_QUEUE_SIZE + 1, len(received))
+
+    def testWorkerContinuesAfterSubscriberException(self) -> None:
+        received: list[str | None] = []
+        lastReceived = threading.Event()
+
+        def onClipboardChanged(content: str | None) -> None:
+            if content == 'invalid':
+                raise Exception('Subscriber failed')
+
+            received.append(content)
+            lastReceived.set()
+
+        self._events.subscribeClipboardChanged(onClipboardChanged, ThreadAffinity.WORKER)
+        self._events.dispatchClipboardChanged('invalid')
+        self._events.dispatchClipboardChanged('5 ft')
+
+        self.assertTrue(lastReceived.wait(self._TIMEOUT))
+        self.assertEqual(['5 ft'], received)
+        self._logger.log.assert_called_once()
+        self.assertIn('Subscriber failed', self._logger.log.call_args.args[0])
+
+    def testUiAffinityUsesExecutor(self) -> None:
+        scheduled: list[Callable[[], None]] = []
+        received: list[str] = []
+        self._events.subscribeConverted(
+            lambda result: received.append(result),
+            ThreadAffinity.UI,  # type: ignore[arg-type]
+        )
+
+        # Synchronous until UI executor is set
+        self._events.dispatchConverted('before')  # type: ignore[arg-type]
+        self._events.setUiExecutor(scheduled.append)
+        self._events.dispatchConverted('after')  # type: ignore[arg-type]
+
+        self.assertEqual(['before'], received)
+        self.assertEqual(1, len(scheduled))
+
+        scheduled[0]()
+
+        self.assertEqual(['before', 'after'], received)
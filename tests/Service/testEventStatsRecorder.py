@@ -0,0 +1,85 @@
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import Mock
+
+from src.Constant.ThreadAffinity import ThreadAffinity
+from src.Service.EventService import EventService
+from src.Service.EventStatsRecorder import EventStatsRecorder
+from src.Service.Logger import Logger
+
+
+class Subscriber:
+    def onStatusbarClear(self) -> None:
+        time.sleep(0.002)
+
+    def onClipboardChanged(self, content: str | None) -> None:
+        pass
+
+
+class TestEventStatsRecorder(TestCase):
+    _TIMEOUT: float = 5
+
+    _events: EventService
+    _recorder: EventStatsRecorder
+
+    def setUp(self) -> None:
+        self._events = EventService(Mock(Logger))
+        self._recorder = EventStatsRecorder(Mock(Logger))
+
+    def testDispatchesAreRecordedPerEventAndSubscriber(self) -> None:
+        subscriber = Subscriber()
+        self._events.subscribeStatusbarClear(subscriber.onStatusbarClear)
+        self._events.setStatsRecorder(self._recorder)
+
+        for _ in range(3):
+            self._events.dispatchStatusbarClear()
+
+        report = self._recorder.getReport().split('\n')
+
+        self.assertEqual(2, len(report))
+        self.assertRegex(report[0], r'^statusbar_clear: 3 calls, p50 \d+\.\d{3} ms, ')
+        self.assertRegex(report[1], r'^  Subscriber\.onStatusbarClear: 3 calls, ')
+
+        durationMs = float(report[1].split('p50 ')[1].split(' ms')[0])
+        self.assertGreaterEqual(durationMs, 2)
+
+    def testWorkerCallsAreRecorded(self) -> None:
+        subscriber = Subscriber()
+        received = threading.Event()
+        self._events.setStatsRecorder(self._recorder)
+        self._events.subscribeClipboardChanged(subscriber.onClipboardChanged, ThreadAffinity.WORKER)
+        self._events.subscribeClipboardChanged(
+            lambda content: received.set(), ThreadAffinity.WORKER
+        )
+
+        self._events.dispatchClipboardChanged('5 ft')
+        self.assertTrue(received.wait(self._TIMEOUT))
+        # Worker records the call after it returns
+        time.sleep(0.1)
+
+        report = self._recorder.getReport()
+
+        self.assertIn(
+            '  EventService._callInWorker(Subscriber.onClipboardChanged): 1 calls', report
+        )
+        self.assertIn('  Subscriber.onClipboardChanged: 1 calls', report)
+        self.assertIn('\nworker_queue:\n', report)
+
+    def testNothingIsRecordedWhenDisabled(self) -> None:
+        self._events.setStatsRecorder(self._recorder)
+        self._events.subscribeStatusbarClear(lambda: None)
+        self._events.setStatsRecorder(None)
+
+        self._events.dispatchStatusbarClear()
+
+        self.assertEqual('No events dispatched yet', self._recorder.getReport())
+
+    def testOnlyLastSamplesAreKept(self) -> None:
+        for duration in range(1000):
+            self._recorder.record('converted', None, duration * 1_000_000)
+
+        self.assertEqual(
+            'converted: 1000 calls, p50 872.000 ms, p90 974.000 ms, p99 997.000 ms, max 999.000 ms',
+            self._recorder.getReport(),
+        )
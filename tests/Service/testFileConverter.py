@@ -0,0 +1,51 @@
+import io
+import os
+import tempfile
+from unittest.mock import Mock, patch
+
+from parameterized import parameterized
+
+from src.Service.ArgumentParser import ArgumentParser
+from src.Service.Conversion.ConversionManager import ConversionManager
+from src.Service.Conversion.Unit.Currency.ConversionRateUpdater import ConversionRateUpdater
+from src.Service.FileConverter import FileConverter
+from src.Service.HeadlessApp import HeadlessApp
+from src.Service.Logger import Logger
+from tests.Service.Conversion.AbstractConversionManagerTest import AbstractConversionManagerTest
+
+
+class TestFileConverter(AbstractConversionManagerTest):
+    @parameterized.expand(
+        [
+            ('Trailing newline', b'15 ft\nRandom text\n\n-4.5 lbs\r\n212 \xc2\xb0F\n'),
+            ('No trailing newline', b'15 ft\nRandom text\n\n-4.5 lbs\r\n212 \xc2\xb0F'),
+            ('Single line', b'15 ft'),
+            ('Empty file', b''),
+        ]
+    )
+    @patch.object(FileConverter, '_CHUNK_SIZE', 4)
+    def testConvertFile(self, _: str, content: bytes) -> None:
+        headlessApp = HeadlessApp(
+            self.setupServices()[ConversionManager], Mock(ConversionRateUpdater), Mock(Logger)
+        )
+        fileConverter = FileConverter(
+            headlessApp, Mock(ConversionRateUpdater), Mock(ArgumentParser), Mock(Logger)
+        )
+
+        with tempfile.NamedTemporaryFile(delete=False) as file:
+            file.write(content)
+
+        try:
+            self.assertLessEqual(
+                len(fileConverter._splitChunks(file.name)), max(content.count(b'\n') + 1, 1)
+            )
+
+            output = io.StringIO()
+            fileConverter.convertFile(file.name, output, 1)
+        finally:
+            os.remove(file.name)
+
+        expectOutput = io.StringIO()
+        headlessApp.run(io.BytesIO(content), expectOutput)
+
+        self.assertEqual(expectOutput.getvalue(), output.getvalue())
@@ -0,0 +1,61 @@
+import io
+import json
+import os
+from unittest.mock import Mock
+
+from src.Service.Conversion.ConversionManager import ConversionManager
+from src.Service.Conversion.Unit.Currency.ConversionRateUpdater import ConversionRateUpdater
+from src.Service.HeadlessApp import HeadlessApp
+from src.Service.Logger import Logger
+from tests.Service.Conversion.AbstractConversionManagerTest import AbstractConversionManagerTest
+
+
+class TestHeadlessApp(AbstractConversionManagerTest):
+    def testRun(self) -> None:
+        conversionRateUpdater = Mock(ConversionRateUpdater)
+        headlessApp = HeadlessApp(
+            self.setupServices()[ConversionManager], conversionRateUpdater, Mock(Logger)
+        )
+        output = io.StringIO()
+
+        headlessApp.run(io.BytesIO('15 ft\nRandom text\n\n  -4.5 lbs  \r\n212 °F'.encode()), output)
+
+        lines = output.getvalue().splitlines()
+
+        conversionRateUpdater.initializeRates.assert_called_once()
+        self.assertEqual(5, len(lines))
+        self.assertEqual(
+            {
+                'iconText': '15 ft  =  4.57 m',
+                'originalText': '15 ft',
+                'convertedText': '4.57 m',
+                'converterName': 'Simple.Dist',
+            },
+            json.loads(lines[0]),
+        )
+        self.assertEqual('null', lines[1])
+        self.assertEqual('null', lines[2])
+        self.assertEqual('-2.04 kg', json.loads(lines[3])['convertedText'])
+        self.assertEqual('212 °F  =  100 °C', json.loads(lines[4])['iconText'])
+        # Events are not dispatched, so statusbar would not be affected
+        self.assertConvertResult(False)
+
+    def testRunUnbufferedInput(self) -> None:
+        headlessApp = HeadlessApp(
+            self.setupServices()[ConversionManager], Mock(ConversionRateUpdater), Mock(Logger)
+        )
+        output = io.StringIO()
+        readFd, writeFd = os.pipe()
+
+        with open(writeFd, 'wb') as writer:
+            writer.write('15 ft\nRandom text\n212 °F'.encode())
+
+        with open(readFd, 'rb', buffering=0) as inputStream:
+            headlessApp.run(inputStream, output)
+
+        lines = output.getvalue().splitlines()
+
+        self.assertEqual(3, len(lines))
+        self.assertEqual('4.57 m', json.loads(lines[0])['convertedText'])
+        self.assertEqual('null', lines[1])
+        self.assertEqual('100 °C', json.loads(lines[2])['convertedText'])
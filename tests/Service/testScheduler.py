@@ -0,0 +1,99 @@
+import threading
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from src.Service.Logger import Logger
+from src.Service.Scheduler import Scheduler
+
+
+@patch('time.time', return_value=1000.0)
+class TestScheduler(TestCase):
+    _logger: Logger
+    _scheduler: Scheduler
+    _calls: list[str]
+
+    def setUp(self) -> None:
+        self._logger = Mock(Logger)
+        self._scheduler = Scheduler(self._logger)
+        self._calls = []
+
+    def testJobsRunInDeadlineOrder(self, timeMock) -> None:
+        self._scheduler.scheduleOnce(20, lambda: self._calls.append('20'))
+        self._scheduler.scheduleOnce(10, lambda: self._calls.append('10 first'))
+        self._scheduler.scheduleOnce(10, lambda: self._calls.append('10 second'))
+
+        self.assertEqual(10, self._scheduler.runDueJobs())
+        self.assertEqual([], self._calls)
+
+        timeMock.return_value += 15
+
+        self.assertEqual(5, self._scheduler.runDueJobs())
+        self.assertEqual(['10 first', '10 second'], self._calls)
+
+        timeMock.return_value += 5
+
+        self.assertIsNone(self._scheduler.runDueJobs())
+        self.assertEqual(['10 first', '10 second', '20'], self._calls)
+
+    def testPeriodicJobIsRescheduled(self, timeMock) -> None:
+        self._scheduler.schedulePeriodic(10, lambda: self._calls.append('periodic'), 0)
+
+        self.assertEqual(10, self._scheduler.runDueJobs())
+
+        # Runs missed while asleep are not repeated
+        timeMock.return_value += 35
+
+        self.assertEqual(10, self._scheduler.runDueJobs())
+        self.assertEqual(['periodic', 'periodic'], self._calls)
+
+    def testCancelledJobDoesNotRun(self, timeMock) -> None:
+        job = self._scheduler.scheduleOnce(10, lambda: self._calls.append('cancelled'))
+        self._scheduler.scheduleOnce(20, lambda: self._calls.append('kept'))
+        self._scheduler.cancel(job)
+        self._scheduler.cancel(None)
+
+        self.assertEqual(20, self._scheduler.runDueJobs())
+
+        timeMock.return_value += 20
+        self._scheduler.runDueJobs()
+
+        self.assertEqual(['kept'], self._calls)
+
+    def testFailedJobDoesNotStopOthers(self, timeMock) -> None:
+        def failingJob() -> None:
+            raise Exception('Job failed')
+
+        self._scheduler.scheduleOnce(0, failingJob)
+        self._scheduler.scheduleOnce(0, lambda: self._calls.append('next'))
+        self._scheduler.runDueJobs()
+
+        self.assertEqual(['next'], self._calls)
+        self._logger.log.assert_called_once()
+
+    def testRunWakesUpForEarlierJob(self, timeMock) -> None:
+        ran = threading.Event()
+        self._scheduler.scheduleOnce(1000, lambda: None)
+        threading.Thread(target=self._scheduler.run, daemon=True).start()
+
+        self._scheduler.scheduleOnce(0, ran.set)
+
+        self.assertTrue(ran.wait(5))
+
+    def testRunDoesNotMissJobScheduledBeforeWait(self, timeMock) -> None:
+        ran = threading.Event()
+        self._scheduler.scheduleOnce(1000, lambda: None)
+        runDueJobs = self._scheduler.runDueJobs
+
+        def runDueJobsThenSchedule() -> float | None:
+            timeout = runDueJobs()
+
+            # Scheduled after due jobs were run, but before the run loop waits
+            if not ran.is_set():
+                self._scheduler.scheduleOnce(0, ran.set)
+
+            return timeout
+
+        self._scheduler.runDueJobs = runDueJobsThenSchedule  # type: ignore[method-assign]
+        threading.Thread(target=self._scheduler.run, daemon=True).start()
+
+        self.assertTrue(ran.wait(5))
@@ -0,0 +1,62 @@
+import os
+import sys
+import tempfile
+import time
+from unittest import TestCase
+
+from src.Service.OSSwitch import OSSwitch
+from src.Service.StartupProfiler import StartupProfiler
+
+
+class TestStartupProfiler(TestCase):
+    _MODULE_NAME: str = 'startup_profiler_test_module'
+    _SLEPT: str = r'(2\d|[3-9]\d|\d{3,})\.\d ms'
+    """Duration of at least 20 ms sleep, in the report"""
+
+    _moduleDir: tempfile.TemporaryDirectory
+    _profiler: StartupProfiler
+
+    def setUp(self) -> None:
+        self._moduleDir = tempfile.TemporaryDirectory()
+
+        with open(os.path.join(self._moduleDir.name, self._MODULE_NAME + '.py'), 'w') as file:
+            file.write('import time\n\ntime.sleep(0.02)\n')
+
+        sys.path.insert(0, self._moduleDir.name)
+        self._profiler = StartupProfiler(OSSwitch())
+        self._profiler.start()
+
+    def tearDown(self) -> None:
+        self._profiler.stop()
+        sys.path.remove(self._moduleDir.name)
+        sys.modules.pop(self._MODULE_NAME, None)
+        self._moduleDir.cleanup()
+
+    def testServiceImportsAreSeparatedFromConstruction(self) -> None:
+        def buildParent() -> str:
+            __import__(self._MODULE_NAME)
+            self._profiler.measureService('Child', lambda: time.sleep(0.02))
+            time.sleep(0.02)
+
+            return 'parent'
+
+        self.assertEqual('parent', self._profiler.measureService('Parent', buildParent))
+
+        self._profiler.stop()
+        lines = self._profiler.getReport().split('\n')
+
+        self.assertRegex(
+            lines[0], r'^Startup profile, [\d.]+ ms since the profiler start, peak RSS'
+        )
+        self.assertEqual('Services, import / construction time:', lines[2])
+        self.assertRegex(lines[3], rf'^  Parent: {self._SLEPT} / {self._SLEPT}$')
+        self.assertRegex(lines[4], rf'^    Child: 0\.0 ms / {self._SLEPT}$')
+        self.assertEqual('Slowest imports, self / cumulative time:', lines[5])
+        self.assertRegex(lines[6], rf'^  {self._MODULE_NAME}: {self._SLEPT} / {self._SLEPT}$')
+
+    def testImportedModuleStillWorks(self) -> None:
+        module = __import__(self._MODULE_NAME)
+
+        self.assertEqual(self._MODULE_NAME, module.__name__)
+        self.assertTrue(module.__file__.endswith(self._MODULE_NAME + '.py'))
+        self.assertEqual(1, module.__loader__.get_source(self._MODULE_NAME).count('sleep'))
@@ -0,0 +1,138 @@
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Callable
+from unittest import TestCase
+from unittest.mock import Mock
+
+from src.DTO.ConvertResult import ConvertResult
+from src.DTO.StatusbarUpdate import StatusbarUpdate
+from src.Service.EventService import EventService
+from src.Service.Logger import Logger
+from src.Service.StatusbarUpdateBatcher import StatusbarUpdateBatcher
+
+
+class FakeMainLoop:
+    """Runs scheduled functions one by one in its own thread, like GLib.timeout_add"""
+
+    _calls: list[tuple[float, int, Callable[[], bool]]]
+    _condition: threading.Condition
+    _sequence: itertools.count
+    _stopped: bool
+
+    def __init__(self):
+        self._calls = []
+        self._condition = threading.Condition()
+        self._sequence = itertools.count()
+        self._stopped = False
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def timeoutAdd(self, interval: int, function: Callable[[], bool]) -> int:
+        with self._condition:
+            heapq.heappush(
+                self._calls,
+                (time.monotonic() + interval / 1000, next(self._sequence), function),
+            )
+            self._condition.notify()
+
+        return 1
+
+    def stop(self) -> None:
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._stopped and (
+                    len(self._calls) == 0 or self._calls[0][0] > time.monotonic()
+                ):
+                    timeout = (
+                        None if len(self._calls) == 0 else self._calls[0][0] - time.monotonic()
+                    )
+                    self._condition.wait(timeout)
+
+                if self._stopped:
+                    return
+
+                _, _, function = heapq.heappop(self._calls)
+
+            if function():
+                raise Exception('Function must not be repeated')
+
+
+class TestStatusbarUpdateBatcher(TestCase):
+    _TIMEOUT: float = 5
+    _UI_UPDATE_TIME: float = 0.02
+    """Seconds, how long each UI change blocks the main loop"""
+
+    _loop: FakeMainLoop
+    _events: EventService
+    _iconTexts: list[str]
+    _menuTexts: list[str]
+
+    def setUp(self) -> None:
+        self._loop = FakeMainLoop()
+        self._events = EventService(Mock(Logger))
+        self._iconTexts = []
+        self._menuTexts = []
+
+        batcher = StatusbarUpdateBatcher(self._loop.timeoutAdd, self._applyIcon, self._applyMenu)
+        self._events.subscribeConverted(batcher.showConverted)
+        self._events.subscribeStatusbarClear(batcher.clear)
+
+    def tearDown(self) -> None:
+        self._loop.stop()
+
+    def testDispatchDoesNotWaitForUi(self) -> None:
+        dispatchTimes = []
+
+        for i in range(50):
+            start = time.perf_counter()
+            self._events.dispatchConverted(self._createResult(i))
+            dispatchTimes.append(time.perf_counter() - start)
+
+        self._waitUntilMenuApplied('49.00 m')
+
+        # Applying a single update takes 2 UI changes and the menu update delay
+        self.assertLess(max(dispatchTimes), self._UI_UPDATE_TIME)
+        # Superseded updates are skipped
+        self.assertLess(len(self._iconTexts), 5)
+        self.assertEqual('49 m', self._iconTexts[-1])
+
+    def testMenuIsUpdatedAfterIcon(self) -> None:
+        self._events.dispatchConverted(self._createResult(5))
+        self._waitUntilMenuApplied('5.00 m')
+
+        self.assertEqual(['5 m'], self._iconTexts)
+        self.assertEqual(['5.00 m'], self._menuTexts)
+
+    def testClearKeepsPendingMenuUpdate(self) -> None:
+        self._events.dispatchConverted(self._createResult(1))
+        self._events.dispatchConverted(self._createResult(2))
+        self._events.dispatchStatusbarClear()
+
+        self._waitUntilMenuApplied('2.00 m')
+
+        self.assertEqual('', self._iconTexts[-1])
+
+    def _applyIcon(self, update: StatusbarUpdate) -> None:
+        time.sleep(self._UI_UPDATE_TIME)
+        self._iconTexts.append(update.iconText)
+
+    def _applyMenu(self, result: ConvertResult) -> None:
+        time.sleep(self._UI_UPDATE_TIME)
+        self._menuTexts.append(result.convertedText)
+
+    def _waitUntilMenuApplied(self, menuText: str) -> None:
+        deadline = time.monotonic() + self._TIMEOUT
+
+        while len(self._menuTexts) == 0 or self._menuTexts[-1] != menuText:
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.01)
+
+    @staticmethod
+    def _createResult(number: int) -> ConvertResult:
+        return ConvertResult(f'{number} m', f'{number} ft', f'{number}.00 m', 'distance')
@@ -0,0 +1,55 @@
+import os
+import stat
+import sys
+import tempfile
+import time
+import tracemalloc
+from unittest import TestCase
+
+from src.Service.SubprocessReader import SubprocessReader
+
+
+class TestSubprocessReader(TestCase):
+    _FAKE_XSEL: str = (
+        '#!{python}\n'
+        'import sys\n'
+        'chunk = b"a" * 1024 * 1024\n'
+        'for _ in range({megabytes}):\n'
+        '    sys.stdout.buffer.write(chunk)\n'
+    )
+
+    def testReadOutputStopsHugeOutput(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            fakeXsel = self._createFakeXsel(directory, 500)
+
+            tracemalloc.start()
+            startedAt = time.monotonic()
+
+            try:
+                output = SubprocessReader.readOutput([fakeXsel, '-o'], 401)
+                _, peakMemory = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+        self.assertEqual(b'a' * 401, output)
+        # Reading all 500 MB would take much longer and use as much memory
+        self.assertLess(time.monotonic() - startedAt, 5)
+        self.assertLess(peakMemory, 1024 * 1024)
+
+    def testReadOutputShorterThanLimit(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            fakeXsel = self._createFakeXsel(directory, 1)
+
+            output = SubprocessReader.readOutput([fakeXsel, '-o'], 2 * 1024 * 1024)
+
+        self.assertEqual(1024 * 1024, len(output))
+
+    def _createFakeXsel(self, directory: str, megabytes: int) -> str:
+        path = os.path.join(directory, 'xsel')
+
+        with open(path, 'w') as file:
+            file.write(self._FAKE_XSEL.format(python=sys.executable, megabytes=megabytes))
+
+        os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+
+        return path
@@ -0,0 +1,117 @@
+import json
+from unittest.mock import MagicMock, Mock
+
+from src.Constant.AmbiguousSeparator import AmbiguousSeparator
+from src.Constant.ConfigId import ConfigId
+from src.DTO.ServiceContainer import ServiceContainer
+from src.Service.ArgumentParser import ArgumentParser
+from src.Service.Conversion.ConversionManager import ConversionManager
+from src.Service.Conversion.Timestamp.TimestampTextFormatter import TimestampTextFormatter
+from src.Service.Conversion.Unit.Currency.CurrencyConverter import CurrencyConverter
+from src.Service.Debug import Debug
+from src.Service.EventService import EventService
+from src.Service.Logger import Logger
+from src.Service.OSSwitch import OSSwitch
+from src.Service.Scheduler import Scheduler
+from src.Service.ServiceBuilder import ServiceBuilder
+from tests.TestUtil.MockLibrary import MockLibrary
+from tests.TestUtil.TestsFilesystemHelper import TestsFilesystemHelper
+from tests.TestUtil.Types import ConfigurationsList
+
+
+class ConversionServicesBuilder:
+    """
+    Builds conversion services with mocked configuration and currency rates loaded from the mock
+    response. Shared by conversion tests and benchmarks.
+    """
+
+    @staticmethod
+    def build(
+        events: EventService,
+        configOverrides: ConfigurationsList | None = None,
+        stages: ServiceContainer | None = None,
+    ) -> ServiceContainer:
+        """
+        :param stages: see ServiceBuilder.getConversionManager
+        """
+
+        configDefault = [
+            (ConfigId.ClearOnChange, False),
+            (ConfigId.Converter_AmbiguousSeparator, AmbiguousSeparator.THOUSANDS),
+            (ConfigId.ClearAfterTime, 0),
+            (ConfigId.Debug, False),
+            (ConfigId.Converter_Extraction_Enabled, False),
+            (ConfigId.Converter_Currency_Enabled, True),
+            (ConfigId.Converter_Currency_PrimaryCurrency, 'eur'),
+            (ConfigId.Converter_Currency_RatesUrl, ''),
+            (ConfigId.Converter_Distance_Enabled, True),
+            (ConfigId.Converter_Distance_PrimaryUnit_Metric, True),
+            (ConfigId.Converter_Temperature_Enabled, True),
+            (ConfigId.Converter_Temperature_PrimaryUnit_Celsius, True),
+            (ConfigId.Converter_Timestamp_Enabled, True),
+            (ConfigId.Converter_Timestamp_IconFormat, {'default': ''}),
+            (ConfigId.Converter_Timestamp_Menu_LastConversion_OriginalText, '{ts_ms_sep}'),
+            (ConfigId.Converter_Timestamp_Menu_LastConversion_ConvertedText, '{ts_ms_sep}'),
+            (ConfigId.Converter_Volume_Enabled, True),
+            (ConfigId.Converter_Volume_PrimaryUnit_Metric, True),
+            (ConfigId.Converter_Weight_Enabled, True),
+            (ConfigId.Converter_Weight_PrimaryUnit_Metric, True),
+        ]
+
+        argParserMock = MagicMock(ArgumentParser)
+        argParserMock.isDebugEnabled.return_value = False
+        argParserMock.getMockUpdate.return_value = None
+        argParserMock.getCurrencyRatesUrl.return_value = None
+
+        configMock = MockLibrary.getConfig(configDefault, configOverrides)
+        loggerMock = Mock(Logger)
+        debugMock = Debug(configMock, argParserMock)
+        filesystemHelperMock = MockLibrary.getFilesystemHelper()
+        osSwitch = OSSwitch()
+        timestampTextFormatter = TimestampTextFormatter(configMock)
+
+        container = ServiceContainer()
+        container[Scheduler] = scheduler = Scheduler(loggerMock)
+
+        container[ConversionManager] = ServiceBuilder().getConversionManager(
+            container,
+            filesystemHelperMock,
+            timestampTextFormatter,
+            argParserMock,
+            configMock,
+            loggerMock,
+            osSwitch,
+            events,
+            scheduler,
+            debugMock,
+            stages,
+        )
+
+        currencyConverter: CurrencyConverter = container[CurrencyConverter]  # type: ignore[assignment]
+        currencyConverter.refreshUnits(ConversionServicesBuilder.loadMockCurrencies())
+
+        return container
+
+    @staticmethod
+    def buildStages(events: EventService) -> ServiceContainer:
+        """
+        Same services as build, with each conversion stage in the container, for the per-stage
+        benchmark. App container doesn't have them
+        """
+
+        stages = ServiceContainer()
+        container = ConversionServicesBuilder.build(events, stages=stages)
+        stages[ConversionManager] = container[ConversionManager]
+
+        return stages
+
+    @staticmethod
+    def loadMockCurrencies() -> dict:
+        testsFilesystemHelper = TestsFilesystemHelper()
+
+        with open(
+            testsFilesystemHelper.getProjectDir() + '/assets_dev/rates_response_mock.json', 'r'
+        ) as ratesFile:
+            ratesText = ratesFile.read()
+
+        return json.loads(ratesText)['currencies']